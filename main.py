@@ -161,10 +161,10 @@ def main():
 
     # Override config based on arguments
     if args.no_monitor:
-        assistant.config._config['imessage']['enabled'] = False
+        assistant.config.set('imessage.enabled', False)
 
     if args.no_scheduler:
-        assistant.config._config['automation']['enabled'] = False
+        assistant.config.set('automation.enabled', False)
 
     # Run assistant
     assistant.run()
@@ -1,5 +1,6 @@
 """Automated workflows for personal assistant."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
@@ -86,6 +87,26 @@ class WorkflowEngine:
             send_via_imessage: Whether to send via iMessage
             recipient: iMessage recipient (required if send_via_imessage=True)
 
+        Returns:
+            Briefing text
+        """
+        # Short-lived pool for the sections that overlap the others
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            return self._daily_briefing(executor, send_via_imessage, recipient)
+
+    def _daily_briefing(
+        self,
+        executor: ThreadPoolExecutor,
+        send_via_imessage: bool,
+        recipient: Optional[str]
+    ) -> str:
+        """Generate the daily briefing, running slow lookups on an executor.
+
+        Args:
+            executor: Pool for the meal and task lookups
+            send_via_imessage: Whether to send via iMessage
+            recipient: iMessage recipient (required if send_via_imessage=True)
+
         Returns:
             Briefing text
         """
@@ -100,6 +121,16 @@ class WorkflowEngine:
 
         briefing_parts = [f"Hello {greeting_name}!"]
 
+        # Start the Notion meal lookup and TickTick task query now so they
+        # overlap the other sections
+        meals_future = None
+        if self.meal_planning:
+            meals_future = executor.submit(self.meal_planning.get_todays_meals)
+
+        tasks_future = None
+        if self.ticktick and self.ticktick.is_available():
+            tasks_future = executor.submit(self.ticktick.get_briefing_tasks)
+
         # Weather section
         try:
             from ..integrations.weather import WeatherIntegration
@@ -324,9 +355,9 @@ class WorkflowEngine:
 
         # Meals section
         briefing_parts.append("\n🍽️ Meals:")
-        if self.meal_planning:
+        if meals_future:
             try:
-                todays_meals = self.meal_planning.get_todays_meals()
+                todays_meals = meals_future.result()
                 if todays_meals:
                     for meal in todays_meals:
                         meal_summary = self.meal_planning.format_meal_summary(meal)
@@ -340,10 +371,9 @@ class WorkflowEngine:
             briefing_parts.append("  (Configure meal planning database)")
 
         # Tasks section - show individual tasks with inline status
-        if self.ticktick and self.ticktick.is_available():
+        if tasks_future:
             try:
-                today_tasks = self.ticktick.get_today_tasks()
-                overdue_tasks = self.ticktick.get_overdue_tasks()
+                today_tasks, overdue_tasks, _ = tasks_future.result()
 
                 briefing_parts.append("\n✅ Tasks:")
 
@@ -1,5 +1,6 @@
 """ICS calendar integration for Outlook/Office 365 calendars."""
 
+import re
 import requests
 from typing import List, Dict, Any, Optional
 from datetime import datetime, date, timedelta
@@ -10,6 +11,73 @@ from ..utils.config import get_config
 from ..utils.logger import get_logger
 
 
+# Raw VEVENT blocks and the properties needed to bound them in time
+_VEVENT_RE = re.compile(rb'BEGIN:VEVENT\r?\n.*?END:VEVENT\r?\n?', re.DOTALL)
+_FOLDED_LINE_RE = re.compile(rb'\r?\n[ \t]')
+_DTSTART_RE = re.compile(rb'^DTSTART[^:\r\n]*:(\d{8})', re.MULTILINE)
+_DTEND_RE = re.compile(rb'^DTEND[^:\r\n]*:(\d{8})', re.MULTILINE)
+_RRULE_RE = re.compile(rb'^RRULE[^:\r\n]*:([^\r\n]*)', re.MULTILINE)
+_UNTIL_RE = re.compile(rb'UNTIL=(\d{8})')
+_ALWAYS_KEEP_RE = re.compile(rb'^(?:RECURRENCE-ID|RDATE|DURATION)[;:]', re.MULTILINE)
+
+# Slack for timezone offsets, since only the date part of DTSTART is read
+_WINDOW_MARGIN = timedelta(days=1)
+
+
+def _parse_ics_date(value: bytes) -> Optional[date]:
+    """Parse the YYYYMMDD prefix of an ICS date value."""
+    try:
+        return date(int(value[:4]), int(value[4:6]), int(value[6:8]))
+    except ValueError:
+        return None
+
+
+def _vevent_may_overlap(block: bytes, start_date: date, end_date: date) -> bool:
+    """Cheaply decide whether a raw VEVENT could occur within a date window.
+
+    Only DTSTART, DTEND and RRULE UNTIL are inspected. Anything that cannot
+    be bounded this way (overrides, RDATE, DURATION, unparsable dates) is
+    kept, so the check never drops an event that would have matched.
+
+    Args:
+        block: Raw VEVENT text
+        start_date: First day of the window
+        end_date: Last day of the window
+
+    Returns:
+        False only if the event certainly falls outside the window
+    """
+    block = _FOLDED_LINE_RE.sub(b'', block)
+
+    if _ALWAYS_KEEP_RE.search(block):
+        return True
+
+    match = _DTSTART_RE.search(block)
+    dtstart = _parse_ics_date(match.group(1)) if match else None
+    if dtstart is None:
+        return True
+
+    # Starts after the window (recurrences only move forward from DTSTART)
+    if dtstart > end_date + _WINDOW_MARGIN:
+        return False
+
+    rrule = _RRULE_RE.search(block)
+    if rrule:
+        until = _UNTIL_RE.search(rrule.group(1))
+        if until:
+            until_date = _parse_ics_date(until.group(1))
+            if until_date and until_date < start_date - _WINDOW_MARGIN:
+                return False
+        return True
+
+    match = _DTEND_RE.search(block)
+    dtend = _parse_ics_date(match.group(1)) if match else dtstart
+    if dtend is None:
+        return True
+
+    return dtend >= start_date - _WINDOW_MARGIN
+
+
 class ICSCalendarIntegration:
     """Handles ICS calendar feeds from Outlook/Office 365."""
 
@@ -28,9 +96,21 @@ class ICSCalendarIntegration:
 
         self.ics_url = ics_url
 
-    def fetch_calendar(self) -> Optional[Calendar]:
+    def fetch_calendar(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Optional[Calendar]:
         """Fetch ICS calendar from URL.
 
+        When a date window is given, VEVENTs that certainly fall outside it
+        are dropped from the raw feed before parsing, so only the relevant
+        events go through the full icalendar parser.
+
+        Args:
+            start_date: Optional first day of interest
+            end_date: Optional last day of interest
+
         Returns:
             Calendar object or None if fetch fails
         """
@@ -38,7 +118,14 @@ class ICSCalendarIntegration:
             response = requests.get(self.ics_url, timeout=10)
             response.raise_for_status()
 
-            calendar = Calendar.from_ical(response.content)
+            content = response.content
+            if start_date and end_date:
+                content = _VEVENT_RE.sub(
+                    lambda m: m.group(0) if _vevent_may_overlap(m.group(0), start_date, end_date) else b'',
+                    content
+                )
+
+            calendar = Calendar.from_ical(content)
             self.logger.info(f"Fetched ICS calendar from {self.ics_url}")
             return calendar
 
@@ -55,7 +142,7 @@ class ICSCalendarIntegration:
         Returns:
             List of event dictionaries
         """
-        calendar = self.fetch_calendar()
+        calendar = self.fetch_calendar(target_date, target_date)
         if not calendar:
             return []
 
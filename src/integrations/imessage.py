@@ -1,15 +1,449 @@
 """iMessage integration for personal assistant."""
 
+import json
 import os
+import queue
 import sqlite3
 import subprocess
-from typing import List, Dict, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Iterator, List, Dict, Optional, Tuple, Union
 from datetime import datetime, timedelta
 from pathlib import Path
 
 from ..utils.config import get_config
 from ..utils.logger import get_logger
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to per-row conversion
+    np = None
+
+try:
+    from Foundation import NSAppleScript
+except ImportError:  # pyobjc is optional; fall back to an osascript process
+    NSAppleScript = None
+
+
+# Messages.app stores dates as nanoseconds since 2001-01-01
+_APPLE_EPOCH = datetime(2001, 1, 1)
+
+# Below this many rows, per-row datetime conversion beats NumPy setup cost
+_VECTORIZE_MIN_ROWS = 64
+
+# Rows pulled per fetchmany() when streaming query results
+_FETCH_BATCH_SIZE = 256
+
+# Upper bound on how much of chat.db SQLite may memory-map (1 GiB)
+_MMAP_SIZE = 1 << 30
+
+# Applied once per pooled connection; tuned for large read-only scans
+_READ_PRAGMAS = (
+    "PRAGMA query_only=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-262144",  # 256 MiB page cache
+    f"PRAGMA mmap_size={_MMAP_SIZE}",  # read pages via mmap, not read()
+)
+
+# Seconds a get_chats() result is served without touching the database
+_CHATS_CACHE_TTL = 30
+
+# Sidecar database holding per-chat message counts and last activity, kept
+# in sync incrementally from messages above a stored ROWID watermark.
+# sync_state holds values seen at the last sync that reveal changes the
+# watermark alone cannot see, such as the chat_message_join row count,
+# which drops when messages are deleted.
+_CACHE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS chat_summary (
+        chat_id INTEGER PRIMARY KEY,
+        message_count INTEGER NOT NULL,
+        last_date INTEGER
+    );
+    CREATE TABLE IF NOT EXISTS watermarks (
+        name TEXT PRIMARY KEY,
+        source TEXT NOT NULL,
+        last_sync_rowid INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS sync_state (
+        name TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    );
+"""
+
+# Contentless trigram index: MATCH on a quoted phrase is a case-insensitive
+# substring test, the same question LIKE '%keyword%' asks, without a scan
+_SEARCH_INDEX_SCHEMA = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS message_fts
+    USING fts5(text, content='', tokenize='trigram');
+"""
+
+_SEARCH_INDEX_DELTA = """
+    SELECT ROWID, text FROM message
+    WHERE ROWID > ? AND text IS NOT NULL
+"""
+
+# Trigram matching needs at least this many characters
+_SEARCH_INDEX_MIN_LENGTH = 3
+
+# Latest edit or unsend time (chat.db on macOS 13 and later). Either one
+# changes message.text in place, below the watermark, so the index is
+# rebuilt when this moves.
+_MESSAGE_EDIT_STAMP = "SELECT MAX(date_edited), MAX(date_retracted) FROM message"
+
+_CHAT_SUMMARY_DELTA = """
+    SELECT
+        chat_message_join.chat_id,
+        COUNT(*),
+        MAX(message.date)
+    FROM chat_message_join
+    JOIN message ON chat_message_join.message_id = message.ROWID
+    WHERE message.ROWID > ?
+    GROUP BY chat_message_join.chat_id
+"""
+
+# Full rebuild: per-chat correlated subqueries let SQLite walk the
+# chat_message_join index for each chat instead of grouping every message
+_CHAT_SUMMARY_FULL = """
+    SELECT
+        chat.ROWID,
+        (
+            SELECT COUNT(*)
+            FROM chat_message_join
+            JOIN message ON chat_message_join.message_id = message.ROWID
+            WHERE chat_message_join.chat_id = chat.ROWID
+        ),
+        (
+            SELECT MAX(message.date)
+            FROM chat_message_join
+            JOIN message ON chat_message_join.message_id = message.ROWID
+            WHERE chat_message_join.chat_id = chat.ROWID
+        )
+    FROM chat
+"""
+
+_CHAT_JOIN_COUNT = "SELECT COUNT(*) FROM chat_message_join"
+
+_CHAT_SUMMARY_UPSERT = """
+    INSERT INTO chat_summary (chat_id, message_count, last_date) VALUES (?, ?, ?)
+    ON CONFLICT(chat_id) DO UPDATE SET
+        message_count = message_count + excluded.message_count,
+        last_date = MAX(COALESCE(last_date, 0), excluded.last_date)
+"""
+
+
+_RECENT_MESSAGES_BASE = """
+    SELECT
+        message.ROWID as id,
+        message.guid,
+        message.text,
+        message.handle_id,
+        message.service,
+        message.date,
+        message.date_read,
+        message.date_delivered,
+        message.is_from_me,
+        message.is_read,
+        message.cache_has_attachments,
+        handle.id as sender,
+        chat.chat_identifier,
+        chat.display_name as chat_name,
+        chat.ROWID as chat_rowid
+    FROM message
+    LEFT JOIN handle ON message.handle_id = handle.ROWID
+    LEFT JOIN chat_message_join ON message.ROWID = chat_message_join.message_id
+    LEFT JOIN chat ON chat_message_join.chat_id = chat.ROWID
+    WHERE message.text IS NOT NULL
+"""
+
+_RECENT_MESSAGES_ORDER = " ORDER BY message.date DESC LIMIT ?"
+
+# get_recent_messages query variants keyed by (has since filter, has chat filter)
+_RECENT_MESSAGES_QUERIES = {
+    (False, False): _RECENT_MESSAGES_BASE + _RECENT_MESSAGES_ORDER,
+    (True, False): _RECENT_MESSAGES_BASE + " AND message.date > ?" + _RECENT_MESSAGES_ORDER,
+    (False, True): _RECENT_MESSAGES_BASE + " AND chat.ROWID = ?" + _RECENT_MESSAGES_ORDER,
+    (True, True): (
+        _RECENT_MESSAGES_BASE
+        + " AND message.date > ? AND chat.ROWID = ?"
+        + _RECENT_MESSAGES_ORDER
+    ),
+}
+
+# Parameter builders matching each query variant's placeholders, called
+# as builder(since, chat_id, limit)
+_RECENT_MESSAGES_PARAMS = {
+    (False, False): lambda since, chat_id, limit: (limit,),
+    (True, False): lambda since, chat_id, limit: (_to_apple_timestamp(since), limit),
+    (False, True): lambda since, chat_id, limit: (chat_id, limit),
+    (True, True): lambda since, chat_id, limit: (_to_apple_timestamp(since), chat_id, limit),
+}
+
+_UNREAD_MESSAGES_QUERY = """
+    SELECT
+        message.ROWID as id,
+        message.guid,
+        message.text,
+        message.date,
+        message.is_from_me,
+        handle.id as sender,
+        chat.chat_identifier,
+        chat.display_name as chat_name
+    FROM message
+    LEFT JOIN handle ON message.handle_id = handle.ROWID
+    LEFT JOIN chat_message_join ON message.ROWID = chat_message_join.message_id
+    LEFT JOIN chat ON chat_message_join.chat_id = chat.ROWID
+    WHERE message.is_read = 0
+        AND message.is_from_me = 0
+        AND message.text IS NOT NULL
+    ORDER BY message.date DESC
+    LIMIT ?
+"""
+
+_SEARCH_MESSAGES_QUERY = """
+    SELECT
+        message.ROWID as id,
+        message.text,
+        message.date,
+        message.is_from_me,
+        handle.id as sender,
+        chat.chat_identifier,
+        chat.display_name as chat_name
+    FROM message
+    LEFT JOIN handle ON message.handle_id = handle.ROWID
+    LEFT JOIN chat_message_join ON message.ROWID = chat_message_join.message_id
+    LEFT JOIN chat ON chat_message_join.chat_id = chat.ROWID
+    WHERE message.text LIKE ?
+    ORDER BY message.date DESC
+    LIMIT ?
+"""
+
+_CHATS_BASE = """
+    SELECT
+        ROWID as id,
+        guid,
+        chat_identifier,
+        display_name,
+        service_name,
+        COALESCE(chat_identifier GLOB 'chat*', 0) as is_group
+    FROM chat
+"""
+
+# search_messages over candidate ROWIDs from the search index (JSON array),
+# re-checked against the current text in case a message was edited since
+# it was indexed
+_SEARCH_MESSAGES_BY_ROWID_QUERY = """
+    SELECT
+        message.ROWID as id,
+        message.text,
+        message.date,
+        message.is_from_me,
+        handle.id as sender,
+        chat.chat_identifier,
+        chat.display_name as chat_name
+    FROM message
+    LEFT JOIN handle ON message.handle_id = handle.ROWID
+    LEFT JOIN chat_message_join ON message.ROWID = chat_message_join.message_id
+    LEFT JOIN chat ON chat_message_join.chat_id = chat.ROWID
+    WHERE message.ROWID IN (SELECT value FROM json_each(?))
+    AND message.text LIKE ?
+    ORDER BY message.date DESC
+    LIMIT ?
+"""
+
+# get_chats query variants keyed by include_group_chats
+_CHATS_QUERIES = {
+    True: _CHATS_BASE,
+    False: _CHATS_BASE + " WHERE chat_identifier NOT LIKE 'chat%'",
+}
+
+_ATTACHMENTS_BASE = """
+    SELECT
+        message.ROWID as id,
+        message.text,
+        message.date,
+        handle.id as sender,
+        attachment.filename,
+        attachment.mime_type,
+        attachment.transfer_name
+    FROM message
+    JOIN message_attachment_join ON message.ROWID = message_attachment_join.message_id
+    JOIN attachment ON message_attachment_join.attachment_id = attachment.ROWID
+    LEFT JOIN handle ON message.handle_id = handle.ROWID
+    WHERE attachment.filename IS NOT NULL
+"""
+
+_ATTACHMENTS_ORDER = " ORDER BY message.date DESC LIMIT ?"
+
+
+@lru_cache(maxsize=32)
+def _build_attachments_query(
+    has_sender: bool,
+    has_since: bool,
+    mime_prefix_count: int,
+    has_filename: bool
+) -> str:
+    """Build a get_message_attachments query for the given filters.
+
+    Args:
+        has_sender: Whether a sender LIKE parameter follows
+        has_since: Whether a date filter parameter follows
+        mime_prefix_count: Number of MIME type prefix LIKE parameters
+            that follow (any may match)
+        has_filename: Whether a filename LIKE parameter follows
+
+    Returns:
+        SQL query string
+    """
+    query = _ATTACHMENTS_BASE
+    if has_sender:
+        query += " AND handle.id LIKE ?"
+    if has_since:
+        query += " AND message.date > ?"
+    if mime_prefix_count:
+        query += " AND (" + " OR ".join(["attachment.mime_type LIKE ?"] * mime_prefix_count) + ")"
+    if has_filename:
+        query += " AND attachment.filename LIKE ?"
+    return query + _ATTACHMENTS_ORDER
+
+
+# Projectable message columns: name -> (SQL expression, tables that must be joined)
+_MESSAGE_COLUMNS = {
+    'id': ('message.ROWID', ()),
+    'guid': ('message.guid', ()),
+    'text': ('message.text', ()),
+    'service': ('message.service', ()),
+    'date': ('message.date', ()),
+    'is_from_me': ('message.is_from_me', ()),
+    'is_read': ('message.is_read', ()),
+    'has_attachments': ('message.cache_has_attachments', ()),
+    'sender': ('handle.id', ('handle',)),
+    'chat_id': ('chat_message_join.chat_id', ('chat_message_join',)),
+    'chat_identifier': ('chat.chat_identifier', ('chat_message_join', 'chat')),
+    'chat_name': ('chat.display_name', ('chat_message_join', 'chat')),
+}
+
+# Join clauses in the order they must appear
+_MESSAGE_JOINS = {
+    'handle': "LEFT JOIN handle ON message.handle_id = handle.ROWID",
+    'chat_message_join': "LEFT JOIN chat_message_join ON message.ROWID = chat_message_join.message_id",
+    'chat': "LEFT JOIN chat ON chat_message_join.chat_id = chat.ROWID",
+}
+
+
+@lru_cache(maxsize=32)
+def _build_projection_query(columns: Tuple[str, ...], has_since: bool, has_chat: bool) -> str:
+    """Build a recent-messages query selecting only the given columns.
+
+    Only the joins required by the requested columns and filters are
+    emitted, so SQLite skips the handle/chat lookups when they are unused.
+
+    Args:
+        columns: Column names from _MESSAGE_COLUMNS
+        has_since: Whether a date filter parameter follows
+        has_chat: Whether a chat filter parameter follows
+
+    Returns:
+        SQL query string
+    """
+    tables = set()
+    for name in columns:
+        tables.update(_MESSAGE_COLUMNS[name][1])
+    if has_chat:
+        tables.add('chat_message_join')
+
+    select = ', '.join(_MESSAGE_COLUMNS[name][0] for name in columns)
+    joins = ' '.join(clause for table, clause in _MESSAGE_JOINS.items() if table in tables)
+
+    query = f"SELECT {select} FROM message {joins} WHERE message.text IS NOT NULL"
+    if has_since:
+        query += " AND message.date > ?"
+    if has_chat:
+        query += " AND chat_message_join.chat_id = ?"
+    return query + _RECENT_MESSAGES_ORDER
+
+
+def _fetch_batches(cursor: sqlite3.Cursor) -> Iterator[List[Tuple]]:
+    """Yield query results in fixed-size batches.
+
+    Rows are pulled from the statement as they are consumed, so only one
+    batch of raw tuples is alive at a time instead of the whole result set.
+
+    Args:
+        cursor: Cursor with an executed query
+
+    Yields:
+        Lists of up to _FETCH_BATCH_SIZE rows
+    """
+    while True:
+        rows = cursor.fetchmany(_FETCH_BATCH_SIZE)
+        if not rows:
+            return
+        yield rows
+
+
+def _applescript_string(text: str) -> str:
+    """Quote text as an AppleScript string literal.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Double-quoted literal with backslashes, quotes and control
+        characters escaped
+    """
+    escaped = (
+        text.replace('\\', '\\\\')
+        .replace('"', '\\"')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+        .replace('\t', '\\t')
+    )
+    return f'"{escaped}"'
+
+
+def _to_apple_timestamp(value: datetime) -> int:
+    """Convert a datetime to an Apple timestamp.
+
+    Args:
+        value: Naive datetime
+
+    Returns:
+        Nanoseconds since 2001-01-01
+    """
+    delta = value - _APPLE_EPOCH
+    return ((delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds) * 1000
+
+
+def _apple_timestamps_to_datetimes(timestamps: List[int]) -> List[datetime]:
+    """Convert a batch of Apple timestamps to datetimes.
+
+    Uses a single vectorized NumPy operation when available instead of
+    building a timedelta per row. Small batches skip NumPy, where the array
+    setup would cost more than it saves.
+
+    Args:
+        timestamps: Apple timestamps in nanoseconds since 2001-01-01
+
+    Returns:
+        List of naive datetime objects
+    """
+    if np is None or len(timestamps) <= _VECTORIZE_MIN_ROWS:
+        # Integer microseconds added to the epoch, rounded the same way as
+        # the NumPy path below so both give identical results
+        return [
+            _APPLE_EPOCH + timedelta(microseconds=(ts + 500) // 1000)
+            for ts in timestamps
+        ]
+
+    nanos = np.fromiter(timestamps, dtype=np.int64, count=len(timestamps))
+    # Round to microseconds: datetime64[us].tolist() yields datetime objects
+    micros = (nanos + 500) // 1000
+    dates = np.datetime64(_APPLE_EPOCH, 'us') + micros.astype('timedelta64[us]')
+    return dates.tolist()
+
 
 class iMessageIntegration:
     """Handles iMessage reading and sending."""
@@ -21,6 +455,15 @@ class iMessageIntegration:
         self.db_path = self.config.imessage_database_path
         self._available = self.db_path.exists()
 
+        # include_group_chats -> (fetched_at, max message ROWID, chats)
+        self._chats_cache: Dict[bool, Tuple[float, int, List[Dict]]] = {}
+
+        # NSAppleScript is not reentrant; serialize in-process script runs
+        self._applescript_lock = threading.Lock()
+
+        # Idle read-only connections, reused across calls and threads
+        self._pool: "queue.SimpleQueue[sqlite3.Connection]" = queue.SimpleQueue()
+
         # Log warning if not available
         if not self._available:
             self.logger.warning(
@@ -44,99 +487,174 @@ class iMessageIntegration:
         """
         try:
             # Open in read-only mode
-            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
-            conn.row_factory = sqlite3.Row
+            # Rows come back as plain tuples; callers unpack them positionally
+            # Autocommit so idle pooled connections never hold a read snapshot
+            conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=256
+            )
+            for pragma in _READ_PRAGMAS:
+                conn.execute(pragma)
             return conn
         except Exception as e:
             self.logger.error(f"Error connecting to iMessage database: {e}")
             raise
 
+    def close(self) -> None:
+        """Close all pooled database connections."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+
+    def __del__(self):
+        """Release pooled connections when the integration is discarded."""
+        pool = getattr(self, '_pool', None)
+        if pool is not None:
+            self.close()
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the pool.
+
+        A new connection is opened only when every pooled one is in use, so
+        concurrent callers each get their own connection.
+
+        Yields:
+            SQLite connection, returned to the pool on exit
+        """
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect_db()
+
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def fetch_all_views(
+        self,
+        since: Optional[datetime] = None,
+        limit: int = 100
+    ) -> Dict[str, Any]:
+        """Fetch unread messages, chats and recent messages concurrently.
+
+        The three queries are independent, and sqlite3 releases the GIL while
+        stepping statements, so running them on separate pooled connections
+        overlaps their work.
+
+        Args:
+            since: Only get recent messages after this datetime
+            limit: Maximum number of recent messages
+
+        Returns:
+            Dictionary with 'unread', 'chats' and 'recent' results
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            unread = executor.submit(self.get_unread_messages)
+            chats = executor.submit(self.get_chats)
+            recent = executor.submit(self.get_recent_messages, limit=limit, since=since)
+
+            return {
+                'unread': unread.result(),
+                'chats': chats.result(),
+                'recent': recent.result()
+            }
+
+    def get_max_rowid(self) -> int:
+        """Get the highest message ROWID, a cheap "anything new?" check.
+
+        Returns:
+            Current MAX(ROWID) of the message table (0 when empty)
+        """
+        try:
+            with self._connection() as conn:
+                return conn.execute("SELECT MAX(ROWID) FROM message").fetchone()[0] or 0
+
+        except Exception as e:
+            self.logger.error(f"Error reading latest message ROWID: {e}")
+            raise
+
     def get_recent_messages(
         self,
         limit: int = 100,
         since: Optional[datetime] = None,
-        chat_id: Optional[str] = None
-    ) -> List[Dict]:
+        chat_id: Optional[str] = None,
+        columns: Optional[Tuple[str, ...]] = None
+    ) -> Union[List[Dict], List[Tuple]]:
         """Get recent messages from iMessage database.
 
         Args:
             limit: Maximum number of messages to retrieve
             since: Only get messages after this datetime
             chat_id: Optional chat ID to filter by
+            columns: Optional column names to project (e.g. ('text', 'date')).
+                When given, only the joins those columns need are performed and
+                rows are returned as tuples in the requested order.
 
         Returns:
-            List of message dictionaries
+            List of message dictionaries, or tuples when columns is given
         """
+        if columns is not None:
+            columns = tuple(columns)
+            unknown = [name for name in columns if name not in _MESSAGE_COLUMNS]
+            if unknown:
+                raise ValueError(f"Unknown message columns: {', '.join(unknown)}")
+
         try:
-            conn = self._connect_db()
-            cursor = conn.cursor()
-
-            # Build query
-            query = """
-                SELECT
-                    message.ROWID as id,
-                    message.guid,
-                    message.text,
-                    message.handle_id,
-                    message.service,
-                    message.date,
-                    message.date_read,
-                    message.date_delivered,
-                    message.is_from_me,
-                    message.is_read,
-                    message.cache_has_attachments,
-                    handle.id as sender,
-                    chat.chat_identifier,
-                    chat.display_name as chat_name,
-                    chat.ROWID as chat_rowid
-                FROM message
-                LEFT JOIN handle ON message.handle_id = handle.ROWID
-                LEFT JOIN chat_message_join ON message.ROWID = chat_message_join.message_id
-                LEFT JOIN chat ON chat_message_join.chat_id = chat.ROWID
-                WHERE message.text IS NOT NULL
-            """
-
-            params = []
-
-            if since:
-                # Convert to Apple's timestamp (seconds since 2001-01-01)
-                apple_epoch = datetime(2001, 1, 1)
-                timestamp = int((since - apple_epoch).total_seconds())
-                query += " AND message.date > ?"
-                params.append(timestamp)
-
-            if chat_id:
-                query += " AND chat.ROWID = ?"
-                params.append(chat_id)
-
-            query += " ORDER BY message.date DESC LIMIT ?"
-            params.append(limit)
-
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-
-            messages = []
-            for row in rows:
-                # Convert Apple timestamp to datetime
-                apple_epoch = datetime(2001, 1, 1)
-                date = apple_epoch + timedelta(seconds=row['date'] / 1_000_000_000)
-
-                messages.append({
-                    'id': row['id'],
-                    'guid': row['guid'],
-                    'text': row['text'],
-                    'sender': row['sender'],
-                    'chat_identifier': row['chat_identifier'],
-                    'chat_name': row['chat_name'],
-                    'chat_id': row['chat_rowid'],
-                    'date': date,
-                    'is_from_me': bool(row['is_from_me']),
-                    'is_read': bool(row['is_read']),
-                    'has_attachments': bool(row['cache_has_attachments']),
-                    'service': row['service']
-                })
+            with self._connection() as conn:
+                cursor = conn.cursor()
+
+                variant = (bool(since), bool(chat_id))
+                params = _RECENT_MESSAGES_PARAMS[variant](since, chat_id, limit)
+
+                if columns is not None:
+                    query = _build_projection_query(columns, *variant)
+                    cursor.execute(query, params)
+                    rows = cursor.fetchall()
+
+                    if 'date' in columns:
+                        date_index = columns.index('date')
+                        dates = _apple_timestamps_to_datetimes([row[date_index] for row in rows])
+                        rows = [
+                            row[:date_index] + (date,) + row[date_index + 1:]
+                            for row, date in zip(rows, dates)
+                        ]
+
+                    self.logger.debug(f"Retrieved {len(rows)} messages")
+                    return rows
+
+                # Pick the prebuilt query so the SQL text is stable across calls
+                query = _RECENT_MESSAGES_QUERIES[variant]
+                cursor.execute(query, params)
+
+                messages = []
+                for rows in _fetch_batches(cursor):
+                    dates = _apple_timestamps_to_datetimes([row[5] for row in rows])
+                    for (id_, guid, text, _handle_id, service, _raw_date, _date_read,
+                         _date_delivered, is_from_me, is_read, has_attachments, sender,
+                         chat_identifier, chat_name, chat_rowid), date in zip(rows, dates):
+                        messages.append({
+                            'id': id_,
+                            'guid': guid,
+                            'text': text,
+                            'sender': sender,
+                            'chat_identifier': chat_identifier,
+                            'chat_name': chat_name,
+                            'chat_id': chat_rowid,
+                            'date': date,
+                            'is_from_me': is_from_me,
+                            'is_read': is_read,
+                            'has_attachments': has_attachments,
+                            'service': service
+                        })
 
-            conn.close()
             self.logger.debug(f"Retrieved {len(messages)} messages")
             return messages
 
@@ -144,6 +662,42 @@ class iMessageIntegration:
             self.logger.error(f"Error retrieving messages: {e}")
             raise
 
+    def get_recent_messages_columns(
+        self,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        chat_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Get recent messages as columns (one sequence per field).
+
+        Suited to aggregation, sorting and filtering over many messages: with
+        NumPy installed, 'date' is a datetime64[us] array and the id and flag
+        columns are integer/boolean arrays that support vectorized operations.
+        Text columns are plain lists.
+
+        Args:
+            limit: Maximum number of messages to retrieve
+            since: Only get messages after this datetime
+            chat_id: Optional chat ID to filter by
+
+        Returns:
+            Dictionary mapping column name to its values, in date-descending
+            row order
+        """
+        names = tuple(_MESSAGE_COLUMNS)
+        rows = self.get_recent_messages(
+            limit=limit, since=since, chat_id=chat_id, columns=names
+        )
+        columns = dict(zip(names, map(list, zip(*rows)))) if rows else {name: [] for name in names}
+
+        if np is not None:
+            columns['id'] = np.array(columns['id'], dtype=np.int64)
+            columns['date'] = np.array(columns['date'], dtype='datetime64[us]')
+            for name in ('is_from_me', 'is_read', 'has_attachments'):
+                columns[name] = np.array(columns[name], dtype=bool)
+
+        return columns
+
     def get_chats(self, include_group_chats: bool = True) -> List[Dict]:
         """Get list of all chats.
 
@@ -153,51 +707,286 @@ class iMessageIntegration:
         Returns:
             List of chat dictionaries
         """
-        try:
-            conn = self._connect_db()
-            cursor = conn.cursor()
-
-            query = """
-                SELECT
-                    chat.ROWID as id,
-                    chat.guid,
-                    chat.chat_identifier,
-                    chat.display_name,
-                    chat.service_name,
-                    COUNT(message.ROWID) as message_count
-                FROM chat
-                LEFT JOIN chat_message_join ON chat.ROWID = chat_message_join.chat_id
-                LEFT JOIN message ON chat_message_join.message_id = message.ROWID
-            """
-
-            if not include_group_chats:
-                query += " WHERE chat.chat_identifier NOT LIKE 'chat%'"
-
-            query += " GROUP BY chat.ROWID ORDER BY MAX(message.date) DESC"
-
-            cursor.execute(query)
-            rows = cursor.fetchall()
-
-            chats = []
-            for row in rows:
-                chats.append({
-                    'id': row['id'],
-                    'guid': row['guid'],
-                    'identifier': row['chat_identifier'],
-                    'display_name': row['display_name'],
-                    'service': row['service_name'],
-                    'message_count': row['message_count'],
-                    'is_group': row['chat_identifier'].startswith('chat') if row['chat_identifier'] else False
-                })
+        cached = self._chats_cache.get(include_group_chats)
+        if cached and time.time() - cached[0] < _CHATS_CACHE_TTL:
+            return [dict(chat) for chat in cached[2]]
 
-            conn.close()
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+
+                # Cheap freshness check: skip the aggregate if no new messages arrived
+                cursor.execute("SELECT MAX(ROWID) FROM message")
+                max_rowid = cursor.fetchone()[0] or 0
+                if cached and cached[1] == max_rowid:
+                    self._chats_cache[include_group_chats] = (time.time(), max_rowid, cached[2])
+                    return [dict(chat) for chat in cached[2]]
+
+                cursor.execute(_CHATS_QUERIES[include_group_chats])
+                rows = cursor.fetchall()
+                summary = self._sync_chat_summary(conn, max_rowid)
+
+                chats = []
+                last_dates = {}
+                for id_, guid, chat_identifier, display_name, service_name, is_group in rows:
+                    message_count, last_dates[id_] = summary.get(id_, (0, None))
+                    chats.append({
+                        'id': id_,
+                        'guid': guid,
+                        'identifier': chat_identifier,
+                        'display_name': display_name,
+                        'service': service_name,
+                        'message_count': message_count,
+                        'is_group': is_group
+                    })
+
+                # Most recently active first; chats without messages last
+                chats.sort(key=lambda chat: (
+                    last_dates[chat['id']] is None, -(last_dates[chat['id']] or 0)
+                ))
+
+            self._chats_cache[include_group_chats] = (time.time(), max_rowid, chats)
             self.logger.debug(f"Retrieved {len(chats)} chats")
-            return chats
+            return [dict(chat) for chat in chats]
 
         except Exception as e:
             self.logger.error(f"Error retrieving chats: {e}")
             raise
 
+    @contextmanager
+    def _cache_db(self) -> Iterator[sqlite3.Connection]:
+        """Open the writable sidecar cache database.
+
+        Yields:
+            SQLite connection to the cache, closed on exit
+        """
+        cache_path = self.config.imessage_cache_path
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache = sqlite3.connect(str(cache_path))
+        try:
+            cache.executescript(_CACHE_SCHEMA)
+            yield cache
+        finally:
+            cache.close()
+
+    def _cache_watermark(self, cache: sqlite3.Connection, name: str, max_rowid: int) -> int:
+        """Get the last synced message ROWID for a cached table.
+
+        Args:
+            cache: Connection to the sidecar cache
+            name: Name of the cached table
+            max_rowid: Current MAX(ROWID) of the message table
+
+        Returns:
+            Watermark ROWID, or 0 if the table must be rebuilt from scratch
+        """
+        state = cache.execute(
+            "SELECT source, last_sync_rowid FROM watermarks WHERE name = ?", (name,)
+        ).fetchone()
+
+        # Rebuild if the source database changed or its ROWIDs went backwards
+        if state and state[0] == str(self.db_path) and state[1] <= max_rowid:
+            return state[1]
+        return 0
+
+    def _set_cache_watermark(self, cache: sqlite3.Connection, name: str, max_rowid: int) -> None:
+        """Record the last synced message ROWID for a cached table.
+
+        Args:
+            cache: Connection to the sidecar cache
+            name: Name of the cached table
+            max_rowid: ROWID the table is now synced up to
+        """
+        cache.execute(
+            "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)",
+            (name, str(self.db_path), max_rowid)
+        )
+
+    def _search_index_rowids(self, conn: sqlite3.Connection, keyword: str) -> Optional[List[int]]:
+        """Find ROWIDs of messages containing a keyword via the FTS5 index.
+
+        The index is synced from messages above its watermark before each
+        lookup, so it costs O(new messages) plus O(matches). It is rebuilt
+        when a message has been edited or unsent since the last sync.
+
+        Args:
+            conn: Open connection to the iMessage database
+            keyword: Keyword to search for
+
+        Returns:
+            Candidate message ROWIDs, or None if the index cannot answer the
+            query (short keyword, LIKE wildcards, or FTS5 unavailable)
+        """
+        if len(keyword) < _SEARCH_INDEX_MIN_LENGTH or '%' in keyword or '_' in keyword:
+            return None
+
+        try:
+            max_rowid = conn.execute("SELECT MAX(ROWID) FROM message").fetchone()[0] or 0
+            edit_stamp = self._message_edit_stamp(conn)
+
+            with self._cache_db() as cache:
+                cache.executescript(_SEARCH_INDEX_SCHEMA)
+                watermark = self._cache_watermark(cache, 'message_fts', max_rowid)
+
+                if watermark:
+                    state = cache.execute(
+                        "SELECT value FROM sync_state WHERE name = 'message_fts_edits'"
+                    ).fetchone()
+                    if state is None or state[0] != edit_stamp:
+                        self.logger.debug("Messages were edited, rebuilding search index")
+                        watermark = 0
+
+                if watermark == 0 or max_rowid > watermark:
+                    with cache:
+                        if watermark == 0:
+                            cache.execute(
+                                "INSERT INTO message_fts(message_fts) VALUES ('delete-all')"
+                            )
+                        cache.executemany(
+                            "INSERT INTO message_fts(rowid, text) VALUES (?, ?)",
+                            conn.execute(_SEARCH_INDEX_DELTA, (watermark,))
+                        )
+                        self._set_cache_watermark(cache, 'message_fts', max_rowid)
+                        cache.execute(
+                            "INSERT OR REPLACE INTO sync_state VALUES ('message_fts_edits', ?)",
+                            (edit_stamp,)
+                        )
+                    self.logger.debug(f"Indexed messages above ROWID {watermark} for search")
+
+                phrase = '"' + keyword.replace('"', '""') + '"'
+                return [
+                    row[0] for row in cache.execute(
+                        "SELECT rowid FROM message_fts WHERE message_fts MATCH ?", (phrase,)
+                    )
+                ]
+
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning(f"Search index unavailable, using full scan: {e}")
+            return None
+
+    def _message_edit_stamp(self, conn: sqlite3.Connection) -> int:
+        """Get the latest message edit or unsend time.
+
+        Args:
+            conn: Open connection to the iMessage database
+
+        Returns:
+            Apple timestamp, or 0 if nothing was edited or the database
+            predates message editing
+        """
+        try:
+            return max(value or 0 for value in conn.execute(_MESSAGE_EDIT_STAMP).fetchone())
+        except sqlite3.OperationalError:
+            return 0
+
+    def _sync_chat_summary(
+        self,
+        conn: sqlite3.Connection,
+        max_rowid: int
+    ) -> Dict[int, Tuple[int, Optional[int]]]:
+        """Bring the sidecar chat summary up to date and return it.
+
+        Only messages above the stored ROWID watermark are aggregated, so a
+        sync costs O(new messages) rather than a scan of the whole history.
+        If chat_message_join no longer has the number of rows the summary
+        accounts for, messages were deleted and the summary is rebuilt.
+        Rows for deleted chats are pruned.
+
+        Args:
+            conn: Open connection to the iMessage database
+            max_rowid: Current MAX(ROWID) of the message table
+
+        Returns:
+            Mapping of chat ROWID to (message_count, last_date)
+        """
+        try:
+            with self._cache_db() as cache:
+                watermark = self._cache_watermark(cache, 'chat_summary', max_rowid)
+                join_count = conn.execute(_CHAT_JOIN_COUNT).fetchone()[0]
+
+                delta = []
+                if watermark:
+                    if max_rowid > watermark:
+                        delta = conn.execute(_CHAT_SUMMARY_DELTA, (watermark,)).fetchall()
+                    state = cache.execute(
+                        "SELECT value FROM sync_state WHERE name = 'chat_summary_joins'"
+                    ).fetchone()
+                    if state is None or state[0] + sum(row[1] for row in delta) != join_count:
+                        self.logger.debug("Messages were deleted, rebuilding chat summary")
+                        watermark = 0
+
+                if watermark == 0:
+                    delta = conn.execute(_CHAT_SUMMARY_FULL).fetchall()
+
+                if watermark == 0 or delta:
+                    with cache:
+                        if watermark == 0:
+                            cache.execute("DELETE FROM chat_summary")
+                        cache.executemany(_CHAT_SUMMARY_UPSERT, delta)
+                        self._set_cache_watermark(cache, 'chat_summary', max_rowid)
+                        cache.execute(
+                            "INSERT OR REPLACE INTO sync_state VALUES ('chat_summary_joins', ?)",
+                            (join_count,)
+                        )
+                    self.logger.debug(
+                        f"Synced chat summary for {len(delta)} chats above ROWID {watermark}"
+                    )
+
+                summary = {
+                    row[0]: (row[1], row[2])
+                    for row in cache.execute(
+                        "SELECT chat_id, message_count, last_date FROM chat_summary"
+                    )
+                }
+
+                # Deleted chats keep their summary row until pruned here
+                chat_ids = {row[0] for row in conn.execute("SELECT ROWID FROM chat")}
+                stale = [(chat_id,) for chat_id in summary if chat_id not in chat_ids]
+                if stale:
+                    with cache:
+                        cache.executemany("DELETE FROM chat_summary WHERE chat_id = ?", stale)
+                    for (chat_id,) in stale:
+                        del summary[chat_id]
+
+                return summary
+
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning(f"Chat summary cache unavailable, using full scan: {e}")
+            return {
+                row[0]: (row[1], row[2])
+                for row in conn.execute(_CHAT_SUMMARY_FULL)
+            }
+
+    def _run_applescript(self, script: str) -> Tuple[bool, str]:
+        """Run an AppleScript.
+
+        Uses the in-process NSAppleScript API when pyobjc is installed,
+        avoiding an osascript process launch per message.
+
+        Args:
+            script: AppleScript source
+
+        Returns:
+            Tuple of (success, script result as text or error message)
+        """
+        if NSAppleScript is not None:
+            with self._applescript_lock:
+                apple_script = NSAppleScript.alloc().initWithSource_(script)
+                result, error = apple_script.executeAndReturnError_(None)
+            if error is None:
+                return True, (result.stringValue() if result is not None else None) or ''
+            return False, str(error.get('NSAppleScriptErrorMessage', error))
+
+        result = subprocess.run(
+            ['osascript', '-e', script],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        if result.returncode == 0:
+            return True, result.stdout.strip()
+        return False, result.stderr
+
     def send_message(self, recipient: str, message: str) -> bool:
         """Send an iMessage using AppleScript.
 
@@ -209,42 +998,76 @@ class iMessageIntegration:
             True if successful, False otherwise
         """
         try:
-            # Escape special characters for AppleScript
-            # Replace backslash first, then quotes
-            message = message.replace('\\', '\\\\')
-            message = message.replace('"', '\\"')
-            message = message.replace('\n', '\\n')
-            message = message.replace('\r', '\\r')
-            message = message.replace('\t', '\\t')
-
             # AppleScript to send message
             script = f'''
             tell application "Messages"
                 set targetService to 1st account whose service type = iMessage
-                set targetBuddy to participant "{recipient}" of targetService
-                send "{message}" to targetBuddy
+                set targetBuddy to participant {_applescript_string(recipient)} of targetService
+                send {_applescript_string(message)} to targetBuddy
             end tell
             '''
 
-            # Execute AppleScript
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            success, error = self._run_applescript(script)
 
-            if result.returncode == 0:
+            if success:
                 self.logger.info(f"Sent message to {recipient}: {message[:50]}...")
                 return True
             else:
-                self.logger.error(f"Error sending message: {result.stderr}")
+                self.logger.error(f"Error sending message: {error}")
                 return False
 
         except Exception as e:
             self.logger.error(f"Error sending message to {recipient}: {e}")
             return False
 
+    def send_messages(self, messages: List[Tuple[str, str]]) -> List[bool]:
+        """Send several iMessages with a single AppleScript run.
+
+        The iMessage service is resolved once and every message is sent
+        inside the same tell block, instead of one script per message.
+
+        Args:
+            messages: List of (recipient, message text) tuples
+
+        Returns:
+            List of per-message success flags, in the same order
+        """
+        if not messages:
+            return []
+
+        sends = "\n".join(
+            f'''
+                try
+                    send {_applescript_string(message)} to participant {_applescript_string(recipient)} of targetService
+                    set sendResults to sendResults & "1"
+                on error
+                    set sendResults to sendResults & "0"
+                end try'''
+            for recipient, message in messages
+        )
+        script = f'''
+            set sendResults to ""
+            tell application "Messages"
+                set targetService to 1st account whose service type = iMessage
+                {sends}
+            end tell
+            return sendResults
+            '''
+
+        try:
+            success, output = self._run_applescript(script)
+            if not success:
+                self.logger.error(f"Error sending messages: {output}")
+                return [False] * len(messages)
+
+            results = [flag == "1" for flag in output.ljust(len(messages), "0")[:len(messages)]]
+            self.logger.info(f"Sent {sum(results)}/{len(messages)} messages")
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Error sending messages: {e}")
+            return [False] * len(messages)
+
     def send_message_to_chat(self, chat_identifier: str, message: str) -> bool:
         """Send a message to a specific chat (including group chats).
 
@@ -256,84 +1079,58 @@ class iMessageIntegration:
             True if successful, False otherwise
         """
         try:
-            # Escape quotes
-            message = message.replace('"', '\\"').replace("'", "\\'")
-
             # AppleScript for chat
             script = f'''
             tell application "Messages"
-                set targetChat to a reference to text chat id "{chat_identifier}"
-                send "{message}" to targetChat
+                set targetChat to a reference to text chat id {_applescript_string(chat_identifier)}
+                send {_applescript_string(message)} to targetChat
             end tell
             '''
 
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            success, error = self._run_applescript(script)
 
-            if result.returncode == 0:
+            if success:
                 self.logger.info(f"Sent message to chat {chat_identifier}: {message[:50]}...")
                 return True
             else:
-                self.logger.error(f"Error sending to chat: {result.stderr}")
+                self.logger.error(f"Error sending to chat: {error}")
                 return False
 
         except Exception as e:
             self.logger.error(f"Error sending to chat {chat_identifier}: {e}")
             return False
 
-    def get_unread_messages(self) -> List[Dict]:
-        """Get all unread messages.
+    def get_unread_messages(self, limit: Optional[int] = 1000) -> List[Dict]:
+        """Get unread messages, newest first.
+
+        Args:
+            limit: Maximum number of messages (None for all)
 
         Returns:
             List of unread message dictionaries
         """
         try:
-            conn = self._connect_db()
-            cursor = conn.cursor()
-
-            query = """
-                SELECT
-                    message.ROWID as id,
-                    message.guid,
-                    message.text,
-                    message.date,
-                    message.is_from_me,
-                    handle.id as sender,
-                    chat.chat_identifier,
-                    chat.display_name as chat_name
-                FROM message
-                LEFT JOIN handle ON message.handle_id = handle.ROWID
-                LEFT JOIN chat_message_join ON message.ROWID = chat_message_join.message_id
-                LEFT JOIN chat ON chat_message_join.chat_id = chat.ROWID
-                WHERE message.is_read = 0
-                    AND message.is_from_me = 0
-                    AND message.text IS NOT NULL
-                ORDER BY message.date DESC
-            """
-
-            cursor.execute(query)
-            rows = cursor.fetchall()
-
-            messages = []
-            for row in rows:
-                apple_epoch = datetime(2001, 1, 1)
-                date = apple_epoch + timedelta(seconds=row['date'] / 1_000_000_000)
-
-                messages.append({
-                    'id': row['id'],
-                    'guid': row['guid'],
-                    'text': row['text'],
-                    'sender': row['sender'],
-                    'chat_identifier': row['chat_identifier'],
-                    'chat_name': row['chat_name'],
-                    'date': date
-                })
+            with self._connection() as conn:
+                cursor = conn.cursor()
+
+                # SQLite treats a negative LIMIT as unbounded
+                cursor.execute(_UNREAD_MESSAGES_QUERY, (limit if limit is not None else -1,))
+
+                messages = []
+                for rows in _fetch_batches(cursor):
+                    dates = _apple_timestamps_to_datetimes([row[3] for row in rows])
+                    for (id_, guid, text, _raw_date, _is_from_me, sender,
+                         chat_identifier, chat_name), date in zip(rows, dates):
+                        messages.append({
+                            'id': id_,
+                            'guid': guid,
+                            'text': text,
+                            'sender': sender,
+                            'chat_identifier': chat_identifier,
+                            'chat_name': chat_name,
+                            'date': date
+                        })
 
-            conn.close()
             self.logger.debug(f"Found {len(messages)} unread messages")
             return messages
 
@@ -352,46 +1149,33 @@ class iMessageIntegration:
             List of matching messages
         """
         try:
-            conn = self._connect_db()
-            cursor = conn.cursor()
-
-            query = """
-                SELECT
-                    message.ROWID as id,
-                    message.text,
-                    message.date,
-                    message.is_from_me,
-                    handle.id as sender,
-                    chat.chat_identifier,
-                    chat.display_name as chat_name
-                FROM message
-                LEFT JOIN handle ON message.handle_id = handle.ROWID
-                LEFT JOIN chat_message_join ON message.ROWID = chat_message_join.message_id
-                LEFT JOIN chat ON chat_message_join.chat_id = chat.ROWID
-                WHERE message.text LIKE ?
-                ORDER BY message.date DESC
-                LIMIT ?
-            """
-
-            cursor.execute(query, (f'%{keyword}%', limit))
-            rows = cursor.fetchall()
-
-            messages = []
-            for row in rows:
-                apple_epoch = datetime(2001, 1, 1)
-                date = apple_epoch + timedelta(seconds=row['date'] / 1_000_000_000)
-
-                messages.append({
-                    'id': row['id'],
-                    'text': row['text'],
-                    'sender': row['sender'],
-                    'chat_identifier': row['chat_identifier'],
-                    'chat_name': row['chat_name'],
-                    'date': date,
-                    'is_from_me': bool(row['is_from_me'])
-                })
+            with self._connection() as conn:
+                cursor = conn.cursor()
+
+                rowids = self._search_index_rowids(conn, keyword)
+                if rowids is None:
+                    cursor.execute(_SEARCH_MESSAGES_QUERY, (f'%{keyword}%', limit))
+                else:
+                    cursor.execute(
+                        _SEARCH_MESSAGES_BY_ROWID_QUERY,
+                        (json.dumps(rowids), f'%{keyword}%', limit)
+                    )
+
+                messages = []
+                for rows in _fetch_batches(cursor):
+                    dates = _apple_timestamps_to_datetimes([row[2] for row in rows])
+                    for (id_, text, _raw_date, is_from_me, sender,
+                         chat_identifier, chat_name), date in zip(rows, dates):
+                        messages.append({
+                            'id': id_,
+                            'text': text,
+                            'sender': sender,
+                            'chat_identifier': chat_identifier,
+                            'chat_name': chat_name,
+                            'date': date,
+                            'is_from_me': is_from_me
+                        })
 
-            conn.close()
             self.logger.debug(f"Found {len(messages)} messages matching '{keyword}'")
             return messages
 
@@ -403,80 +1187,71 @@ class iMessageIntegration:
         self,
         sender: Optional[str] = None,
         since: Optional[datetime] = None,
-        limit: int = 50
+        limit: int = 50,
+        mime_prefixes: Tuple[str, ...] = (),
+        filename_contains: Optional[str] = None
     ) -> List[Dict]:
         """Get messages with attachments.
 
+        Filters are applied in the SQL query, so the limit counts only
+        matching attachments.
+
         Args:
             sender: Filter by sender (phone/email)
             since: Only get messages after this datetime
             limit: Maximum number of messages
+            mime_prefixes: Only attachments whose MIME type starts with one
+                of these (e.g. ('image/', 'application/pdf'))
+            filename_contains: Only attachments whose path contains this
+                text (case insensitive)
 
         Returns:
             List of message dictionaries with attachment paths
         """
         try:
-            conn = self._connect_db()
-            cursor = conn.cursor()
-
-            query = """
-                SELECT
-                    message.ROWID as id,
-                    message.text,
-                    message.date,
-                    handle.id as sender,
-                    attachment.filename,
-                    attachment.mime_type,
-                    attachment.transfer_name
-                FROM message
-                JOIN message_attachment_join ON message.ROWID = message_attachment_join.message_id
-                JOIN attachment ON message_attachment_join.attachment_id = attachment.ROWID
-                LEFT JOIN handle ON message.handle_id = handle.ROWID
-                WHERE attachment.filename IS NOT NULL
-            """
-
-            params = []
-
-            if sender:
-                query += " AND handle.id LIKE ?"
-                params.append(f'%{sender}%')
-
-            if since:
-                # Convert to Apple's timestamp
-                apple_epoch = datetime(2001, 1, 1)
-                timestamp = int((since - apple_epoch).total_seconds())
-                query += " AND message.date > ?"
-                params.append(timestamp)
-
-            query += " ORDER BY message.date DESC LIMIT ?"
-            params.append(limit)
-
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-
-            messages = []
-            for row in rows:
-                # Convert Apple timestamp
-                apple_epoch = datetime(2001, 1, 1)
-                date = apple_epoch + timedelta(seconds=row['date'] / 1_000_000_000)
-
-                # Get attachment path
-                filename = row['filename']
-                if filename and filename.startswith('~'):
-                    # Expand home directory
-                    filename = os.path.expanduser(filename)
-
-                messages.append({
-                    'id': row['id'],
-                    'text': row['text'],
-                    'sender': row['sender'],
-                    'date': date,
-                    'attachment_path': filename,
-                    'mime_type': row['mime_type'],
-                    'transfer_name': row['transfer_name']
-                })
+            with self._connection() as conn:
+                cursor = conn.cursor()
+
+                params = []
+
+                if sender:
+                    params.append(f'%{sender}%')
+
+                if since:
+                    params.append(_to_apple_timestamp(since))
+
+                params.extend(f'{prefix}%' for prefix in mime_prefixes)
+
+                if filename_contains:
+                    params.append(f'%{filename_contains}%')
+
+                params.append(limit)
+
+                query = _build_attachments_query(
+                    bool(sender), bool(since), len(mime_prefixes), bool(filename_contains)
+                )
+                cursor.execute(query, params)
+
+                messages = []
+                for rows in _fetch_batches(cursor):
+                    dates = _apple_timestamps_to_datetimes([row[2] for row in rows])
+                    for (id_, text, _raw_date, sender, filename,
+                         mime_type, transfer_name), date in zip(rows, dates):
+                        # Get attachment path
+                        if filename and filename.startswith('~'):
+                            # Expand home directory
+                            filename = os.path.expanduser(filename)
+
+                        messages.append({
+                            'id': id_,
+                            'text': text,
+                            'sender': sender,
+                            'date': date,
+                            'attachment_path': filename,
+                            'mime_type': mime_type,
+                            'transfer_name': transfer_name
+                        })
 
-            conn.close()
             self.logger.debug(f"Retrieved {len(messages)} messages with attachments")
             return messages
 
@@ -1,6 +1,7 @@
 """Meal planning integration using Notion database."""
 
-from typing import List, Dict, Optional, Any
+import time
+from typing import Callable, List, Dict, Optional, Any, Tuple
 from datetime import datetime, date
 
 from ..utils.config import get_config
@@ -8,6 +9,51 @@ from ..utils.logger import get_logger
 from .notion import NotionIntegration
 
 
+# Seconds before a day with no "When to Cook" option re-reads the schema,
+# matching the Notion query cache TTL
+_SCHEMA_RELOAD_INTERVAL = 300
+
+# Stand-in for a property missing from a page; every extractor reads its default
+_EMPTY_PROPERTY = {'title': [], 'multi_select': [], 'number': None, 'url': None}
+
+
+def _extract_title(prop: Dict[str, Any]) -> str:
+    """Extract plain text of the first title fragment."""
+    items = prop['title']
+    return items[0].get('plain_text', 'Untitled') if items else ''
+
+
+def _extract_multi_select(prop: Dict[str, Any]) -> List[str]:
+    """Extract selected option names."""
+    return [option.get('name', '') for option in prop['multi_select']]
+
+
+def _extract_number(prop: Dict[str, Any]) -> Optional[float]:
+    """Extract a number value."""
+    return prop['number']
+
+
+def _extract_url(prop: Dict[str, Any]) -> Optional[str]:
+    """Extract a URL value."""
+    return prop['url']
+
+
+def _constant_extractor(default: Any) -> Callable[[Dict[str, Any]], Any]:
+    """Build an extractor for a property the schema lacks or types differently."""
+    if isinstance(default, list):
+        return lambda prop: list(default)
+    return lambda prop: default
+
+
+# Formatted meal fields: (key, Notion property, expected type, extractor, default)
+_MEAL_FIELDS = (
+    ('name', 'Recipe Name', 'title', _extract_title, ''),
+    ('categories', 'Category', 'multi_select', _extract_multi_select, []),
+    ('servings', 'Servings', 'number', _extract_number, None),
+    ('url', 'URL', 'url', _extract_url, None),
+)
+
+
 class MealPlanningIntegration:
     """Handles meal planning from Notion database."""
 
@@ -20,6 +66,11 @@ class MealPlanningIntegration:
         # Get meal planning database ID from config
         self.meal_db_id = self.config.get('notion.referenced_pages.meal_planning')
 
+        # Loaded from the database schema on first use
+        self._when_to_cook_options: Optional[List[Tuple[str, str]]] = None
+        self._meal_extractors: Optional[List[Tuple[str, str, Callable]]] = None
+        self._schema_loaded_at = 0.0
+
     def is_available(self) -> bool:
         """Check if meal planning is available.
 
@@ -43,21 +94,7 @@ class MealPlanningIntegration:
             today_name = datetime.now().strftime('%A')
 
             # Query database for meals with today in "When to Cook"
-            # Note: This queries all recipes and filters client-side
-            # For better performance, you could use Notion API filters
-            all_meals = self.notion.query_database(self.meal_db_id, page_size=100)
-
-            todays_meals = []
-
-            for meal in all_meals:
-                props = meal.get('properties', {})
-
-                # Check "When to Cook" field
-                when_to_cook = props.get('When to Cook', {})
-                if when_to_cook.get('type') == 'select':
-                    selected = when_to_cook.get('select')
-                    if selected and today_name.lower() in selected.get('name', '').lower():
-                        todays_meals.append(self._format_meal(meal))
+            todays_meals = self._query_meals_for_day(today_name)
 
             self.logger.info(f"Found {len(todays_meals)} meals for {today_name}")
             return todays_meals
@@ -82,24 +119,88 @@ class MealPlanningIntegration:
             # Get day name for target date
             day_name = target_date.strftime('%A')
 
-            all_meals = self.notion.query_database(self.meal_db_id, page_size=100)
+            return self._query_meals_for_day(day_name)
+
+        except Exception as e:
+            self.logger.error(f"Error getting meals for {target_date}: {e}")
+            return []
+
+    def _query_meals_for_day(self, day_name: str) -> List[Dict[str, Any]]:
+        """Query meals whose "When to Cook" option mentions a day.
 
-            meals = []
-            for meal in all_meals:
-                props = meal.get('properties', {})
+        Notion select filters only support exact matches, so the option
+        names containing the day are looked up in the database schema and
+        combined into an "or" filter that Notion evaluates server-side.
 
-                when_to_cook = props.get('When to Cook', {})
-                if when_to_cook.get('type') == 'select':
-                    selected = when_to_cook.get('select')
-                    if selected and day_name.lower() in selected.get('name', '').lower():
-                        meals.append(self._format_meal(meal))
+        Args:
+            day_name: Day name (e.g., "Monday")
 
-            return meals
+        Returns:
+            List of formatted meal dictionaries
+        """
+        if self._when_to_cook_options is None:
+            self._load_schema()
 
-        except Exception as e:
-            self.logger.error(f"Error getting meals for {target_date}: {e}")
+        matching = self._matching_options(day_name)
+        if not matching and time.monotonic() - self._schema_loaded_at >= _SCHEMA_RELOAD_INTERVAL:
+            # The option may have been added since the schema was cached
+            self._load_schema()
+            matching = self._matching_options(day_name)
+
+        if not matching:
             return []
 
+        filter_dict = {
+            "or": [
+                {"property": "When to Cook", "select": {"equals": name}}
+                for name in matching
+            ]
+        }
+        meals = self.notion.query_database(
+            self.meal_db_id, filter_dict=filter_dict, page_size=100
+        )
+
+        return [self._format_meal(meal) for meal in meals]
+
+    def _load_schema(self) -> None:
+        """Load "When to Cook" options and property extractors from the database schema.
+
+        Property types are checked once here, so formatting each meal can
+        dereference the known shapes directly.
+        """
+        database = self.notion.get_database(self.meal_db_id)
+        schema = database.get('properties', {})
+
+        when_to_cook = schema.get('When to Cook', {})
+        options = when_to_cook.get('select', {}).get('options', [])
+        # Keep (name, lowercased name) so matching never re-lowercases
+        self._when_to_cook_options = [
+            (option.get('name', ''), option.get('name', '').lower()) for option in options
+        ]
+
+        extractors = []
+        for key, prop_name, prop_type, extract, default in _MEAL_FIELDS:
+            if schema.get(prop_name, {}).get('type') != prop_type:
+                extract = _constant_extractor(default)
+            extractors.append((key, prop_name, extract))
+        self._meal_extractors = extractors
+        self._schema_loaded_at = time.monotonic()
+
+    def _matching_options(self, day_name: str) -> List[str]:
+        """Get cached "When to Cook" options that mention a day.
+
+        Args:
+            day_name: Day name (e.g., "Monday")
+
+        Returns:
+            List of matching option names
+        """
+        day_lower = day_name.lower()
+        return [
+            name for name, name_lower in self._when_to_cook_options or []
+            if day_lower in name_lower
+        ]
+
     def _format_meal(self, meal: Dict) -> Dict[str, Any]:
         """Format meal data from Notion.
 
@@ -109,38 +210,17 @@ class MealPlanningIntegration:
         Returns:
             Formatted meal dictionary
         """
+        if self._meal_extractors is None:
+            self._load_schema()
+
         props = meal.get('properties', {})
 
-        # Extract recipe name
-        title_prop = props.get('Recipe Name', {})
-        title = ''
-        if title_prop.get('type') == 'title':
-            title_items = title_prop.get('title', [])
-            if title_items:
-                title = title_items[0].get('plain_text', 'Untitled')
-
-        # Extract category
-        categories = []
-        category_prop = props.get('Category', {})
-        if category_prop.get('type') == 'multi_select':
-            for cat in category_prop.get('multi_select', []):
-                categories.append(cat.get('name', ''))
-
-        # Extract servings
-        servings_prop = props.get('Servings', {})
-        servings = servings_prop.get('number') if servings_prop.get('type') == 'number' else None
-
-        # Extract URL
-        url_prop = props.get('URL', {})
-        url = url_prop.get('url') if url_prop.get('type') == 'url' else None
-
-        return {
-            'name': title,
-            'categories': categories,
-            'servings': servings,
-            'url': url,
-            'notion_id': meal.get('id')
+        formatted = {
+            key: extract(props.get(prop_name, _EMPTY_PROPERTY))
+            for key, prop_name, extract in self._meal_extractors
         }
+        formatted['notion_id'] = meal.get('id')
+        return formatted
 
     def format_meal_summary(self, meal: Dict[str, Any]) -> str:
         """Format a meal into a readable summary.
@@ -1,13 +1,44 @@
 """Notion API integration for personal assistant."""
 
-from typing import Dict, List, Optional, Any
+import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from notion_client import Client
 from datetime import datetime
 
+from ..utils.cache import get_cache
 from ..utils.config import get_config
 from ..utils.logger import get_logger
 
 
+# Default seconds a query_database result is reused
+_QUERY_CACHE_TTL = 300
+
+# Notion reports last_edited_time rounded down to the minute, so blocks
+# fetched within a minute of it may predate an edit in that same minute
+_EDIT_TIME_RESOLUTION = 60
+
+# Most children Notion accepts in one blocks.children.append request
+_MAX_APPEND_BLOCKS = 100
+
+# Worker threads for overlapping independent blocking Notion requests
+_MAX_WORKERS = 8
+
+
+def _edit_timestamp(last_edited_time: str) -> float:
+    """Convert a Notion last_edited_time to a Unix timestamp.
+
+    Args:
+        last_edited_time: ISO 8601 time such as 2025-11-03T08:15:00.000Z
+
+    Returns:
+        Seconds since the Unix epoch
+    """
+    return datetime.fromisoformat(last_edited_time.replace('Z', '+00:00')).timestamp()
+
+
 class NotionIntegration:
     """Handles all Notion API interactions."""
 
@@ -18,11 +49,22 @@ class NotionIntegration:
         self.client = Client(auth=self.config.notion_token)
         self.assistant_page_id = self.config.notion_assistant_page_id
 
-    def get_page(self, page_id: str) -> Dict[str, Any]:
+        # (database_id, filter, sorts, page_size) -> (fetched_at, results)
+        self._query_cache: Dict[Tuple, Tuple[float, List[Dict[str, Any]]]] = {}
+
+        # Pages and blocks persist across runs in the disk cache
+        self.cache = get_cache()
+        self.cache_ttl = self.config.get('notion.cache_ttl_seconds', 300)
+        self.blocks_cache_ttl = self.config.get('notion.blocks_cache_ttl_seconds', 3600)
+
+    def get_page(self, page_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """Retrieve a Notion page.
 
+        Pages fetched within the cache TTL are served from the disk cache.
+
         Args:
             page_id: Notion page ID
+            use_cache: Whether a cached copy may be returned
 
         Returns:
             Page data
@@ -30,16 +72,28 @@ class NotionIntegration:
         Raises:
             Exception: If page not found or API error
         """
+        if use_cache:
+            cached = self.cache.get('notion_page', page_id, max_age=self.cache_ttl)
+            if cached is not None:
+                return cached
+
         try:
             self.logger.debug(f"Fetching page: {page_id}")
-            return self.client.pages.retrieve(page_id)
+            page = self.client.pages.retrieve(page_id)
         except Exception as e:
             self.logger.error(f"Error fetching page {page_id}: {e}")
             raise
 
+        self._cache_set('notion_page', page_id, page)
+        return page
+
     def get_page_content(self, page_id: str) -> List[Dict[str, Any]]:
         """Retrieve page content (blocks).
 
+        Cached blocks are reused while the page's last_edited_time is
+        unchanged, for up to the blocks cache TTL, so usually only the page
+        itself is re-fetched after the page TTL.
+
         Args:
             page_id: Notion page ID
 
@@ -47,13 +101,61 @@ class NotionIntegration:
             List of blocks
         """
         try:
+            last_edited_time = self.get_page(page_id).get('last_edited_time')
+            cached = self.cache.get('notion_blocks', page_id, max_age=self.blocks_cache_ttl)
+            if cached and last_edited_time and cached['last_edited_time'] == last_edited_time:
+                # Blocks fetched in the same minute as the edit may predate it
+                edited_at = _edit_timestamp(last_edited_time)
+                if cached.get('fetched_at', 0) >= edited_at + _EDIT_TIME_RESOLUTION:
+                    return cached['blocks']
+
             self.logger.debug(f"Fetching blocks for page: {page_id}")
+            fetched_at = time.time()
             response = self.client.blocks.children.list(page_id)
-            return response.get('results', [])
+            blocks = response.get('results', [])
         except Exception as e:
             self.logger.error(f"Error fetching blocks for {page_id}: {e}")
             raise
 
+        self._cache_set('notion_blocks', page_id, {
+            'last_edited_time': last_edited_time,
+            'fetched_at': fetched_at,
+            'blocks': blocks
+        })
+        return blocks
+
+    def _cache_set(self, namespace: str, key: str, value: Any) -> None:
+        """Store a value in the disk cache, logging rather than raising on failure.
+
+        A locked or full cache database must not fail a request that the
+        Notion API already answered.
+
+        Args:
+            namespace: Cache namespace
+            key: Entry key within the namespace
+            value: JSON-serializable value
+        """
+        try:
+            self.cache.set(namespace, key, value)
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning(f"Could not cache {namespace} entry {key}: {e}")
+
+    def get_pages(self, page_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Retrieve several Notion pages concurrently.
+
+        Args:
+            page_ids: Notion page IDs
+
+        Returns:
+            Dictionary mapping page ID to page data
+        """
+        if not page_ids:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(page_ids))) as executor:
+            pages = list(executor.map(self.get_page, page_ids))
+        return dict(zip(page_ids, pages))
+
     def get_database(self, database_id: str) -> Dict[str, Any]:
         """Retrieve database schema.
 
@@ -75,19 +177,33 @@ class NotionIntegration:
         database_id: str,
         filter_dict: Optional[Dict[str, Any]] = None,
         sorts: Optional[List[Dict[str, Any]]] = None,
-        page_size: int = 100
+        page_size: int = 100,
+        cache: bool = True,
+        cache_ttl: float = _QUERY_CACHE_TTL
     ) -> List[Dict[str, Any]]:
         """Query a Notion database.
 
+        Results are cached per query for cache_ttl seconds; create_page and
+        update_page invalidate the cache.
+
         Args:
             database_id: Notion database ID
             filter_dict: Optional filter criteria
             sorts: Optional sort criteria
             page_size: Number of results per page
+            cache: Reuse a cached result if one is fresh enough
+            cache_ttl: Maximum age in seconds of a reused result
 
         Returns:
             List of database entries
         """
+        key = self._query_cache_key(database_id, filter_dict, sorts, page_size)
+        if cache:
+            cached = self._query_cache.get(key)
+            if cached and time.monotonic() - cached[0] < cache_ttl:
+                self.logger.debug(f"Using cached results for database {database_id}")
+                return list(cached[1])
+
         try:
             self.logger.debug(f"Querying database: {database_id}")
 
@@ -107,12 +223,51 @@ class NotionIntegration:
                 results.extend(response.get('results', []))
 
             self.logger.info(f"Retrieved {len(results)} entries from database {database_id}")
-            return results
+            self._query_cache[key] = (time.monotonic(), results)
+            return list(results)
 
         except Exception as e:
             self.logger.error(f"Error querying database {database_id}: {e}")
             raise
 
+    def _query_cache_key(
+        self,
+        database_id: str,
+        filter_dict: Optional[Dict[str, Any]],
+        sorts: Optional[List[Dict[str, Any]]],
+        page_size: int
+    ) -> Tuple:
+        """Build the query cache key for a database query.
+
+        Args:
+            database_id: Notion database ID
+            filter_dict: Filter criteria
+            sorts: Sort criteria
+            page_size: Number of results per page
+
+        Returns:
+            Hashable cache key
+        """
+        return (
+            database_id,
+            json.dumps(filter_dict, sort_keys=True),
+            json.dumps(sorts, sort_keys=True),
+            page_size
+        )
+
+    def invalidate(self, database_id: Optional[str] = None) -> None:
+        """Evict cached query_database results.
+
+        Args:
+            database_id: Only evict queries against this database (all if None)
+        """
+        if database_id is None:
+            self._query_cache.clear()
+            return
+
+        for key in [key for key in self._query_cache if key[0] == database_id]:
+            del self._query_cache[key]
+
     def create_page(
         self,
         parent_id: str,
@@ -147,6 +302,9 @@ class NotionIntegration:
 
             self.logger.debug(f"Creating page in {parent_id}")
             result = self.client.pages.create(**page_data)
+            self._cache_set('notion_page', result['id'], result)
+            if parent_type == "database_id":
+                self.invalidate(parent_id)
             self.logger.info(f"Created page: {result['id']}")
             return result
 
@@ -171,6 +329,9 @@ class NotionIntegration:
         try:
             self.logger.debug(f"Updating page: {page_id}")
             result = self.client.pages.update(page_id, properties=properties)
+            self._cache_set('notion_page', page_id, result)
+            # The page's database is unknown here, so drop every cached query
+            self.invalidate()
             self.logger.info(f"Updated page: {page_id}")
             return result
         except Exception as e:
@@ -194,6 +355,9 @@ class NotionIntegration:
         try:
             self.logger.debug(f"Appending blocks to: {block_id}")
             result = self.client.blocks.children.append(block_id, children=children)
+            # Appending edits the page, so both cached copies are stale
+            self.cache.delete('notion_page', block_id)
+            self.cache.delete('notion_blocks', block_id)
             self.logger.info(f"Appended {len(children)} blocks to {block_id}")
             return result
         except Exception as e:
@@ -204,18 +368,33 @@ class NotionIntegration:
         self,
         query: str,
         filter_type: Optional[str] = None,
-        sort_direction: str = "descending"
+        sort_direction: str = "descending",
+        cache: bool = True
     ) -> List[Dict[str, Any]]:
         """Search Notion workspace.
 
+        Results are cached on disk under the normalized query (case and
+        whitespace folded), so repeated variants of a search are served
+        locally within the cache TTL.
+
         Args:
             query: Search query
             filter_type: Optional filter ('page' or 'database')
             sort_direction: Sort direction ('ascending' or 'descending')
+            cache: Whether to use the search cache (disable for sensitive queries)
 
         Returns:
             List of search results
         """
+        cache_key = json.dumps([
+            ' '.join(query.casefold().split()), filter_type, sort_direction
+        ])
+        if cache:
+            cached = self.cache.get('notion_search', cache_key, max_age=self.cache_ttl)
+            if cached is not None:
+                self.logger.debug(f"Using cached search results for '{query}'")
+                return cached
+
         try:
             self.logger.debug(f"Searching for: {query}")
 
@@ -230,6 +409,8 @@ class NotionIntegration:
             response = self.client.search(**search_params)
             results = response.get('results', [])
             self.logger.info(f"Found {len(results)} results for '{query}'")
+            if cache:
+                self._cache_set('notion_search', cache_key, results)
             return results
 
         except Exception as e:
@@ -252,6 +433,76 @@ class NotionIntegration:
         Returns:
             Created page/block or None if category page not configured
         """
+        page_id = self._memory_page_id(category)
+        if not page_id:
+            return None
+
+        try:
+            result = self.append_block_children(page_id, [self._memory_block(content)])
+            self.logger.info(f"Added memory to {category}: {content[:50]}...")
+            return result
+
+        except Exception as e:
+            self.logger.error(f"Error adding memory to {category}: {e}")
+            return None
+
+    def add_memories(
+        self,
+        items: List[Tuple[str, str, Optional[Dict[str, Any]]]]
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Add several memories with one append request per memory page.
+
+        Memories for the same category page are coalesced into a single
+        blocks.children.append call (split at Notion's 100-block limit).
+
+        Args:
+            items: (category, content, metadata) tuples
+
+        Returns:
+            Dictionary mapping category to the last append response, or None
+            if the category page is not configured or the append failed
+        """
+        blocks_by_page: Dict[str, List[Dict[str, Any]]] = {}
+        categories_by_page: Dict[str, List[str]] = {}
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        for category, content, _metadata in items:
+            page_id = self._memory_page_id(category)
+            if not page_id:
+                results[category] = None
+                continue
+            blocks_by_page.setdefault(page_id, []).append(self._memory_block(content))
+            categories = categories_by_page.setdefault(page_id, [])
+            if category not in categories:
+                categories.append(category)
+
+        for page_id, blocks in blocks_by_page.items():
+            categories = categories_by_page[page_id]
+            try:
+                result = None
+                for start in range(0, len(blocks), _MAX_APPEND_BLOCKS):
+                    result = self.append_block_children(
+                        page_id, blocks[start:start + _MAX_APPEND_BLOCKS]
+                    )
+                self.logger.info(f"Added {len(blocks)} memories to {', '.join(categories)}")
+            except Exception as e:
+                self.logger.error(f"Error adding memories to {', '.join(categories)}: {e}")
+                result = None
+
+            for category in categories:
+                results[category] = result
+
+        return results
+
+    def _memory_page_id(self, category: str) -> Optional[str]:
+        """Get the memory page ID for a category.
+
+        Args:
+            category: Memory category (personal, work, finance, ai_usage)
+
+        Returns:
+            Page ID, or None if the category page is not configured
+        """
         # Map categories to page IDs
         category_page_ids = {
             'personal': self.config.get('notion.referenced_pages.personal_topics'),
@@ -263,29 +514,28 @@ class NotionIntegration:
         page_id = category_page_ids.get(category)
         if not page_id:
             self.logger.warning(f"No page ID configured for category: {category}")
-            return None
+        return page_id
 
-        try:
-            # Create a block with the memory content
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            block = {
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": f"[{timestamp}] {content}"}
-                    }]
-                }
-            }
+    def _memory_block(self, content: str) -> Dict[str, Any]:
+        """Build a timestamped paragraph block for a memory.
 
-            result = self.append_block_children(page_id, [block])
-            self.logger.info(f"Added memory to {category}: {content[:50]}...")
-            return result
+        Args:
+            content: Memory content
 
-        except Exception as e:
-            self.logger.error(f"Error adding memory to {category}: {e}")
-            return None
+        Returns:
+            Notion paragraph block
+        """
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return {
+            "object": "block",
+            "type": "paragraph",
+            "paragraph": {
+                "rich_text": [{
+                    "type": "text",
+                    "text": {"content": f"[{timestamp}] {content}"}
+                }]
+            }
+        }
 
     def get_assistant_config(self) -> Dict[str, Any]:
         """Retrieve the Personal Assistant configuration page.
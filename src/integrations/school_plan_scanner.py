@@ -1,6 +1,7 @@
 """School plan scanner for extracting homework and events from iMessage Ukeplan images."""
 
 import re
+from functools import lru_cache
 from datetime import datetime, timedelta, date
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
@@ -8,6 +9,240 @@ from pathlib import Path
 from ..utils.config import get_config
 from ..utils.logger import get_logger
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+
+def _build_automaton(words: Tuple[str, ...]) -> Any:
+    """Build an Aho-Corasick automaton over trigger words when available.
+
+    Args:
+        words: Lowercase trigger words
+
+    Returns:
+        Automaton, or None if pyahocorasick is not installed
+    """
+    if not AHOCORASICK_AVAILABLE:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+def _mentions_any(text: str, words: Tuple[str, ...], automaton: Any) -> bool:
+    """Check whether text contains any of the trigger words.
+
+    Args:
+        text: Lowercased text
+        words: Lowercase trigger words
+        automaton: Automaton built from words, or None
+
+    Returns:
+        True if any word occurs in text
+    """
+    if automaton is not None:
+        # One pass over the text instead of one substring scan per word
+        return next(automaton.iter(text), None) is not None
+    return any(word in text for word in words)
+
+
+# Inline equivalents of re flags, since re2.compile takes no flags argument
+_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+
+def _compile(pattern: str, flags: int = 0) -> Any:
+    """Compile a pattern with RE2 when available, else with re.
+
+    RE2 matches in linear time without backtracking. Patterns RE2 cannot
+    compile fall back to re.
+
+    Args:
+        pattern: Regular expression
+        flags: re flags (IGNORECASE, MULTILINE and DOTALL are translated)
+
+    Returns:
+        Compiled pattern with match/search/finditer methods
+    """
+    if RE2_AVAILABLE:
+        inline = ''.join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+        try:
+            return re2.compile(f'(?{inline}){pattern}' if inline else pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
+
+# Lines matching any of these indicate we've left the homework section.
+# Patterns anchored at the line start are fused into one alternation tried
+# once with match(); the rest are fused into one alternation for search().
+# Splitting them keeps the anchored branches from being retried at every
+# position of the line. Patterns are written in lowercase and matched
+# against the lowercased line, so the engine does no case folding.
+_STOP_PREFIX_PATTERNS = [
+    r'\s*[*¢•]\s*',  # Bullet points (usually in Beskjeder)
+    r'\s*===',  # Section markers
+    r'\s*gr\.\d+:',  # Grade groupings (bottom left box)
+    r'\s*tso:',  # Schedule codes (bottom left box)
+    r'\s*[a-z]{2,3}\s*$',  # Short codes like "LL", "TSO", "WWW"
+    r'\s*\d+\s*$',  # Standalone numbers
+    r'[a-z][a-zæøå]+:\s+jeg\s+(vet|kan|kjenner)',  # Ukens mål statements like "Norsk: Jeg vet..."
+    r'\s*[ewgn]\s*\|',  # Column markers
+]
+_STOP_ANYWHERE_PATTERNS = [
+    r'ukens?\s+m[åa]l',  # Ukens mål section
+    r'gymtøy',  # PE equipment mentions
+    r'=\s*\|',  # Box borders/separators
+]
+
+_STOP_PREFIX_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in _STOP_PREFIX_PATTERNS))
+_STOP_ANYWHERE_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in _STOP_ANYWHERE_PATTERNS))
+
+# Homework subjects
+_SUBJECTS = ['Norsk', 'Norwegian', 'Matematikk', 'Matte', 'Math', 'Musikk',
+             'Music', 'Engelsk', 'English', 'Lesing', 'Reading']
+# A subject line is "<subject>: <description>"; checked with a set lookup
+# on the text before the first colon instead of a regex
+_SUBJECT_NAMES = frozenset(subject.lower() for subject in _SUBJECTS)
+
+# Date patterns like "9.desember" or "9 des" or "tirsdag 9.desember". Kept
+# separate and tried in order: the first pattern to match decides date_text.
+_DATE_RES = [
+    re.compile(
+        r'(\d{1,2})\.\s*(?:januar|februar|mars|april|mai|juni|juli|august|september|oktober|november|desember)',
+        re.IGNORECASE
+    ),
+    re.compile(r'(\d{1,2})\s+(?:jan|feb|mar|apr|mai|jun|jul|aug|sep|okt|nov|des)', re.IGNORECASE),
+    re.compile(
+        r'(?:mandag|tirsdag|onsdag|torsdag|fredag|lørdag|søndag)\s+(\d{1,2})\.\s*(?:januar|februar|mars|april|mai|juni|juli|august|september|oktober|november|desember)',
+        re.IGNORECASE
+    ),
+]
+
+# Matches wherever any date pattern above does: the weekday pattern always
+# contains a "9.desember" style match. Leading with the digits lets one
+# regex pass over the whole text find candidate lines cheaply, before the
+# ordered per-line checks above. The "full" alternative is exactly the first
+# date pattern, so when it is the leftmost match on a line it is also that
+# pattern's first match there and needs no re-check.
+_ANY_DATE_RE = re.compile(
+    r'\d{1,2}(?:(?P<full>\.\s*(?:januar|februar|mars|april|mai|juni|juli|august|september|oktober|november|desember))'
+    r'|\s+(?:jan|feb|mar|apr|mai|jun|jul|aug|sep|okt|nov|des))',
+    re.IGNORECASE
+)
+
+# Every month name above starts with one of these abbreviations, so a line
+# containing none of them cannot match any date pattern
+_MONTH_ABBREVIATIONS = ('jan', 'feb', 'mar', 'apr', 'mai', 'jun', 'jul', 'aug',
+                        'sep', 'okt', 'nov', 'des')
+_MONTH_AUTOMATON = _build_automaton(_MONTH_ABBREVIATIONS)
+
+# Time patterns like "kl. 08.30" or "08:30"
+_TIME_RE = re.compile(r'kl\.\s*(\d{1,2})\.(\d{2})|(\d{1,2}):(\d{2})')
+
+# "Ta med" / "Husk" / "Send med" style preparation notes, matched in order.
+# These scan the whole section text, where RE2's prefix search is several
+# times faster than re; per-line patterns above stay on re, which has less
+# call overhead on short strings. Each pattern is paired with its lowercase
+# trigger phrases (and their automaton) and only runs when one occurs.
+_BRING_TRIGGERS = ('ta med', 'husk', 'send med')
+_NEED_TRIGGERS = ('må være', 'skal ha med', 'trenger')
+_PREP_RES = [
+    (
+        _BRING_TRIGGERS,
+        _build_automaton(_BRING_TRIGGERS),
+        _compile(r'(?:Ta med|Husk|Send med)[\s:]+(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+    ),
+    (
+        _NEED_TRIGGERS,
+        _build_automaton(_NEED_TRIGGERS),
+        _compile(r'(?:må være|skal ha med|trenger)[\s:]+(.+?)(?:\n|$)', re.IGNORECASE | re.MULTILINE),
+    ),
+]
+
+
+# Due days per subject as (subject keywords, day offsets from Monday), in
+# priority order. Based on examples:
+# Norsk: Due Tuesday
+# Matematikk: Due Monday
+# Musikk: Due Tuesday
+# Reading/Lesing: Due Tue-Wed
+_DUE_DAY_RULES = (
+    (('norsk',), (1,)),
+    (('matematikk', 'matte'), (0,)),
+    (('musikk',), (1,)),
+    (('lesing', 'reading'), (1, 2)),
+)
+
+# Subjects matching no rule are due Monday
+_DEFAULT_DUE_DAYS = (0,)
+
+
+@lru_cache(maxsize=1)
+def _next_monday(today: date) -> date:
+    """Get the Monday after a date (a week later if it is a Monday).
+
+    Cached for the current day, so scanning several children's plans
+    computes it once.
+
+    Args:
+        today: Current date
+
+    Returns:
+        Date of next Monday
+    """
+    days_until_monday = (7 - today.weekday()) % 7
+    if days_until_monday == 0:
+        days_until_monday = 7
+    return today + timedelta(days=days_until_monday)
+
+
+@lru_cache(maxsize=None)
+def _due_day_deltas(subject_lower: str) -> Tuple[timedelta, ...]:
+    """Resolve a subject to the offsets of its due days from Monday.
+
+    Args:
+        subject_lower: Lowercased subject name
+
+    Returns:
+        Tuple of timedeltas to add to the week's Monday
+    """
+    for keywords, days in _DUE_DAY_RULES:
+        if any(keyword in subject_lower for keyword in keywords):
+            break
+    else:
+        days = _DEFAULT_DUE_DAYS
+    return tuple(timedelta(days=day) for day in days)
+
+
+@lru_cache(maxsize=None)
+def _section_patterns(section_name: str) -> Tuple[re.Pattern, re.Pattern]:
+    """Compile the marker and fallback patterns for a section name.
+
+    Args:
+        section_name: Section name (e.g., "MINE LEKSER")
+
+    Returns:
+        Tuple of (=== marked section pattern, bare section name pattern)
+    """
+    return (
+        re.compile(f"===\\s*{section_name}\\s*===(.*?)(?:===|$)", re.IGNORECASE | re.DOTALL),
+        re.compile(f"{section_name}(.*?)(?:===|$)", re.IGNORECASE | re.DOTALL),
+    )
+
 
 class SchoolPlanScanner:
     """Scans iMessages for school weekly plans and extracts homework/events."""
@@ -37,11 +272,7 @@ class SchoolPlanScanner:
 
         # If no week start provided, use next Monday
         if week_start_date is None:
-            today = date.today()
-            days_until_monday = (7 - today.weekday()) % 7
-            if days_until_monday == 0:
-                days_until_monday = 7
-            week_start_date = today + timedelta(days=days_until_monday)
+            week_start_date = _next_monday(date.today())
 
         # Extract only from "MINE LEKSER" section
         mine_lekser_text = self._extract_section(text, "MINE LEKSER")
@@ -53,25 +284,11 @@ class SchoolPlanScanner:
         current_subject = None
         current_desc_lines = []
 
-        # Stop words that indicate we've left the homework section
-        stop_patterns = [
-            r'^\s*[*¢•]\s*',  # Bullet points (usually in Beskjeder)
-            r'ukens?\s+m[åa]l',  # Ukens mål section
-            r'^\s*===',  # Section markers
-            r'^\s*Gr\.\d+:',  # Grade groupings (bottom left box)
-            r'^\s*TSO:',  # Schedule codes (bottom left box)
-            r'^\s*[A-Z]{2,3}\s*$',  # Short codes like "LL", "TSO", "WWW"
-            r'gymtøy',  # PE equipment mentions
-            r'^\s*\d+\s*$',  # Standalone numbers
-            r'=\s*\|',  # Box borders/separators
-            r'^[A-Z][a-zæøå]+:\s+Jeg\s+(vet|kan|kjenner)',  # Ukens mål statements like "Norsk: Jeg vet..."
-            r'^\s*[EWwgN]\s*\|',  # Column markers
-        ]
-
-        # Homework subjects
-        subjects = ['Norsk', 'Norwegian', 'Matematikk', 'Matte', 'Math', 'Musikk',
-                   'Music', 'Engelsk', 'English', 'Lesing', 'Reading']
-        subject_pattern = r'^(' + '|'.join(subjects) + r'):\s*(.*)$'
+        # Bind the matchers to locals once instead of resolving the module
+        # globals and method attributes on every line
+        subject_names = _SUBJECT_NAMES
+        stop_prefix_match = _STOP_PREFIX_RE.match
+        stop_anywhere_search = _STOP_ANYWHERE_RE.search
 
         for line in lines:
             line = line.strip()
@@ -80,75 +297,87 @@ class SchoolPlanScanner:
             if not line:
                 continue
 
-            # Check if this line should stop current subject
-            should_stop = False
-            for stop_pat in stop_patterns:
-                if re.search(stop_pat, line, re.IGNORECASE):
-                    should_stop = True
-                    break
+            subject, colon, rest_of_line = line.partition(':')
+            is_subject = bool(colon) and subject.lower() in subject_names
 
-            if should_stop:
+            # Outside a subject only a new subject line changes anything, so
+            # the stop regexes are skipped for all other lines
+            if not current_subject and not is_subject:
+                continue
+
+            # Check if this line should stop current subject
+            line_lower = line.lower()
+            if stop_prefix_match(line_lower) or stop_anywhere_search(line_lower):
                 # Save current subject if we have one
-                if current_subject and current_desc_lines:
-                    task_desc = ' '.join(current_desc_lines)
-                    if len(task_desc) >= 10:
-                        due_dates = self._determine_due_dates(current_subject, task_desc, week_start_date)
-                        for due_date in due_dates:
-                            homework_items.append({
-                                'child': child_name,
-                                'subject': current_subject,
-                                'description': task_desc,
-                                'due_date': due_date,
-                                'type': 'homework'
-                            })
+                homework_items.extend(self._homework_items(
+                    child_name, current_subject, current_desc_lines, week_start_date
+                ))
                 # Reset
                 current_subject = None
                 current_desc_lines = []
                 continue
 
             # Check if this is a new subject
-            subject_match = re.match(subject_pattern, line, re.IGNORECASE)
-            if subject_match:
+            if is_subject:
                 # Save previous subject if exists
-                if current_subject and current_desc_lines:
-                    task_desc = ' '.join(current_desc_lines)
-                    if len(task_desc) >= 10:
-                        due_dates = self._determine_due_dates(current_subject, task_desc, week_start_date)
-                        for due_date in due_dates:
-                            homework_items.append({
-                                'child': child_name,
-                                'subject': current_subject,
-                                'description': task_desc,
-                                'due_date': due_date,
-                                'type': 'homework'
-                            })
+                homework_items.extend(self._homework_items(
+                    child_name, current_subject, current_desc_lines, week_start_date
+                ))
 
                 # Start new subject
-                current_subject = subject_match.group(1).strip()
-                rest_of_line = subject_match.group(2).strip()
+                current_subject = subject
+                rest_of_line = rest_of_line.strip()
                 current_desc_lines = [rest_of_line] if rest_of_line else []
-            elif current_subject:
+            else:
                 # Continue current subject description
                 # Skip very short lines or numbers only (likely OCR noise)
                 if len(line) > 2 and not line.isdigit():
                     current_desc_lines.append(line)
 
         # Don't forget the last subject
-        if current_subject and current_desc_lines:
-            task_desc = ' '.join(current_desc_lines)
-            if len(task_desc) >= 10:
-                due_dates = self._determine_due_dates(current_subject, task_desc, week_start_date)
-                for due_date in due_dates:
-                    homework_items.append({
-                        'child': child_name,
-                        'subject': current_subject,
-                        'description': task_desc,
-                        'due_date': due_date,
-                        'type': 'homework'
-                    })
+        homework_items.extend(self._homework_items(
+            child_name, current_subject, current_desc_lines, week_start_date
+        ))
 
         return homework_items
 
+    def _homework_items(
+        self,
+        child_name: str,
+        subject: Optional[str],
+        desc_lines: List[str],
+        week_start_date: date
+    ) -> List[Dict[str, Any]]:
+        """Build homework items for a finished subject.
+
+        Args:
+            child_name: Name of child
+            subject: Subject name, or None if no subject is open
+            desc_lines: Description lines collected for the subject
+            week_start_date: Monday of the week
+
+        Returns:
+            One homework item per due date (empty if the description is
+            missing or too short)
+        """
+        if not subject or not desc_lines:
+            return []
+
+        task_desc = ' '.join(desc_lines)
+        if len(task_desc) < 10:
+            return []
+
+        return [
+            {
+                'child': child_name,
+                'subject': subject,
+                'description': task_desc,
+                'due_date': due_date,
+                'type': 'homework'
+            }
+            for due_date in self._determine_due_dates(subject, task_desc, week_start_date)
+        ]
+
     def _extract_section(self, text: str, section_name: str) -> str:
         """Extract text from a specific section.
 
@@ -159,22 +388,39 @@ class SchoolPlanScanner:
         Returns:
             Text from that section only
         """
+        marked_pattern, fallback_pattern = _section_patterns(section_name)
+
         # Look for section markers like "=== MINE LEKSER ==="
-        pattern = f"===\\s*{section_name}\\s*===(.*?)(?:===|$)"
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        match = marked_pattern.search(text)
 
         if match:
             return match.group(1).strip()
 
         # Fall back to finding the section name and taking everything until next section
-        pattern = f"{section_name}(.*?)(?:===|$)"
-        match = re.search(pattern, text, re.IGNORECASE | re.DOTALL)
+        match = fallback_pattern.search(text)
 
         if match:
             return match.group(1).strip()
 
         return ""
 
+    def _remove_marked_section(self, text: str, section_name: str) -> str:
+        """Remove a section delimited by "=== NAME ===" markers from text.
+
+        Args:
+            text: Full OCR text
+            section_name: Section name to remove (e.g., "MINE LEKSER")
+
+        Returns:
+            Text without that section (unchanged if it is not marked)
+        """
+        match = _section_patterns(section_name)[0].search(text)
+        if not match:
+            return text
+
+        # Keep the marker that ended the section
+        return text[:match.start()] + text[match.end(1):]
+
     def _determine_due_dates(
         self,
         subject: str,
@@ -191,36 +437,7 @@ class SchoolPlanScanner:
         Returns:
             List of due dates
         """
-        due_dates = []
-
-        # Default patterns based on examples
-        # Norsk: Usually Mon-Thu (0-3)
-        # Matematikk: Usually Monday (0)
-        # Musikk: Usually Tuesday (1)
-        # Reading/Lesing: Usually Tue-Wed (1-2)
-
-        subject_lower = subject.lower()
-
-        if 'norsk' in subject_lower:
-            # Due Tuesday
-            due_dates = [week_start + timedelta(days=1)]  # Tuesday only
-        elif 'matematikk' in subject_lower or 'matte' in subject_lower:
-            # Due Monday
-            due_dates = [week_start]
-        elif 'musikk' in subject_lower:
-            # Due Tuesday
-            due_dates = [week_start + timedelta(days=1)]
-        elif 'lesing' in subject_lower or 'reading' in subject_lower:
-            # Due Tue-Wed
-            due_dates = [
-                week_start + timedelta(days=1),  # Tuesday
-                week_start + timedelta(days=2)   # Wednesday
-            ]
-        else:
-            # Default to Monday
-            due_dates = [week_start]
-
-        return due_dates
+        return [week_start + delta for delta in _due_day_deltas(subject.lower())]
 
     def extract_events_from_text(
         self,
@@ -238,36 +455,47 @@ class SchoolPlanScanner:
         """
         events = []
 
-        # Look for date patterns like "9.desember" or "9 des" or "tirsdag 9.desember"
-        date_patterns = [
-            r'(\d{1,2})\.\s*(?:januar|februar|mars|april|mai|juni|juli|august|september|oktober|november|desember)',
-            r'(\d{1,2})\s+(?:jan|feb|mar|apr|mai|jun|jul|aug|sep|okt|nov|des)',
-            r'(?:mandag|tirsdag|onsdag|torsdag|fredag|lørdag|søndag)\s+(\d{1,2})\.\s*(?:januar|februar|mars|april|mai|juni|juli|august|september|oktober|november|desember)'
-        ]
-
-        # Look for time patterns like "kl. 08.30" or "08:30"
-        time_pattern = r'kl\.\s*(\d{1,2})\.(\d{2})|(\d{1,2}):(\d{2})'
+        # Skip the date regexes if no month is mentioned anywhere
+        if not _mentions_any(text.lower(), _MONTH_ABBREVIATIONS, _MONTH_AUTOMATON):
+            return events
+
+        # Find lines with a date in one regex pass over the whole text. The
+        # line holding each match start is then checked in full, and the
+        # search resumes on the following line.
+        pos = 0
+        while True:
+            candidate = _ANY_DATE_RE.search(text, pos)
+            if not candidate:
+                break
+
+            line_start = text.rfind('\n', 0, candidate.start()) + 1
+            line_end = text.find('\n', candidate.start())
+            if line_end == -1:
+                line_end = len(text)
+            pos = line_end + 1
+            line = text[line_start:line_end]
 
-        # Extract events
-        lines = text.split('\n')
-        for line in lines:
             # Skip if line is too short
             if len(line.strip()) < 10:
                 continue
 
-            # Check for date
-            date_match = None
-            for pattern in date_patterns:
-                date_match = re.search(pattern, line, re.IGNORECASE)
-                if date_match:
-                    break
+            # Check for date, reusing the candidate match when it is already
+            # the first full-month date on this line
+            if candidate.group('full') is not None and candidate.end() <= line_end:
+                date_match = candidate
+            else:
+                date_match = None
+                for pattern in _DATE_RES:
+                    date_match = pattern.search(line)
+                    if date_match:
+                        break
 
             if date_match:
                 # Found a date, extract event details
                 event_text = line.strip()
 
                 # Extract time if present
-                time_match = re.search(time_pattern, line)
+                time_match = _TIME_RE.search(line)
                 hour = 8  # Default time
                 minute = 0
 
@@ -309,26 +537,21 @@ class SchoolPlanScanner:
         prep_items = []
 
         if week_start_date is None:
-            today = date.today()
-            days_until_monday = (7 - today.weekday()) % 7
-            if days_until_monday == 0:
-                days_until_monday = 7
-            week_start_date = today + timedelta(days=days_until_monday)
+            week_start_date = _next_monday(date.today())
 
         # Extract from "BESKJEDER" section
         beskjeder_text = self._extract_section(text, "BESKJEDER")
         if not beskjeder_text:
-            # Fall back to full text
-            beskjeder_text = text
+            # Fall back to full text, minus a marked homework section, which
+            # holds homework rather than notices
+            beskjeder_text = self._remove_marked_section(text, "MINE LEKSER")
 
-        # Look for "Ta med" or "Husk" or "Send med" patterns
-        prep_patterns = [
-            r'(?:Ta med|Husk|Send med)[\s:]+(.+?)(?:\n|$)',
-            r'(?:må være|skal ha med|trenger)[\s:]+(.+?)(?:\n|$)'
-        ]
+        beskjeder_lower = beskjeder_text.lower()
+        for triggers, automaton, pattern in _PREP_RES:
+            if not _mentions_any(beskjeder_lower, triggers, automaton):
+                continue
 
-        for pattern in prep_patterns:
-            matches = re.finditer(pattern, beskjeder_text, re.IGNORECASE | re.MULTILINE)
+            matches = pattern.finditer(beskjeder_text)
             for match in matches:
                 item_desc = match.group(1).strip()
 
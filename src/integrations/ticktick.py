@@ -1,15 +1,37 @@
 """TickTick integration for task management."""
 
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta
-import requests
-from pathlib import Path
-import json
+from typing import List, Dict, Optional, Any, Tuple
+from datetime import date, datetime, timedelta
+import threading
+import time
 
 from ..utils.config import get_config
 from ..utils.logger import get_logger
 
 
+# Seconds a fetched task list is reused across query methods
+_TASKS_CACHE_TTL = 30
+
+# Task attributes copied into formatted tasks whenever present
+_OPTIONAL_TASK_FIELDS = ('tags', 'content', 'project_id')
+
+# Stand-in for an attribute a task object lacks
+_MISSING = object()
+
+_PRIORITY_NAMES = {
+    0: 'None',
+    1: 'Low',
+    3: 'Medium',
+    5: 'High'
+}
+
+_PRIORITY_EMOJI = {
+    5: '🔴',
+    3: '🟡',
+    1: '🔵'
+}
+
+
 class TickTickIntegration:
     """Handles TickTick API interactions for task management."""
 
@@ -23,6 +45,13 @@ class TickTickIntegration:
         self.config = get_config()
         self.logger = get_logger(__name__)
 
+        # (fetched_at, tasks) from the last get_from_project() call
+        self._tasks_cache: Optional[Tuple[float, List[Any]]] = None
+        self._tasks_lock = threading.Lock()
+
+        # (task list, due day -> [(position, task)]) built from the cached list
+        self._due_index: Optional[Tuple[List[Any], Dict[date, List[Tuple[int, Any]]]]] = None
+
         # Get credentials from config or parameters
         self.username = username or self.config.get_env('TICKTICK_USERNAME')
         self.password = password or self.config.get_env('TICKTICK_PASSWORD')
@@ -32,15 +61,24 @@ class TickTickIntegration:
             self.client = None
             return
 
-        # Try to import ticktick-py library
+        # Try to import ticktick-py library (and requests, which it uses),
+        # only once credentials are known to be configured
         try:
+            import requests
+            from requests.adapters import HTTPAdapter
             from ticktick.oauth2 import OAuth2
             from ticktick.api import TickTickClient
 
+            # One pooled session shared by the OAuth and API clients, so
+            # calls reuse open TLS connections
+            self.session = requests.Session()
+            self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
             # Initialize client
             self.auth_client = OAuth2(
                 username=self.username,
-                password=self.password
+                password=self.password,
+                session=self.session
             )
 
             self.client = TickTickClient(
@@ -77,17 +115,11 @@ class TickTickIntegration:
 
         try:
             today = datetime.now().date()
-            tasks = []
 
-            # Get all tasks
-            all_tasks = self.client.task.get_from_project()
-
-            for task in all_tasks:
-                # Check if task is due today
-                if hasattr(task, 'due_date'):
-                    due_date = task.due_date
-                    if due_date and due_date.date() == today:
-                        tasks.append(self._format_task(task))
+            tasks = [
+                self._format_task(task)
+                for _, task in self._tasks_by_due_day().get(today, [])
+            ]
 
             self.logger.debug(f"Retrieved {len(tasks)} tasks for today")
             return tasks
@@ -107,14 +139,19 @@ class TickTickIntegration:
 
         try:
             today = datetime.now().date()
-            tasks = []
 
-            all_tasks = self.client.task.get_from_project()
+            entries = [
+                entry
+                for due_day, day_entries in self._tasks_by_due_day().items()
+                if due_day < today
+                for entry in day_entries
+            ]
+            # Keep the order tasks were fetched in
+            entries.sort(key=lambda entry: entry[0])
 
-            for task in all_tasks:
-                if hasattr(task, 'due_date') and task.due_date:
-                    if task.due_date.date() < today and not task.is_completed:
-                        tasks.append(self._format_task(task))
+            tasks = [
+                self._format_task(task) for _, task in entries if not task.is_completed
+            ]
 
             self.logger.debug(f"Retrieved {len(tasks)} overdue tasks")
             return tasks
@@ -138,15 +175,18 @@ class TickTickIntegration:
         try:
             today = datetime.now().date()
             end_date = today + timedelta(days=days)
-            tasks = []
 
-            all_tasks = self.client.task.get_from_project()
+            entries = [
+                entry
+                for due_day, day_entries in self._tasks_by_due_day().items()
+                if today <= due_day <= end_date
+                for entry in day_entries
+            ]
+            entries.sort(key=lambda entry: entry[0])
 
-            for task in all_tasks:
-                if hasattr(task, 'due_date') and task.due_date:
-                    due_date = task.due_date.date()
-                    if today <= due_date <= end_date and not task.is_completed:
-                        tasks.append(self._format_task(task))
+            tasks = [
+                self._format_task(task) for _, task in entries if not task.is_completed
+            ]
 
             # Sort by due date
             tasks.sort(key=lambda x: x.get('due_date', datetime.max))
@@ -172,7 +212,7 @@ class TickTickIntegration:
 
         try:
             tasks = []
-            all_tasks = self.client.task.get_from_project()
+            all_tasks = self._all_tasks()
 
             for task in all_tasks:
                 if hasattr(task, 'priority') and task.priority == priority:
@@ -200,7 +240,7 @@ class TickTickIntegration:
 
         try:
             tasks = []
-            all_tasks = self.client.task.get_from_project()
+            all_tasks = self._all_tasks()
 
             for task in all_tasks:
                 if hasattr(task, 'tags') and tag in task.tags:
@@ -257,6 +297,7 @@ class TickTickIntegration:
                 task.set_project_id(project_id)
 
             created = task.create()
+            self.invalidate_cache()
             self.logger.info(f"Created task: {title}")
             return self._format_task(created)
 
@@ -278,6 +319,7 @@ class TickTickIntegration:
 
         try:
             self.client.task.complete(task_id)
+            self.invalidate_cache()
             self.logger.info(f"Completed task: {task_id}")
             return True
 
@@ -301,7 +343,7 @@ class TickTickIntegration:
             }
 
         try:
-            all_tasks = self.client.task.get_from_project()
+            all_tasks = self._all_tasks()
             today = datetime.now().date()
 
             stats = {
@@ -315,20 +357,27 @@ class TickTickIntegration:
             for task in all_tasks:
                 stats['total'] += 1
 
-                # Completed today
-                if task.is_completed and hasattr(task, 'completed_time'):
-                    if task.completed_time and task.completed_time.date() == today:
+                # Completed today; completed tasks count toward nothing else
+                if task.is_completed:
+                    completed_time = getattr(task, 'completed_time', None)
+                    if completed_time and completed_time.date() == today:
                         stats['completed_today'] += 1
+                    continue
+
+                # Read each remaining attribute once
+                due_date = getattr(task, 'due_date', None)
+                priority = getattr(task, 'priority', None)
 
                 # Overdue
-                if hasattr(task, 'due_date') and task.due_date:
-                    if task.due_date.date() < today and not task.is_completed:
+                if due_date:
+                    due_day = due_date.date()
+                    if due_day < today:
                         stats['overdue'] += 1
-                    elif task.due_date.date() == today and not task.is_completed:
+                    elif due_day == today:
                         stats['due_today'] += 1
 
                 # High priority
-                if hasattr(task, 'priority') and task.priority == 5 and not task.is_completed:
+                if priority == 5:
                     stats['high_priority'] += 1
 
             return stats
@@ -337,6 +386,64 @@ class TickTickIntegration:
             self.logger.error(f"Error getting task statistics: {e}")
             return {}
 
+    def get_briefing_tasks(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, int]]:
+        """Get today's tasks, overdue tasks and task statistics.
+
+        Same shape as TickTickOAuth.get_briefing_tasks, so the daily
+        briefing works with either authentication method. The three
+        queries share one cached task list.
+
+        Returns:
+            Tuple of (today's tasks, overdue tasks, statistics dictionary)
+        """
+        return self.get_today_tasks(), self.get_overdue_tasks(), self.get_task_statistics()
+
+    def _all_tasks(self) -> List[Any]:
+        """Get all tasks, reusing a recent fetch.
+
+        A dashboard calls several query methods in a row or concurrently;
+        they share one get_from_project() round trip within the cache TTL.
+
+        Returns:
+            List of TickTick task objects
+        """
+        # Held across the fetch so concurrent callers share one round trip
+        with self._tasks_lock:
+            if self._tasks_cache and time.monotonic() - self._tasks_cache[0] < _TASKS_CACHE_TTL:
+                return self._tasks_cache[1]
+
+            tasks = self.client.task.get_from_project()
+            self._tasks_cache = (time.monotonic(), tasks)
+            return tasks
+
+    def _tasks_by_due_day(self) -> Dict[date, List[Tuple[int, Any]]]:
+        """Index the cached task list by due day.
+
+        Built in one pass per fetched task list, so the today, overdue and
+        upcoming queries look up buckets instead of each rescanning every
+        task.
+
+        Returns:
+            Dictionary mapping due day to (fetch position, task) pairs
+        """
+        tasks = self._all_tasks()
+        if self._due_index is not None and self._due_index[0] is tasks:
+            return self._due_index[1]
+
+        index: Dict[date, List[Tuple[int, Any]]] = {}
+        for position, task in enumerate(tasks):
+            due_date = getattr(task, 'due_date', None)
+            if due_date:
+                index.setdefault(due_date.date(), []).append((position, task))
+
+        self._due_index = (tasks, index)
+        return index
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached task list so the next query re-fetches."""
+        self._tasks_cache = None
+        self._due_index = None
+
     def _format_task(self, task) -> Dict[str, Any]:
         """Format a TickTick task object into a dictionary.
 
@@ -353,21 +460,19 @@ class TickTickIntegration:
         }
 
         # Optional fields
-        if hasattr(task, 'due_date') and task.due_date:
-            formatted['due_date'] = task.due_date
-
-        if hasattr(task, 'priority'):
-            formatted['priority'] = task.priority
-            formatted['priority_name'] = self._priority_name(task.priority)
+        due_date = getattr(task, 'due_date', None)
+        if due_date:
+            formatted['due_date'] = due_date
 
-        if hasattr(task, 'tags'):
-            formatted['tags'] = task.tags
+        priority = getattr(task, 'priority', _MISSING)
+        if priority is not _MISSING:
+            formatted['priority'] = priority
+            formatted['priority_name'] = _PRIORITY_NAMES.get(priority, 'Unknown')
 
-        if hasattr(task, 'content'):
-            formatted['content'] = task.content
-
-        if hasattr(task, 'project_id'):
-            formatted['project_id'] = task.project_id
+        for field in _OPTIONAL_TASK_FIELDS:
+            value = getattr(task, field, _MISSING)
+            if value is not _MISSING:
+                formatted[field] = value
 
         return formatted
 
@@ -380,13 +485,7 @@ class TickTickIntegration:
         Returns:
             Priority name
         """
-        priority_map = {
-            0: 'None',
-            1: 'Low',
-            3: 'Medium',
-            5: 'High'
-        }
-        return priority_map.get(priority, 'Unknown')
+        return _PRIORITY_NAMES.get(priority, 'Unknown')
 
     def format_task_summary(self, task: Dict[str, Any]) -> str:
         """Format a task into a readable summary.
@@ -400,13 +499,9 @@ class TickTickIntegration:
         parts = []
 
         # Priority indicator
-        priority = task.get('priority', 0)
-        if priority == 5:
-            parts.append('🔴')
-        elif priority == 3:
-            parts.append('🟡')
-        elif priority == 1:
-            parts.append('🔵')
+        emoji = _PRIORITY_EMOJI.get(task.get('priority', 0))
+        if emoji:
+            parts.append(emoji)
 
         # Title
         parts.append(task.get('title', 'Untitled'))
@@ -419,7 +514,7 @@ class TickTickIntegration:
 
         # Tags
         if task.get('tags'):
-            tags_str = ' '.join(f"#{tag}" for tag in task['tags'])
+            tags_str = '#' + ' #'.join(task['tags'])
             parts.append(f"[{tags_str}]")
 
         return ' '.join(parts)
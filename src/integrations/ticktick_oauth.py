@@ -1,15 +1,95 @@
 """TickTick OAuth2 integration for task management."""
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
+from functools import lru_cache
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import re
+import threading
+import time
 from pathlib import Path
 from urllib.parse import urlencode
 import webbrowser
 
+from ..utils.cache import get_cache
 from ..utils.config import get_config
+from ..utils.json_io import dumps_json, loads_json
 from ..utils.logger import get_logger
+from ..utils.rate_limit import TokenBucket
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    import httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTP2_AVAILABLE = False
+
+
+# Seconds fetched projects and tasks are reused across query methods
+_CACHE_TTL = 60
+
+# Worker threads for fetching project task lists concurrently
+_MAX_WORKERS = 8
+
+# Connections kept open by the HTTP/2 client; streams multiplex over them
+_HTTP2_KEEPALIVE_CONNECTIONS = 4
+
+# Extra attempts for a 429 on methods the session does not retry itself
+_RATE_LIMIT_RETRIES = 3
+
+# Growth of the wait between 429 retries without a Retry-After header
+_RATE_LIMIT_BACKOFF = 1.2
+
+# Seconds before expiry at which an access token is refreshed
+_TOKEN_REFRESH_SKEW = 60
+
+_PRIORITY_NAMES = {
+    0: 'None',
+    1: 'Low',
+    3: 'Medium',
+    5: 'High'
+}
+
+_PRIORITY_EMOJI = {
+    5: '🔴',
+    3: '🟡',
+    1: '🔵'
+}
+
+# Timezone offset without a colon at the end of a date (+0000)
+_TZ_OFFSET_RE = re.compile(r'([+-]\d{2})(\d{2})$')
+
+
+def _in_event_loop() -> bool:
+    """Return True when called from a thread with a running asyncio loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _parse_ticktick_datetime(date_str: str) -> datetime:
+    """Parse a TickTick date string, memoized per distinct string.
+
+    TickTick returns dates like 2026-11-11T23:00:00.000+0000, while
+    fromisoformat needs 2026-11-11T23:00:00.000+00:00. The same due dates
+    are parsed again by every query over the cached task list.
+
+    Args:
+        date_str: Date string from TickTick API
+
+    Returns:
+        Timezone-aware datetime
+    """
+    date_str = _TZ_OFFSET_RE.sub(r'\1:\2', date_str.replace('Z', '+00:00'))
+    return datetime.fromisoformat(date_str)
 
 
 class TickTickOAuth:
@@ -38,6 +118,48 @@ class TickTickOAuth:
         self.token_file = self.config.base_dir / 'data' / 'ticktick_token.json'
         self.access_token = None
         self.refresh_token = None
+        # Wall-clock expiry of the access token, when the server reported one
+        self._expires_at: Optional[float] = None
+        self._token_lock = threading.Lock()
+
+        # (fetched_at, data) from the last project and task fetches; the task
+        # entry also maps lowercased titles to the project IDs using them
+        self._projects_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._tasks_cache: Optional[
+            Tuple[float, List[Dict[str, Any]], Dict[str, Set[Optional[str]]]]
+        ] = None
+        self._cache_lock = threading.RLock()
+
+        # A fresh process started shortly after another (daily briefing,
+        # then a school plan run) reuses the project list it persisted. Kept
+        # short, since a project created elsewhere stays invisible until the
+        # copy expires.
+        self.cache = get_cache()
+        self.projects_cache_ttl = self.config.get('ticktick.projects_cache_ttl_seconds', 5 * _CACHE_TTL)
+
+        # One session for all calls, so requests to the same host reuse
+        # keep-alive connections instead of a new TLS handshake each time.
+        # Retries cover transient failures on idempotent methods only, so a
+        # task is never POSTed twice; the final response is still returned
+        # so raise_for_status() reports it as before.
+        self._session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+        self._session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry))
+
+        # Pace API calls so the parallel project fan-out stays under the
+        # server's rate limit instead of burning quota on 429 responses
+        self._rate_limiter = TokenBucket(
+            rate=self.config.get('ticktick.requests_per_second', 5),
+            burst=self.config.get('ticktick.request_burst', 10)
+        )
+
+        # Project data requests are independent, so they overlap on the pool
+        self._executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS)
 
         if not self.client_id or not self.client_secret:
             self.logger.warning("TickTick OAuth credentials not configured")
@@ -46,6 +168,11 @@ class TickTickOAuth:
         # Load existing token if available
         self._load_token()
 
+    def close(self) -> None:
+        """Close the HTTP session, its pooled connections and worker threads."""
+        self._executor.shutdown(wait=False)
+        self._session.close()
+
     def is_available(self) -> bool:
         """Check if TickTick OAuth is available and authenticated.
 
@@ -64,10 +191,10 @@ class TickTickOAuth:
             return False
 
         try:
-            with open(self.token_file, 'r') as f:
-                token_data = json.load(f)
-                self.access_token = token_data.get('access_token')
-                self.refresh_token = token_data.get('refresh_token')
+            token_data = loads_json(self.token_file.read_bytes())
+            self.access_token = token_data.get('access_token')
+            self.refresh_token = token_data.get('refresh_token')
+            self._expires_at = token_data.get('expires_at')
 
             self.logger.info("Loaded TickTick OAuth token")
             return True
@@ -79,17 +206,23 @@ class TickTickOAuth:
     def _save_token(self, token_data: Dict[str, Any]) -> None:
         """Save access token to file.
 
+        The token's lifetime is stored as an absolute expiry time, so a
+        later run knows when to refresh it.
+
         Args:
             token_data: Token response from OAuth
         """
         try:
             self.token_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.token_file, 'w') as f:
-                json.dump(token_data, f, indent=2)
+            if token_data.get('expires_in'):
+                token_data['expires_at'] = time.time() + int(token_data['expires_in'])
+
+            self.token_file.write_bytes(dumps_json(token_data))
 
             self.access_token = token_data.get('access_token')
             self.refresh_token = token_data.get('refresh_token')
+            self._expires_at = token_data.get('expires_at')
 
             self.logger.info("Saved TickTick OAuth token")
 
@@ -166,10 +299,10 @@ class TickTickOAuth:
                 'scope': 'tasks:read tasks:write'
             }
 
-            response = requests.post(self.TOKEN_URL, data=data)
+            response = self._session.post(self.TOKEN_URL, data=data)
             response.raise_for_status()
 
-            token_data = response.json()
+            token_data = loads_json(response.content)
             self._save_token(token_data)
 
             print("\n✅ Successfully authenticated with TickTick!")
@@ -180,9 +313,55 @@ class TickTickOAuth:
             print(f"\n❌ Authentication failed: {e}")
             return False
 
+    def _refresh_access_token(self, stale_token: Optional[str]) -> bool:
+        """Get a new access token using the refresh token.
+
+        Concurrent callers holding the same stale token share one refresh.
+
+        Args:
+            stale_token: Access token the caller found expired
+
+        Returns:
+            True if a newer access token is available, False otherwise
+        """
+        with self._token_lock:
+            if self.access_token != stale_token:
+                # Another thread already refreshed it
+                return True
+
+            if not self.refresh_token:
+                self.logger.error("Access token expired and no refresh token available - run authorize()")
+                return False
+
+            try:
+                data = {
+                    'client_id': self.client_id,
+                    'client_secret': self.client_secret,
+                    'refresh_token': self.refresh_token,
+                    'grant_type': 'refresh_token'
+                }
+
+                response = self._session.post(self.TOKEN_URL, data=data)
+                response.raise_for_status()
+
+                token_data = loads_json(response.content)
+                # The server may not issue a new refresh token
+                token_data.setdefault('refresh_token', self.refresh_token)
+                self._save_token(token_data)
+
+                self.logger.info("Refreshed TickTick OAuth token")
+                return True
+
+            except Exception as e:
+                self.logger.error(f"Error refreshing token: {e}")
+                return False
+
     def _api_request(self, method: str, endpoint: str, **kwargs) -> Optional[Dict]:
         """Make authenticated API request.
 
+        A token about to expire is refreshed before the request, and a 401
+        response triggers one refresh and retry.
+
         Args:
             method: HTTP method
             endpoint: API endpoint
@@ -195,16 +374,18 @@ class TickTickOAuth:
             self.logger.error("Not authenticated - run authorize() first")
             return None
 
+        if self._expires_at and time.time() >= self._expires_at - _TOKEN_REFRESH_SKEW:
+            self._refresh_access_token(self.access_token)
+
         url = f"{self.API_BASE}/{endpoint.lstrip('/')}"
-        headers = {
-            'Authorization': f'Bearer {self.access_token}',
-            'Content-Type': 'application/json'
-        }
 
         try:
-            response = requests.request(method, url, headers=headers, **kwargs)
+            token = self.access_token
+            response = self._send(method, url, token, **kwargs)
+            if response.status_code == 401 and self._refresh_access_token(token):
+                response = self._send(method, url, self.access_token, **kwargs)
             response.raise_for_status()
-            return response.json()
+            return loads_json(response.content)
 
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
@@ -213,43 +394,172 @@ class TickTickOAuth:
                 self.logger.error(f"API request failed: {e}")
             return None
 
+    def _send(self, method: str, url: str, token: str, **kwargs) -> requests.Response:
+        """Send one rate-limited API request.
+
+        The session already retries 429s on idempotent methods; other
+        methods wait out Retry-After here, since a rate-limited request
+        was never processed and is safe to repeat.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            token: OAuth access token
+            **kwargs: Additional request parameters
+
+        Returns:
+            Final response
+        """
+        headers = {
+            'Authorization': f'Bearer {token}',
+            'Content-Type': 'application/json'
+        }
+        retry_429 = method.upper() not in Retry.DEFAULT_ALLOWED_METHODS
+
+        delay = 1.0
+        for attempt in range(_RATE_LIMIT_RETRIES + 1):
+            self._rate_limiter.acquire()
+            response = self._session.request(method, url, headers=headers, **kwargs)
+            if response.status_code != 429 or not retry_429 or attempt == _RATE_LIMIT_RETRIES:
+                return response
+
+            retry_after = response.headers.get('Retry-After', '')
+            wait = float(retry_after) if retry_after.isdigit() else delay
+            self.logger.warning(f"TickTick rate limit hit, retrying in {wait:.1f}s")
+            time.sleep(wait)
+            delay *= _RATE_LIMIT_BACKOFF
+
+        return response
+
     def get_all_projects(self) -> List[Dict[str, Any]]:
         """Get all projects.
 
+        Reuses the last fetch for up to a minute. The first call in a
+        process uses the project list persisted on disk while it is within
+        the projects cache TTL (a few minutes), saving a round trip on a
+        cold start right after another run.
+
         Returns:
             List of project dictionaries
         """
-        result = self._api_request('GET', '/project')
-        return result if result else []
+        with self._cache_lock:
+            if self._projects_cache is None:
+                persisted = self.cache.get('ticktick', 'projects', max_age=self.projects_cache_ttl)
+                if persisted is not None:
+                    self._projects_cache = (time.monotonic(), persisted)
+                    return list(persisted)
+            elif time.monotonic() - self._projects_cache[0] < _CACHE_TTL:
+                return list(self._projects_cache[1])
+
+            result = self._api_request('GET', '/project')
+            projects = result if result else []
+            if result:
+                self.cache.set('ticktick', 'projects', projects)
+            self._projects_cache = (time.monotonic(), projects)
+            return list(projects)
 
     def get_all_tasks(self) -> List[Dict[str, Any]]:
         """Get all tasks from all projects.
 
+        Reuses the last fetch for up to a minute, so a briefing that runs
+        several task queries fans out over the projects once. Concurrent
+        callers wait for and share a single fetch, and the per-project
+        requests run in parallel.
+
         Returns:
             List of task dictionaries
         """
-        all_tasks = []
+        return list(self._cached_tasks()[0])
 
-        # Get all projects first
-        projects = self.get_all_projects()
+    def _cached_tasks(self) -> Tuple[List[Dict[str, Any]], Dict[str, Set[Optional[str]]]]:
+        """Get the cached task list and title index, fetching when stale.
 
-        # Get tasks from each project
-        for project in projects:
-            project_id = project.get('id')
-            if not project_id:
-                continue
+        Returns:
+            Tuple of (task list, lowercased title -> project IDs); both are
+            shared with the cache and must not be modified
+        """
+        with self._cache_lock:
+            if self._tasks_cache and time.monotonic() - self._tasks_cache[0] < _CACHE_TTL:
+                return self._tasks_cache[1], self._tasks_cache[2]
+
+            # Get all projects first, skipping closed ones
+            projects = self.get_all_projects()
+            project_ids = [
+                project['id'] for project in projects
+                if project.get('id') and not project.get('closed', False)
+            ]
+
+            # Fetch each project's data (includes tasks) concurrently, in
+            # project order: multiplexed over HTTP/2 when available,
+            # otherwise on the thread pool. asyncio.run() cannot start
+            # inside a caller's running event loop, so that case uses the
+            # pool too.
+            if HTTP2_AVAILABLE and project_ids and self.access_token and not _in_event_loop():
+                results = asyncio.run(self._fetch_project_data_async(project_ids))
+            else:
+                results = self._executor.map(self._fetch_project_data, project_ids)
+
+            all_tasks = []
+            for project_data in results:
+                if project_data:
+                    all_tasks.extend(project_data.get('tasks', []))
 
-            # Skip closed projects
-            if project.get('closed', False):
-                continue
+            title_index: Dict[str, Set[Optional[str]]] = {}
+            for task in all_tasks:
+                title_index.setdefault(task.get('title', '').lower(), set()).add(task.get('projectId'))
 
-            # Get project data (includes tasks)
-            project_data = self._api_request('GET', f'/project/{project_id}/data')
-            if project_data:
-                tasks = project_data.get('tasks', [])
-                all_tasks.extend(tasks)
+            self._tasks_cache = (time.monotonic(), all_tasks, title_index)
+            return all_tasks, title_index
 
-        return all_tasks
+    def _fetch_project_data(self, project_id: str) -> Optional[Dict]:
+        """Fetch one project's data, including its tasks.
+
+        Args:
+            project_id: TickTick project ID
+
+        Returns:
+            Project data or None
+        """
+        return self._api_request('GET', f'/project/{project_id}/data')
+
+    async def _fetch_project_data_async(self, project_ids: List[str]) -> List[Optional[Dict]]:
+        """Fetch several projects' data concurrently over one HTTP/2 client.
+
+        All requests share a single multiplexed connection instead of one
+        pooled connection each. A project whose request does not succeed
+        (expired token, rate limit, network error) is fetched again through
+        _api_request, which handles refreshing and retries.
+
+        Args:
+            project_ids: TickTick project IDs
+
+        Returns:
+            List of project data (None where unavailable), in project order
+        """
+        headers = {
+            'Authorization': f'Bearer {self.access_token}',
+            'Content-Type': 'application/json'
+        }
+        limits = httpx.Limits(max_keepalive_connections=_HTTP2_KEEPALIVE_CONNECTIONS)
+
+        async with httpx.AsyncClient(http2=True, headers=headers, limits=limits) as client:
+            async def fetch(project_id: str) -> Optional[Dict]:
+                await asyncio.to_thread(self._rate_limiter.acquire)
+                try:
+                    response = await client.get(f"{self.API_BASE}/project/{project_id}/data")
+                    if response.status_code == 200:
+                        return loads_json(response.content)
+                except httpx.HTTPError as e:
+                    self.logger.warning(f"HTTP/2 fetch of project {project_id} failed: {e}")
+                return await asyncio.to_thread(self._fetch_project_data, project_id)
+
+            return await asyncio.gather(*(fetch(project_id) for project_id in project_ids))
+
+    def invalidate_cache(self) -> None:
+        """Drop cached projects and tasks so the next query re-fetches."""
+        with self._cache_lock:
+            self._projects_cache = None
+            self._tasks_cache = None
 
     def _parse_ticktick_date(self, date_str: str) -> datetime:
         """Parse TickTick date format.
@@ -260,67 +570,84 @@ class TickTickOAuth:
         Returns:
             Parsed datetime object
         """
-        # TickTick returns dates like: 2026-11-11T23:00:00.000+0000
-        # Python's fromisoformat needs: 2026-11-11T23:00:00.000+00:00
-        # Also handle 'Z' suffix
-        date_str = date_str.replace('Z', '+00:00')
+        return _parse_ticktick_datetime(date_str)
 
-        # Fix timezone format: +0000 -> +00:00
-        if '+' in date_str and date_str[-5] in ['+', '-']:
-            # Has timezone without colon
-            date_str = date_str[:-2] + ':' + date_str[-2:]
+    def get_briefing_tasks(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, int]]:
+        """Get today's tasks, overdue tasks and task statistics in one pass.
 
-        return datetime.fromisoformat(date_str)
-
-    def get_today_tasks(self) -> List[Dict[str, Any]]:
-        """Get tasks due today (in local timezone).
+        Each task's due and completion dates are parsed at most once, and
+        the task list is walked once for all three results.
 
         Returns:
-            List of task dictionaries
+            Tuple of (today's tasks, overdue tasks, statistics dictionary)
         """
-        all_tasks = self.get_all_tasks()
-        now = datetime.now()
-        today = now.date()
+        # Read the cached list in place; only matching tasks are copied out,
+        # as formatted dictionaries
+        all_tasks = self._cached_tasks()[0]
+        today = datetime.now().date()
 
+        # Locals and plain counters keep attribute and dict lookups out of
+        # the per-task loop
+        parse = _parse_ticktick_datetime
+        format_task = self._format_task
         today_tasks = []
+        overdue = []
+        completed_today = due_today = overdue_count = high_priority = 0
+
         for task in all_tasks:
+            is_open = task.get('status') == 0
+
+            # Completed today
+            completed_time = task.get('completedTime')
+            if completed_time and parse(completed_time).date() == today:
+                completed_today += 1
+
             due_date = task.get('dueDate')
-            if due_date:
+            if due_date and is_open:
                 # Parse the due date (returns timezone-aware datetime)
-                task_datetime_utc = self._parse_ticktick_date(due_date)
+                task_datetime_utc = parse(due_date)
 
-                # Convert to local timezone
-                # This ensures tasks scheduled for Saturday 00:00 local time
-                # don't show up in Friday's briefing
-                task_datetime_local = task_datetime_utc.astimezone()
+                # Today's tasks use the local date, so tasks scheduled for
+                # Saturday 00:00 local time don't show up in Friday's briefing
+                if task_datetime_utc.astimezone().date() == today:
+                    today_tasks.append(format_task(task))
 
-                # Get the local date
-                task_date_local = task_datetime_local.date()
+                # Overdue and statistics use the date as stored
+                task_date = task_datetime_utc.date()
+                if task_date == today:
+                    due_today += 1
+                elif task_date < today:
+                    overdue_count += 1
+                    overdue.append(format_task(task))
 
-                # Only include if the task's local date is today and not completed
-                if task_date_local == today and task.get('status') == 0:
-                    today_tasks.append(self._format_task(task))
+            # High priority
+            if is_open and task.get('priority') == 5:
+                high_priority += 1
 
-        return today_tasks
+        stats = {
+            'total': len(all_tasks),
+            'completed_today': completed_today,
+            'overdue': overdue_count,
+            'due_today': due_today,
+            'high_priority': high_priority
+        }
+        return today_tasks, overdue, stats
 
-    def get_overdue_tasks(self) -> List[Dict[str, Any]]:
-        """Get overdue tasks.
+    def get_today_tasks(self) -> List[Dict[str, Any]]:
+        """Get tasks due today (in local timezone).
 
         Returns:
             List of task dictionaries
         """
-        all_tasks = self.get_all_tasks()
-        today = datetime.now().date()
+        return self.get_briefing_tasks()[0]
 
-        overdue = []
-        for task in all_tasks:
-            due_date = task.get('dueDate')
-            if due_date:
-                task_date = self._parse_ticktick_date(due_date).date()
-                if task_date < today and task.get('status') == 0:
-                    overdue.append(self._format_task(task))
+    def get_overdue_tasks(self) -> List[Dict[str, Any]]:
+        """Get overdue tasks.
 
-        return overdue
+        Returns:
+            List of task dictionaries
+        """
+        return self.get_briefing_tasks()[1]
 
     def get_task_statistics(self) -> Dict[str, int]:
         """Get task statistics.
@@ -328,39 +655,7 @@ class TickTickOAuth:
         Returns:
             Dictionary with task stats
         """
-        all_tasks = self.get_all_tasks()
-        today = datetime.now().date()
-
-        stats = {
-            'total': len(all_tasks),
-            'completed_today': 0,
-            'overdue': 0,
-            'due_today': 0,
-            'high_priority': 0
-        }
-
-        for task in all_tasks:
-            # Completed today
-            completed_time = task.get('completedTime')
-            if completed_time:
-                completed_date = self._parse_ticktick_date(completed_time).date()
-                if completed_date == today:
-                    stats['completed_today'] += 1
-
-            # Due today and overdue
-            due_date = task.get('dueDate')
-            if due_date and task.get('status') == 0:
-                task_date = self._parse_ticktick_date(due_date).date()
-                if task_date == today:
-                    stats['due_today'] += 1
-                elif task_date < today:
-                    stats['overdue'] += 1
-
-            # High priority
-            if task.get('priority') == 5 and task.get('status') == 0:
-                stats['high_priority'] += 1
-
-        return stats
+        return self.get_briefing_tasks()[2]
 
     def _format_task(self, task: Dict) -> Dict[str, Any]:
         """Format API task response.
@@ -389,21 +684,16 @@ class TickTickOAuth:
 
     def _priority_name(self, priority: int) -> str:
         """Convert priority number to name."""
-        priority_map = {0: 'None', 1: 'Low', 3: 'Medium', 5: 'High'}
-        return priority_map.get(priority, 'Unknown')
+        return _PRIORITY_NAMES.get(priority, 'Unknown')
 
     def format_task_summary(self, task: Dict[str, Any]) -> str:
         """Format a task into a readable summary."""
         parts = []
 
         # Priority indicator
-        priority = task.get('priority', 0)
-        if priority == 5:
-            parts.append('🔴')
-        elif priority == 3:
-            parts.append('🟡')
-        elif priority == 1:
-            parts.append('🔵')
+        emoji = _PRIORITY_EMOJI.get(task.get('priority', 0))
+        if emoji:
+            parts.append(emoji)
 
         # Title
         parts.append(task.get('title', 'Untitled'))
@@ -416,7 +706,7 @@ class TickTickOAuth:
 
         # Tags
         if task.get('tags'):
-            tags_str = ' '.join(f"#{tag}" for tag in task['tags'])
+            tags_str = '#' + ' #'.join(task['tags'])
             parts.append(f"[{tags_str}]")
 
         return ' '.join(parts)
@@ -482,6 +772,13 @@ class TickTickOAuth:
         result = self._api_request('POST', '/task', json=task_data)
 
         if result:
+            # A task in a project we have not seen means the persisted
+            # project list is out of date
+            with self._cache_lock:
+                known = self._projects_cache[1] if self._projects_cache else []
+                if project_id and all(project.get('id') != project_id for project in known):
+                    self.cache.delete('ticktick', 'projects')
+                self.invalidate_cache()
             self.logger.info(f"Created task: {title}")
             return result
         else:
@@ -527,6 +824,8 @@ class TickTickOAuth:
         result = self._api_request('POST', '/project', json=project_data)
 
         if result:
+            self.cache.delete('ticktick', 'projects')
+            self.invalidate_cache()
             self.logger.info(f"Created project: {name}")
             return result
         else:
@@ -543,16 +842,12 @@ class TickTickOAuth:
         Returns:
             True if task exists, False otherwise
         """
-        all_tasks = self.get_all_tasks()
-
-        for task in all_tasks:
-            # Check if titles match (case-insensitive)
-            if task.get('title', '').lower() == title.lower():
-                # If project_id specified, also check project match
-                if project_id:
-                    if task.get('projectId') == project_id:
-                        return True
-                else:
-                    return True
+        # Titles are indexed once per fetch, so repeated checks are lookups
+        project_ids = self._cached_tasks()[1].get(title.lower())
+        if not project_ids:
+            return False
 
-        return False
+        # If project_id specified, also check project match
+        if project_id:
+            return project_id in project_ids
+        return True
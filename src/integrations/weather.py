@@ -1,13 +1,28 @@
 """Weather integration using Open-Meteo API (free, no API key required)."""
 
 import requests
-from typing import Dict, List, Optional, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 
+from ..utils.cache import get_cache
 from ..utils.config import get_config
 from ..utils.logger import get_logger
 
 
+# Transient Open-Meteo server errors are retried; the final response is
+# still returned so raise_for_status() reports it as before. A briefing
+# makes at most one forecast request and runs hours after the last, so a
+# pooled keep-alive session would have nothing to reuse.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[500, 502, 503, 504],
+    raise_on_status=False
+)
+
+
 class WeatherIntegration:
     """Handles weather data retrieval and analysis."""
 
@@ -24,46 +39,144 @@ class WeatherIntegration:
         self.longitude = longitude
         self.api_base = "https://api.open-meteo.com/v1/forecast"
 
+        # Forecasts persist across runs in the disk cache
+        self.cache = get_cache()
+        self.cache_ttl = self.config.get('weather.cache_ttl_seconds', 1800)
+
     def get_today_forecast(self) -> Optional[Dict[str, Any]]:
         """Get today's weather forecast.
 
+        A forecast fetched for the same location today within the cache
+        TTL is served from the disk cache without a network request.
+
         Returns:
             Dictionary with weather data
         """
+        return self.get_forecasts([(self.latitude, self.longitude)])[0]
+
+    def get_forecasts(self, locations: List[Tuple[float, float]]) -> List[Optional[Dict[str, Any]]]:
+        """Get today's weather forecast for several locations.
+
+        Cached forecasts are reused, and all remaining locations are
+        fetched in a single Open-Meteo request (the API accepts
+        comma-separated coordinates), so N locations cost one round trip.
+        Expired forecasts from today are revalidated with a conditional
+        request; a 304 response renews them without a download.
+
+        Args:
+            locations: (latitude, longitude) pairs
+
+        Returns:
+            List of forecast dictionaries (None where unavailable), in the
+            same order as locations
+        """
+        today = datetime.now().date().isoformat()
+        keys = [f"{latitude:.3f},{longitude:.3f},{today}" for latitude, longitude in locations]
+        forecasts = [
+            self.cache.get('weather_forecast', key, max_age=self.cache_ttl) for key in keys
+        ]
+
+        missing = [i for i, forecast in enumerate(forecasts) if forecast is None]
+        if not missing:
+            return forecasts
+
+        # Validators from the last fetch of this exact batch are only usable
+        # while all of its (expired) forecasts are still on disk
+        batch_key = '|'.join(keys[i] for i in missing)
+        stale = [self.cache.get('weather_forecast', keys[i]) for i in missing]
+        headers = {}
+        if all(forecast is not None for forecast in stale):
+            validators = self.cache.get('weather_validators', batch_key) or {}
+            if validators.get('etag'):
+                headers['If-None-Match'] = validators['etag']
+            if validators.get('last_modified'):
+                headers['If-Modified-Since'] = validators['last_modified']
+
         try:
             params = {
-                'latitude': self.latitude,
-                'longitude': self.longitude,
+                'latitude': ','.join(str(locations[i][0]) for i in missing),
+                'longitude': ','.join(str(locations[i][1]) for i in missing),
                 'hourly': 'temperature_2m,precipitation,precipitation_probability,weathercode',
                 'daily': 'temperature_2m_max,temperature_2m_min,precipitation_sum,weathercode',
                 'timezone': 'auto',
                 'forecast_days': 1
             }
 
-            response = requests.get(self.api_base, params=params, timeout=10)
+            with requests.Session() as session:
+                session.mount('https://', HTTPAdapter(max_retries=_RETRY))
+                response = session.get(self.api_base, params=params, headers=headers, timeout=10)
+
+            if response.status_code == 304:
+                # Unchanged since the last fetch; renew the cached copies
+                for i, forecast in zip(missing, stale):
+                    self.cache.set('weather_forecast', keys[i], forecast)
+                    forecasts[i] = forecast
+                return forecasts
+
             response.raise_for_status()
             data = response.json()
 
-            # Parse response
-            daily = data.get('daily', {})
-            hourly = data.get('hourly', {})
-
-            forecast = {
-                'temp_min': daily.get('temperature_2m_min', [0])[0],
-                'temp_max': daily.get('temperature_2m_max', [0])[0],
-                'precipitation_total': daily.get('precipitation_sum', [0])[0],
-                'hourly_temps': hourly.get('temperature_2m', []),
-                'hourly_precipitation': hourly.get('precipitation', []),
-                'hourly_times': hourly.get('time', []),
-                'weathercode': daily.get('weathercode', [0])[0]
-            }
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self.cache.set('weather_validators', batch_key, {
+                    'etag': etag,
+                    'last_modified': last_modified
+                })
+
+            # A single location comes back as one object, several as a list
+            results = data if isinstance(data, list) else [data]
 
-            self.logger.info(f"Retrieved weather: {forecast['temp_min']}-{forecast['temp_max']}°C")
-            return forecast
+            for i, result in zip(missing, results):
+                forecast = self._parse_forecast(result)
+                self.logger.info(f"Retrieved weather: {forecast['temp_min']}-{forecast['temp_max']}°C")
+                self.cache.set('weather_forecast', keys[i], forecast)
+                forecasts[i] = forecast
 
         except Exception as e:
             self.logger.error(f"Error getting weather: {e}")
-            return None
+
+        return forecasts
+
+    def _parse_forecast(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse one location's Open-Meteo response.
+
+        Args:
+            data: Forecast response for a single location
+
+        Returns:
+            Forecast dictionary
+        """
+        daily = data.get('daily', {})
+        hourly = data.get('hourly', {})
+        hourly_times = hourly.get('time', [])
+
+        return {
+            'temp_min': daily.get('temperature_2m_min', [0])[0],
+            'temp_max': daily.get('temperature_2m_max', [0])[0],
+            'precipitation_total': daily.get('precipitation_sum', [0])[0],
+            'hourly_temps': hourly.get('temperature_2m', []),
+            'hourly_precipitation': hourly.get('precipitation', []),
+            'hourly_times': hourly_times,
+            # Hour of day for each entry, parsed once here for every consumer
+            'hourly_hours': [datetime.fromisoformat(time_str).hour for time_str in hourly_times],
+            'weathercode': daily.get('weathercode', [0])[0]
+        }
+
+    def _hourly_hours(self, forecast: Dict[str, Any]) -> List[int]:
+        """Get the hour of day for each hourly forecast entry.
+
+        Args:
+            forecast: Forecast data from get_today_forecast()
+
+        Returns:
+            List of hours, parallel to hourly_times
+        """
+        hours = forecast.get('hourly_hours')
+        if hours is None:
+            # Forecast built without the precomputed hours
+            hours = [datetime.fromisoformat(time_str).hour for time_str in forecast.get('hourly_times', [])]
+        return hours
 
     def get_rain_periods(self, forecast: Dict[str, Any]) -> List[Dict[str, str]]:
         """Extract rain periods from hourly forecast.
@@ -80,14 +193,13 @@ class WeatherIntegration:
             return rain_periods
 
         hourly_precip = forecast.get('hourly_precipitation', [])
-        hourly_times = forecast.get('hourly_times', [])
+        hourly_hours = self._hourly_hours(forecast)
 
         current_period = None
 
         for i, precip in enumerate(hourly_precip):
             if precip > 0.1:  # Threshold for rain (mm)
-                time_str = hourly_times[i]
-                hour = datetime.fromisoformat(time_str).hour
+                hour = hourly_hours[i]
 
                 if current_period is None:
                     current_period = {'start': hour, 'end': hour}
@@ -120,7 +232,7 @@ class WeatherIntegration:
         temp_min = forecast.get('temp_min', 0)
         temp_max = forecast.get('temp_max', 0)
         hourly_temps = forecast.get('hourly_temps', [])
-        hourly_times = forecast.get('hourly_times', [])
+        hourly_hours = self._hourly_hours(forecast)
 
         # Temperature descriptions with personality
         if temp_min < 0:
@@ -141,13 +253,13 @@ class WeatherIntegration:
             else:
                 advice.append(f"{morning_desc}. Dress warmly!")
 
-        # Find evening temperature (18:00-22:00)
+        # Find evening temperature (18:00-22:00); the latest hour in the
+        # window wins, so scan backwards and stop at the first match
         evening_temp = None
-        for i, time_str in enumerate(hourly_times):
-            hour = datetime.fromisoformat(time_str).hour
-            if 18 <= hour <= 22:
-                if evening_temp is None or i < len(hourly_temps):
-                    evening_temp = hourly_temps[i] if i < len(hourly_temps) else None
+        for i in range(min(len(hourly_hours), len(hourly_temps)) - 1, -1, -1):
+            if 18 <= hourly_hours[i] <= 22:
+                evening_temp = hourly_temps[i]
+                break
 
         if evening_temp and evening_temp < 10:
             advice.append(f"Evening gets chilly at {int(evening_temp)}°C - grab a jacket if you're heading out!")
@@ -226,20 +338,19 @@ class WeatherIntegration:
         if not forecast:
             return warnings
 
-        rain_periods = self.get_rain_periods(forecast)
+        # Mark every rainy hour of the day once so each event is one lookup
+        rain_hours = [False] * 24
+        for period in self.get_rain_periods(forecast):
+            for hour in range(period['start'], period['end'] + 1):
+                rain_hours[hour] = True
 
         for event in events:
             start_time = event.get('start')
             if not start_time:
                 continue
 
-            event_hour = start_time.hour
-            event_summary = event.get('summary', 'Event')
-
             # Check if event time overlaps with rain
-            for period in rain_periods:
-                if period['start'] <= event_hour <= period['end']:
-                    warnings[event_summary] = "☂️"
-                    break
+            if rain_hours[start_time.hour]:
+                warnings[event.get('summary', 'Event')] = "☂️"
 
         return warnings
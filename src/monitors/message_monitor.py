@@ -1,16 +1,33 @@
 """iMessage monitoring service."""
 
+import os
+import select
 import time
-import json
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 from pathlib import Path
 
 from ..integrations.imessage import iMessageIntegration
 from ..utils.config import get_config
+from ..utils.json_io import dumps_json, loads_json
 from ..utils.logger import get_logger
 
 
+# Most recent processed message IDs remembered in state
+_MAX_PROCESSED_IDS = 1000
+
+# Polls without new messages between state saves; polls that find new
+# messages always save
+_STATE_SAVE_INTERVAL_POLLS = 10
+
+# kqueue (macOS/BSD) lets the monitor sleep until chat.db is written
+KQUEUE_AVAILABLE = hasattr(select, 'kqueue')
+
+# Open files for event notification only, so the watch never blocks unmounts
+_O_EVTONLY = getattr(os, 'O_EVTONLY', os.O_RDONLY)
+
+
 class MessageMonitor:
     """Monitors iMessage for new messages and activation keywords."""
 
@@ -30,8 +47,19 @@ class MessageMonitor:
         self.state_file = state_file
         self.state = self._load_state()
 
+        # Processed IDs in arrival order, plus a set for O(1) membership;
+        # the oldest ID is evicted from both once the deque is full
+        self._processed_ids = deque(self.state.get('processed_messages', []), maxlen=_MAX_PROCESSED_IDS)
+        self._processed_set = set(self._processed_ids)
+        self._polls_since_save = 0
+
+        # MAX(ROWID) seen by the last full check; unchanged means no new rows
+        self._last_seen_rowid: Optional[int] = None
+
         # Activation keywords from config
         self.activation_keywords = self.config.get('imessage.activation_keywords', [])
+        # (keyword, lowercased keyword), so matching never re-lowercases
+        self._keywords_lower = [(keyword, keyword.lower()) for keyword in self.activation_keywords]
 
         # Poll interval
         self.poll_interval = self.config.imessage_poll_interval
@@ -39,6 +67,12 @@ class MessageMonitor:
         # Running flag
         self.running = False
 
+        # kqueue watching chat.db and its WAL file while monitoring
+        self._kqueue: Optional[Any] = None
+        self._watch_fds: List[int] = []
+        # Whether a file to watch did not exist yet, so opening is retried
+        self._watch_incomplete = False
+
     def _load_state(self) -> Dict:
         """Load state from file.
 
@@ -47,10 +81,9 @@ class MessageMonitor:
         """
         if self.state_file.exists():
             try:
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
-                    self.logger.info(f"Loaded state from {self.state_file}")
-                    return state
+                state = loads_json(self.state_file.read_bytes())
+                self.logger.info(f"Loaded state from {self.state_file}")
+                return state
             except Exception as e:
                 self.logger.error(f"Error loading state: {e}")
 
@@ -65,8 +98,7 @@ class MessageMonitor:
         """Save state to file."""
         try:
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2, default=str)
+            self.state_file.write_bytes(dumps_json(self.state, default=str))
             self.logger.debug("Saved state")
         except Exception as e:
             self.logger.error(f"Error saving state: {e}")
@@ -78,6 +110,17 @@ class MessageMonitor:
             List of new messages
         """
         try:
+            # Skip the message query entirely when no row was added since the
+            # last check (one indexed MAX lookup)
+            max_rowid = self.imessage.get_max_rowid()
+            if max_rowid == self._last_seen_rowid:
+                self.state['last_check'] = datetime.now().isoformat()
+                self._polls_since_save += 1
+                if self._polls_since_save >= _STATE_SAVE_INTERVAL_POLLS:
+                    self._save_state()
+                    self._polls_since_save = 0
+                return []
+
             # Get last check time
             last_check = self.state.get('last_check')
             if last_check:
@@ -90,8 +133,8 @@ class MessageMonitor:
             messages = self.imessage.get_recent_messages(limit=100, since=since)
 
             # Filter out already processed messages
-            processed_ids = set(self.state.get('processed_messages', []))
-            new_messages = [msg for msg in messages if msg['id'] not in processed_ids]
+            processed_set = self._processed_set
+            new_messages = [msg for msg in messages if msg['id'] not in processed_set]
 
             # Filter out messages from self
             new_messages = [msg for msg in new_messages if not msg['is_from_me']]
@@ -101,13 +144,24 @@ class MessageMonitor:
                 latest_id = max(msg['id'] for msg in messages)
                 self.state['last_message_id'] = latest_id
 
+            # Keep only recent processed messages (last 1000)
+            processed_ids = self._processed_ids
             for msg in new_messages:
-                processed_ids.add(msg['id'])
+                if len(processed_ids) == processed_ids.maxlen:
+                    processed_set.discard(processed_ids[0])
+                processed_ids.append(msg['id'])
+                processed_set.add(msg['id'])
 
-            # Keep only recent processed messages (last 1000)
-            self.state['processed_messages'] = list(processed_ids)[-1000:]
+            self.state['processed_messages'] = list(processed_ids)
             self.state['last_check'] = datetime.now().isoformat()
-            self._save_state()
+            self._last_seen_rowid = max_rowid
+
+            # Idle polls only move last_check, which is kept in memory, so
+            # they are written out periodically rather than every time
+            self._polls_since_save += 1
+            if new_messages or self._polls_since_save >= _STATE_SAVE_INTERVAL_POLLS:
+                self._save_state()
+                self._polls_since_save = 0
 
             if new_messages:
                 self.logger.info(f"Found {len(new_messages)} new message(s)")
@@ -132,8 +186,8 @@ class MessageMonitor:
         for msg in messages:
             text = msg.get('text', '').lower()
 
-            for keyword in self.activation_keywords:
-                if keyword.lower() in text:
+            for keyword, keyword_lower in self._keywords_lower:
+                if keyword_lower in text:
                     self.logger.info(f"Activation keyword '{keyword}' detected in message from {msg.get('sender')}")
                     msg['activation_keyword'] = keyword
                     activated_messages.append(msg)
@@ -161,6 +215,7 @@ class MessageMonitor:
         """Start monitoring iMessages in a loop."""
         self.logger.info("Starting iMessage monitor...")
         self.running = True
+        self._open_watch()
 
         try:
             while self.running:
@@ -174,8 +229,8 @@ class MessageMonitor:
                     for msg in activated:
                         self.handle_activated_message(msg)
 
-                # Sleep before next check
-                time.sleep(self.poll_interval)
+                # Wait for the next database write, or the poll interval
+                self._wait_for_change(self.poll_interval)
 
         except KeyboardInterrupt:
             self.logger.info("Monitor stopped by user")
@@ -183,8 +238,92 @@ class MessageMonitor:
             self.logger.error(f"Error in monitoring loop: {e}")
         finally:
             self.running = False
+            self._close_watch()
             self._save_state()
 
+    def _open_watch(self) -> None:
+        """Start watching the iMessage database for writes, where kqueue exists.
+
+        Messages is a WAL-mode SQLite database, so new messages land in
+        chat.db-wal first and reach chat.db at checkpoints; both are watched.
+        A file that does not exist yet is picked up by a later reopen.
+        """
+        self._watch_incomplete = False
+        if not KQUEUE_AVAILABLE:
+            return
+
+        db_path = self.config.imessage_database_path
+        paths = [db_path, db_path.with_name(f"{db_path.name}-wal")]
+
+        try:
+            self._kqueue = select.kqueue()
+            changes = []
+            for path in paths:
+                if not path.exists():
+                    self._watch_incomplete = True
+                    continue
+                fd = os.open(path, _O_EVTONLY)
+                self._watch_fds.append(fd)
+                changes.append(select.kevent(
+                    fd,
+                    filter=select.KQ_FILTER_VNODE,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                    fflags=(select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND |
+                            select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME)
+                ))
+            if not changes:
+                # Nothing to watch; fall back to plain polling
+                self._close_watch()
+                return
+            self._kqueue.control(changes, 0)
+        except OSError as e:
+            self.logger.warning(f"Cannot watch iMessage database, polling instead: {e}")
+            self._watch_incomplete = False
+            self._close_watch()
+
+    def _close_watch(self) -> None:
+        """Stop watching the iMessage database."""
+        for fd in self._watch_fds:
+            os.close(fd)
+        self._watch_fds = []
+        if self._kqueue is not None:
+            self._kqueue.close()
+            self._kqueue = None
+
+    def _wait_for_change(self, timeout: float) -> None:
+        """Block until the iMessage database is written or the timeout passes.
+
+        Without kqueue this is a plain sleep, as before. If the watch fails
+        while waiting, the monitor falls back to plain polling.
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        if self._kqueue is None:
+            time.sleep(timeout)
+            # Neither file existed when the watch was opened; they may now
+            if self._watch_incomplete:
+                self._open_watch()
+            return
+
+        try:
+            events = self._kqueue.control(None, len(self._watch_fds), timeout)
+        except OSError as e:
+            self.logger.warning(f"Lost watch on iMessage database, polling instead: {e}")
+            self._close_watch()
+            self._watch_incomplete = False
+            time.sleep(timeout)
+            return
+
+        # A replaced or removed file (e.g. WAL reset) needs fresh descriptors,
+        # and a file that was missing (e.g. no WAL yet) may exist now
+        replaced = any(
+            event.fflags & (select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME) for event in events
+        )
+        if replaced or (not events and self._watch_incomplete):
+            self._close_watch()
+            self._open_watch()
+
     def stop_monitoring(self) -> None:
         """Stop the monitoring loop."""
         self.logger.info("Stopping iMessage monitor...")
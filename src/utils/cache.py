@@ -0,0 +1,125 @@
+"""Persistent key-value cache for personal assistant."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from .config import get_config
+
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS entries (
+        namespace TEXT NOT NULL,
+        key TEXT NOT NULL,
+        value TEXT NOT NULL,
+        fetched_at REAL NOT NULL,
+        PRIMARY KEY (namespace, key)
+    ) WITHOUT ROWID;
+"""
+
+
+class DiskCache:
+    """SQLite-backed cache of JSON values that survives restarts."""
+
+    def __init__(self, path: Path):
+        """Initialize the cache.
+
+        Args:
+            path: Path to the cache database file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            namespace: Cache namespace (e.g., 'notion_page')
+            key: Entry key within the namespace
+            max_age: Maximum age in seconds; older entries are ignored
+
+        Returns:
+            Cached value, or None if missing or too old
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, fetched_at FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+
+        if row is None:
+            return None
+        if max_age is not None and time.time() - row[1] >= max_age:
+            return None
+        return json.loads(row[0])
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Store a value.
+
+        Args:
+            namespace: Cache namespace
+            key: Entry key within the namespace
+            value: JSON-serializable value
+        """
+        data = json.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (namespace, key, data, time.time())
+            )
+
+    def delete(self, namespace: str, key: Optional[str] = None) -> None:
+        """Remove one entry, or a whole namespace.
+
+        Args:
+            namespace: Cache namespace
+            key: Entry key (removes the whole namespace if None)
+        """
+        with self._lock:
+            if key is None:
+                self._conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+            else:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+                )
+
+    def prune(self, namespace: str, max_age: float) -> None:
+        """Remove entries in a namespace older than max_age.
+
+        Args:
+            namespace: Cache namespace
+            max_age: Maximum age in seconds to keep
+        """
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM entries WHERE namespace = ? AND fetched_at < ?",
+                (namespace, time.time() - max_age)
+            )
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
+
+
+# Global cache instance
+_cache = None
+
+
+def get_cache() -> DiskCache:
+    """Get or create the global disk cache.
+
+    Returns:
+        DiskCache instance
+    """
+    global _cache
+    if _cache is None:
+        _cache = DiskCache(get_config().cache_file)
+    return _cache
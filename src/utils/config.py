@@ -2,10 +2,41 @@
 
 import os
 import yaml
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, Tuple
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Config properties memoized with cached_property
+_CACHED_PROPERTIES = (
+    'notion_token', 'imessage_database_path', 'imessage_cache_path',
+    'log_file', 'state_file', 'cache_file'
+)
+
+
+def _flatten(node: Dict[str, Any], prefix: str = '') -> Iterator[Tuple[str, Any]]:
+    """Yield (dotted path, value) for every key in a nested dict, sections included.
+
+    Args:
+        node: Nested configuration dict
+        prefix: Dotted path of node, with a trailing dot
+
+    Yields:
+        (dotted path, value) pairs
+    """
+    for key, value in node.items():
+        path = f"{prefix}{key}"
+        yield path, value
+        if isinstance(value, dict):
+            yield from _flatten(value, f"{path}.")
+
 
 class Config:
     """Configuration manager for the personal assistant."""
@@ -28,7 +59,10 @@ class Config:
 
         # Load configuration
         with open(config_path, 'r') as f:
-            self._config = yaml.safe_load(f)
+            self._config = yaml.load(f, Loader=_YamlLoader) or {}
+
+        # Every dotted path resolved up front, so get() is one dict lookup
+        self._flat = dict(_flatten(self._config))
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value using dot notation.
@@ -45,16 +79,25 @@ class Config:
             >>> config.get('imessage.poll_interval_seconds')
             30
         """
-        keys = key_path.split('.')
-        value = self._config
+        return self._flat.get(key_path, default)
 
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
+    def set(self, key_path: str, value: Any) -> None:
+        """Override a configuration value using dot notation.
 
-        return value
+        Args:
+            key_path: Path to config value (e.g., 'imessage.enabled')
+            value: New value
+        """
+        keys = key_path.split('.')
+        node = self._config
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        node[keys[-1]] = value
+
+        self._flat = dict(_flatten(self._config))
+        # Derived values are recomputed on next access
+        for name in _CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
 
     def get_env(self, env_var: str, default: Any = None) -> Any:
         """Get environment variable.
@@ -68,7 +111,7 @@ class Config:
         """
         return os.getenv(env_var, default)
 
-    @property
+    @cached_property
     def notion_token(self) -> str:
         """Get Notion API token from environment."""
         env_var = self.get('notion.token_env_var', 'NOTION_TOKEN')
@@ -87,12 +130,17 @@ class Config:
         """Check if iMessage monitoring is enabled."""
         return self.get('imessage.enabled', False)
 
-    @property
+    @cached_property
     def imessage_database_path(self) -> Path:
         """Get iMessage database path."""
         path = self.get('imessage.database_path', '~/Library/Messages/chat.db')
         return Path(path).expanduser()
 
+    @cached_property
+    def imessage_cache_path(self) -> Path:
+        """Get path of the local iMessage summary cache database."""
+        return self.base_dir / self.get('imessage.cache_file', 'data/imessage_cache.db')
+
     @property
     def imessage_poll_interval(self) -> int:
         """Get iMessage poll interval in seconds."""
@@ -113,16 +161,21 @@ class Config:
         """Get logging level."""
         return self.get('logging.level', 'INFO')
 
-    @property
+    @cached_property
     def log_file(self) -> Path:
         """Get log file path."""
         return self.base_dir / self.get('logging.file', 'logs/assistant.log')
 
-    @property
+    @cached_property
     def state_file(self) -> Path:
         """Get state file path."""
         return self.base_dir / self.get('state.file', 'data/state.json')
 
+    @cached_property
+    def cache_file(self) -> Path:
+        """Get persistent cache database path."""
+        return self.base_dir / self.get('cache.file', 'data/cache.db')
+
     def __getitem__(self, key: str) -> Any:
         """Allow dict-like access."""
         return self.get(key)
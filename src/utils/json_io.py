@@ -0,0 +1,40 @@
+"""JSON encoding helpers that use orjson when it is installed."""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def loads_json(data: bytes) -> Any:
+    """Decode JSON bytes.
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        Decoded value
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(value: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode a value as two-space indented JSON bytes.
+
+    Args:
+        value: Value to encode
+        default: Fallback converter for unsupported types
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=default, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2, default=default).encode('utf-8')
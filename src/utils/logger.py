@@ -1,12 +1,22 @@
 """Logging utilities for personal assistant."""
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, List, Optional, Tuple
 
-from .config import get_config
+from .config import Config, get_config
+
+
+# Handlers shared by every logger set up with the same file and settings,
+# so each log file is opened (and rotated) by a single handler
+_shared_handlers: Dict[Tuple[Path, str, int, int], List[logging.Handler]] = {}
+
+# Loggers already handed out by get_logger, so repeat calls are one lookup
+_logger_cache: Dict[str, logging.Logger] = {}
 
 
 def setup_logger(
@@ -38,9 +48,6 @@ def setup_logger(
     if log_file is None:
         log_file = config.log_file
 
-    # Ensure log directory exists
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
@@ -48,6 +55,46 @@ def setup_logger(
     # Remove existing handlers
     logger.handlers.clear()
 
+    for handler in _get_handlers(log_file, level, max_bytes, backup_count, config):
+        logger.addHandler(handler)
+
+    return logger
+
+
+def _get_handlers(
+    log_file: Path,
+    level: str,
+    max_bytes: int,
+    backup_count: int,
+    config: Config
+) -> List[logging.Handler]:
+    """Get the handlers for a logging setup, creating them once.
+
+    Loggers get a single QueueHandler; the console and file handlers run on
+    a background QueueListener thread, so a log call only enqueues the
+    record and the stream and disk writes stay off the caller's thread.
+    The listener is stopped (and the queue flushed) at exit.
+
+    Setting PA_DISABLE_FILE_LOG=1 skips the file handler, so one-shot CLI
+    runs neither create the log directory nor open the log file.
+
+    Args:
+        log_file: Path to log file
+        level: Log level name
+        max_bytes: Maximum size of log file before rotation
+        backup_count: Number of backup files to keep
+        config: Config instance
+
+    Returns:
+        List of handlers
+    """
+    key = (log_file, level.upper(), max_bytes, backup_count)
+    handlers = _shared_handlers.get(key)
+    if handlers is not None:
+        return handlers
+
+    handlers = []
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, level.upper()))
@@ -56,23 +103,34 @@ def setup_logger(
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-
-    # File handler with rotation
-    file_handler = RotatingFileHandler(
-        log_file,
-        maxBytes=max_bytes,
-        backupCount=backup_count
-    )
-    file_handler.setLevel(getattr(logging, level.upper()))
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
-
-    return logger
+    handlers.append(console_handler)
+
+    if config.get_env('PA_DISABLE_FILE_LOG') != '1':
+        # Ensure log directory exists
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # File handler with rotation
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=max_bytes,
+            backupCount=backup_count
+        )
+        file_handler.setLevel(getattr(logging, level.upper()))
+        file_formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        file_handler.setFormatter(file_formatter)
+        handlers.append(file_handler)
+
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    handlers = [QueueHandler(log_queue)]
+    _shared_handlers[key] = handlers
+    return handlers
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -84,10 +142,15 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
+    logger = _logger_cache.get(name)
+    if logger is not None:
+        return logger
+
     logger = logging.getLogger(name)
 
     # If logger has no handlers, set it up
     if not logger.handlers:
-        return setup_logger(name)
+        logger = setup_logger(name)
 
+    _logger_cache[name] = logger
     return logger
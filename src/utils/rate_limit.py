@@ -0,0 +1,42 @@
+"""Client-side rate limiting for personal assistant API calls."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket that paces calls to a steady rate.
+
+    Up to ``burst`` calls go through immediately; after that callers wait
+    so the long-run rate stays at ``rate`` calls per second.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum tokens the bucket holds
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available.
+
+        The token is reserved under the lock and the wait happens outside
+        it, so concurrent callers queue up in order without blocking each
+        other's bookkeeping.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
@@ -2,20 +2,100 @@
 
 import re
 import os
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from datetime import datetime, timedelta, date
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
 from pathlib import Path
+
+# Columns are OCR'd in parallel, so keep each tesseract single-threaded
+# instead of letting OpenMP oversubscribe the cores (set before import)
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
 import pytesseract
 from PIL import Image
-from pdf2image import convert_from_path
 
 from ..integrations.imessage import iMessageIntegration
 from ..integrations.ticktick_oauth import TickTickOAuth
 from ..integrations.google_calendar import GoogleCalendarIntegration
 from ..integrations.school_plan_scanner import SchoolPlanScanner
+from ..utils.cache import get_cache
 from ..utils.config import get_config
 from ..utils.logger import get_logger
 
+try:
+    import fitz
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    fitz = None
+    PYMUPDF_AVAILABLE = False
+
+try:
+    from pdf2image import convert_from_path
+    PDF2IMAGE_AVAILABLE = True
+except ImportError:
+    convert_from_path = None
+    PDF2IMAGE_AVAILABLE = False
+
+try:
+    from tesserocr import PyTessBaseAPI, PSM
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    PyTessBaseAPI = None
+    PSM = None
+    TESSEROCR_AVAILABLE = False
+
+
+# OCR languages and page segmentation mode for the tesseract CLI
+# (6 = single uniform block, PSM.SINGLE_BLOCK in tesserocr)
+_OCR_LANG = 'nor+eng'
+_OCR_PSM = 6
+
+# Page columns (across all pages of a PDF) are OCR'd concurrently, one
+# single-threaded tesseract per worker; capped since each tesserocr worker
+# holds its own copy of the language models
+_OCR_WORKERS = min(4, os.cpu_count() or 2)
+_OCR_EXECUTOR = ThreadPoolExecutor(max_workers=_OCR_WORKERS)
+
+# TickTick tasks for a plan are created concurrently (the client is a
+# pooled, rate-limited session)
+_TASK_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Calendar calls run in order on one worker, alongside the task creation,
+# since the Google API client is not thread-safe
+_CALENDAR_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# Read size when hashing attachments, so large PDFs are never fully buffered
+_HASH_CHUNK_SIZE = 64 * 1024
+
+# A PDF page with at least this much embedded text is read directly
+# instead of being rendered and OCR'd
+_MIN_TEXT_LAYER_CHARS = 50
+
+# Common Norwegian words in event descriptions that aren't event names
+_EVENT_NAME_SKIP_WORDS = frozenset({'blir', 'er', 'på', 'i', 'kl.', 'klokken'})
+
+# Norwegian month names and abbreviations
+_NORWEGIAN_MONTHS = {
+    'januar': 1, 'jan': 1,
+    'februar': 2, 'feb': 2,
+    'mars': 3, 'mar': 3,
+    'april': 4, 'apr': 4,
+    'mai': 5,
+    'juni': 6, 'jun': 6,
+    'juli': 7, 'jul': 7,
+    'august': 8, 'aug': 8,
+    'september': 9, 'sep': 9,
+    'oktober': 10, 'okt': 10,
+    'november': 11, 'nov': 11,
+    'desember': 12, 'des': 12
+}
+
+# Day and month in dates like '9.desember' or '9 des'
+_NORWEGIAN_DATE_RE = re.compile(r'(\d{1,2})[\.\s]+(\w+)', re.IGNORECASE)
+
 
 class SchoolPlanProcessor:
     """Processes school weekly plans from iMessages."""
@@ -25,18 +105,71 @@ class SchoolPlanProcessor:
         self.config = get_config()
         self.logger = get_logger(__name__)
 
-        # Initialize integrations
-        self.imessage = iMessageIntegration()
-        self.ticktick = TickTickOAuth()
-        self.calendar = GoogleCalendarIntegration()
-        self.scanner = SchoolPlanScanner()
-
-        # Check availability
-        if not self.imessage.is_available():
+        # PDF render resolution; OCR time grows with pixel count
+        self.ocr_dpi = self.config.get('school_plans.ocr_dpi', 200)
+
+        # OCR text persists across runs, keyed by file content hash
+        self.cache = get_cache()
+        self.ocr_cache_ttl = self.config.get('school_plans.ocr_cache_ttl_seconds', 2592000)
+        self.processed_ttl = self.config.get('school_plans.processed_ttl_seconds', 2592000)
+
+        # (lowercased title, project ID, due date) of existing TickTick
+        # tasks, built once per processed plan for duplicate checks
+        self._task_index: Optional[Set[Tuple[str, Optional[str], Optional[date]]]] = None
+        self._task_lock = threading.Lock()
+
+        # Handeliew events calendar ID and Homework project ID, looked up
+        # once per message scan (or processor, for direct calls)
+        self._handeliew_calendar_id: Optional[str] = None
+        self._homework_project_id: Optional[str] = None
+
+        # (first date, last date, {(lowercased summary, start date)}) of the
+        # calendar events spanning the plan being processed
+        self._calendar_index: Optional[Tuple[date, date, Set[Tuple[str, str]]]] = None
+
+        # In-process Tesseract engines, one per OCR thread (an engine is not
+        # thread-safe), created on first use and reused for every page
+        self._tess_local = threading.local()
+        self._tess_apis = []
+        self._tess_failed = False
+        self._tess_lock = threading.Lock()
+
+    @cached_property
+    def imessage(self) -> iMessageIntegration:
+        """iMessage integration, created on first use."""
+        imessage = iMessageIntegration()
+        if not imessage.is_available():
             self.logger.warning("iMessage not available")
+        return imessage
 
-        if not self.ticktick.is_available():
+    @cached_property
+    def ticktick(self) -> TickTickOAuth:
+        """TickTick integration, created on first use."""
+        ticktick = TickTickOAuth()
+        if not ticktick.is_available():
             self.logger.warning("TickTick not available")
+        return ticktick
+
+    def _ensure_ticktick(self) -> TickTickOAuth:
+        """Create the TickTick integration before worker threads use it.
+
+        cached_property does not lock, so homework workers reaching it
+        first would each build a client.
+
+        Returns:
+            TickTick integration
+        """
+        return self.ticktick
+
+    @cached_property
+    def calendar(self) -> GoogleCalendarIntegration:
+        """Google Calendar integration, created on first use."""
+        return GoogleCalendarIntegration()
+
+    @cached_property
+    def scanner(self) -> SchoolPlanScanner:
+        """School plan text scanner, created on first use."""
+        return SchoolPlanScanner()
 
     def process_recent_messages(
         self,
@@ -61,19 +194,27 @@ class SchoolPlanProcessor:
             'errors': []
         }
 
+        # Look the calendar and project up again for each scan
+        self._handeliew_calendar_id = None
+        self._homework_project_id = None
+
         try:
-            # Get messages with attachments from sender
+            # Get messages from sender with PDF or image attachments whose
+            # filename contains "ukeplan" (filtered in the query)
             since = datetime.now() - timedelta(hours=hours_back)
             attachments = self.imessage.get_message_attachments(
                 sender=sender,
                 since=since,
-                limit=20
+                limit=20,
+                mime_prefixes=('image/', 'application/pdf'),
+                filename_contains='ukeplan'
             )
 
             results['messages_checked'] = len(attachments)
-            self.logger.info(f"Found {len(attachments)} messages from {sender} with attachments")
+            self.logger.info(f"Found {len(attachments)} messages from {sender} with school plan attachments")
 
-            # Track processed attachments to avoid duplicates
+            # Track processed attachments to avoid duplicates; plans are also
+            # recognized by content across runs, even under another path
             processed_paths = set()
 
             for attachment in attachments:
@@ -81,15 +222,7 @@ class SchoolPlanProcessor:
                 if not attachment_path or attachment_path in processed_paths:
                     continue
 
-                # Only process PDF and image files
-                mime_type = attachment.get('mime_type', '')
-                if not (mime_type.startswith('image/') or mime_type == 'application/pdf'):
-                    continue
-
-                # Check if filename contains "ukeplan" (case insensitive)
                 filename = Path(attachment_path).name.lower()
-                if 'ukeplan' not in filename:
-                    continue
 
                 # Extract child name and week from filename
                 # Expected format: "Ukeplan uke 48.pdf" or similar
@@ -102,6 +235,12 @@ class SchoolPlanProcessor:
                 week_start = self._determine_week_start(attachment.get('date'))
 
                 try:
+                    digest = self._file_digest(attachment_path)
+                    if self.cache.get('school_plan_processed', digest, max_age=self.processed_ttl):
+                        self.logger.info(f"School plan already processed, skipping: {filename}")
+                        processed_paths.add(attachment_path)
+                        continue
+
                     self.logger.info(f"Processing school plan: {filename}")
                     msg_results = self.process_image_file(
                         attachment_path,
@@ -116,6 +255,11 @@ class SchoolPlanProcessor:
 
                     processed_paths.add(attachment_path)
 
+                    # Only a cleanly processed plan is skipped next time
+                    if not msg_results.get('errors'):
+                        self.cache.set('school_plan_processed', digest, datetime.now().isoformat())
+                        self.cache.prune('school_plan_processed', self.processed_ttl)
+
                 except Exception as e:
                     error_msg = f"Error processing {filename}: {e}"
                     self.logger.error(error_msg)
@@ -194,6 +338,9 @@ class SchoolPlanProcessor:
             'events': []
         }
 
+        # Look up existing tasks fresh for each plan
+        self._task_index = None
+
         try:
             # Extract text from image using OCR
             self.logger.info(f"Extracting text from {image_path}")
@@ -214,11 +361,32 @@ class SchoolPlanProcessor:
             events = self.scanner.extract_events_from_text(text, child_name)
             self.logger.info(f"Found {len(events)} events")
 
-            # Add homework to TickTick
-            for item in homework_items:
+            if homework_items:
+                self._ensure_ticktick()
+
+            # Start adding homework to TickTick and events to the calendar
+            # (after fetching existing events for the plan's dates in one go)
+            homework_futures = [
+                _TASK_EXECUTOR.submit(self._add_homework_to_ticktick, item)
+                for item in homework_items
+            ]
+            index_future = _CALENDAR_EXECUTOR.submit(self._load_calendar_index, events)
+            try:
+                index_future.result()
+            except Exception as e:
+                # Events are then checked one query at a time
+                self.logger.error(f"Error loading calendar index: {e}")
+                self._calendar_index = None
+            event_futures = [
+                _CALENDAR_EXECUTOR.submit(self._add_event_to_calendars, event)
+                for event in events
+            ]
+
+            # Collect homework results
+            for item, future in zip(homework_items, homework_futures):
                 try:
                     task_title = self.scanner.format_task_title(item)
-                    self._add_homework_to_ticktick(item)
+                    future.result()
                     results['homework_added'] += 1
 
                     # Add title with full description for SMS (truncate at 100 chars if needed)
@@ -235,8 +403,8 @@ class SchoolPlanProcessor:
                     self.logger.error(error_msg)
                     results['errors'].append(error_msg)
 
-            # Add events to calendars
-            for event in events:
+            # Collect event results
+            for event, future in zip(events, event_futures):
                 try:
                     child = event.get('child', '')
                     event_title = self._format_event_title(event)
@@ -244,7 +412,7 @@ class SchoolPlanProcessor:
                     hour = event.get('hour', 8)
                     minute = event.get('minute', 0)
 
-                    self._add_event_to_calendars(event)
+                    future.result()
                     results['events_added'] += 1
 
                     # Add clean event name with day, date, and time for SMS
@@ -276,9 +444,41 @@ class SchoolPlanProcessor:
 
         return results
 
+    def _file_digest(self, path: str) -> str:
+        """Hash a file's contents, reading it in chunks.
+
+        Digests are remembered by path, size and modification time, so an
+        attachment seen on an earlier poll costs a stat and a cache lookup
+        instead of reading the whole file again.
+
+        Args:
+            path: Path to file
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        stat = os.stat(path)
+        stat_key = f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+        cached = self.cache.get('file_digest', stat_key, max_age=self.processed_ttl)
+        if cached:
+            return cached
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+
+        self.cache.set('file_digest', stat_key, digest.hexdigest())
+        self.cache.prune('file_digest', self.processed_ttl)
+        return digest.hexdigest()
+
     def _extract_text_from_image(self, image_path: str) -> str:
         """Extract text from image or PDF using OCR.
 
+        Text is cached by the SHA-256 of the file contents, so a plan that
+        is seen again (a later poll, or the same file sent twice) is not
+        OCR'd a second time.
+
         Args:
             image_path: Path to image or PDF file
 
@@ -286,20 +486,99 @@ class SchoolPlanProcessor:
             Extracted text with sections separated
         """
         try:
+            is_pdf = image_path.lower().endswith('.pdf')
+
+            digest = self._file_digest(image_path)
+            # PDF text depends on the render resolution
+            cache_key = f"{digest}:{self.ocr_dpi}" if is_pdf else digest
+            text = self.cache.get('ocr_text', cache_key, max_age=self.ocr_cache_ttl)
+            if text is not None:
+                self.logger.info(f"Using cached OCR text for {image_path}")
+                return text
+
             # Check if it's a PDF
-            if image_path.lower().endswith('.pdf'):
-                return self._extract_text_from_pdf(image_path)
+            if is_pdf:
+                text = self._extract_text_from_pdf(image_path)
+            else:
+                # Open image as grayscale, which is all tesseract uses
+                image = Image.open(image_path).convert('L')
 
-            # Open image
-            image = Image.open(image_path)
+                # Extract text from two-column layout
+                text = self._extract_text_two_column(image)
 
-            # Extract text from two-column layout
-            return self._extract_text_two_column(image)
+            self.cache.set('ocr_text', cache_key, text)
+            self.cache.prune('ocr_text', self.ocr_cache_ttl)
+            return text
 
         except Exception as e:
             self.logger.error(f"Error extracting text from {image_path}: {e}")
             raise
 
+    def _ocr(self, image: Image.Image) -> str:
+        """Run OCR on an image.
+
+        Uses the in-process tesserocr API when it is installed, which keeps
+        the language models loaded between calls; otherwise each call runs
+        the tesseract CLI through pytesseract.
+
+        Args:
+            image: PIL Image object
+
+        Returns:
+            Recognized text, stripped
+        """
+        # Tesseract only uses grayscale; pages are normally rendered as 'L'
+        # already, so this only converts images from other callers
+        if image.mode != 'L':
+            image = image.convert('L')
+
+        api = getattr(self._tess_local, 'api', None)
+        if api is None:
+            api = self._tess_local.api = self._open_tess_api()
+
+        if api:
+            api.SetImage(image)
+            return api.GetUTF8Text().strip()
+
+        return pytesseract.image_to_string(
+            image,
+            lang=_OCR_LANG,
+            config=f'--psm {_OCR_PSM}'
+        ).strip()
+
+    def _open_tess_api(self) -> Any:
+        """Create a tesserocr engine for the calling thread.
+
+        Returns:
+            PyTessBaseAPI instance, or False when tesserocr is unavailable
+        """
+        if not TESSEROCR_AVAILABLE or self._tess_failed:
+            return False
+
+        try:
+            api = PyTessBaseAPI(lang=_OCR_LANG, psm=PSM.SINGLE_BLOCK)
+        except Exception as e:
+            self.logger.warning(f"tesserocr unavailable, falling back to pytesseract: {e}")
+            self._tess_failed = True
+            return False
+
+        with self._tess_lock:
+            self._tess_apis.append(api)
+        return api
+
+    def close(self) -> None:
+        """Release the tesserocr engines, if any were created."""
+        with self._tess_lock:
+            for api in self._tess_apis:
+                api.End()
+            self._tess_apis = []
+            self._tess_local = threading.local()
+
+    def __del__(self):
+        """Release the tesserocr engines on garbage collection."""
+        for api in getattr(self, '_tess_apis', []):
+            api.End()
+
     def _extract_text_two_column(self, image: Image.Image) -> str:
         """Extract text from two-column layout (Mine lekser | Beskjeder).
 
@@ -309,63 +588,131 @@ class SchoolPlanProcessor:
         Returns:
             Text with sections marked
         """
-        try:
-            width, height = image.size
-            mid_x = width // 2
+        return self._extract_pages_two_column([image])[0]
+
+    def _extract_pages_two_column(self, images: Iterable[Any]) -> List[str]:
+        """Extract two-column text from several pages.
 
-            # Split into left and right columns
-            left_column = image.crop((0, 0, mid_x, height))
-            right_column = image.crop((mid_x, 0, width, height))
+        Both columns of each page are queued on the OCR pool as soon as the
+        page is available, so pages are recognized concurrently (and while
+        later pages are still rendering) rather than one after another.
 
-            # OCR each column separately
-            left_text = pytesseract.image_to_string(
-                left_column,
-                lang='nor+eng',
-                config='--psm 6'
-            ).strip()
+        Args:
+            images: PIL Image objects, one per page; a page given as a str
+                is already-extracted text and is passed through
+
+        Returns:
+            Text with sections marked, one entry per page
+        """
+        pages = []
+        for image in images:
+            if isinstance(image, str):
+                pages.append((None, image))
+                continue
 
-            right_text = pytesseract.image_to_string(
-                right_column,
-                lang='nor+eng',
-                config='--psm 6'
-            ).strip()
+            try:
+                width, height = image.size
+                mid_x = width // 2
+
+                # Split into left and right columns and OCR both at once
+                left_column = image.crop((0, 0, mid_x, height))
+                right_column = image.crop((mid_x, 0, width, height))
+                pages.append((image, (
+                    _OCR_EXECUTOR.submit(self._ocr, left_column),
+                    _OCR_EXECUTOR.submit(self._ocr, right_column)
+                )))
+            except Exception as e:
+                pages.append((image, e))
+
+        texts = []
+        for image, page in pages:
+            if isinstance(page, str):
+                texts.append(page)
+                continue
 
-            # Mark sections clearly
-            combined_text = f"=== MINE LEKSER ===\n{left_text}\n\n=== BESKJEDER ===\n{right_text}"
+            try:
+                if isinstance(page, Exception):
+                    raise page
 
-            return combined_text
+                left_future, right_future = page
+                left_text = left_future.result()
+                right_text = right_future.result()
 
-        except Exception as e:
-            self.logger.error(f"Error extracting two-column text: {e}")
-            # Fall back to single-column extraction
-            return pytesseract.image_to_string(
-                image,
-                lang='nor+eng',
-                config='--psm 6'
-            ).strip()
+                texts.append(self._format_two_column(left_text, right_text))
 
-    def _extract_text_from_pdf(self, pdf_path: str) -> str:
-        """Extract text from PDF using OCR.
+            except Exception as e:
+                self.logger.error(f"Error extracting two-column text: {e}")
+                # Fall back to single-column extraction
+                texts.append(self._ocr(image))
+
+        return texts
+
+    def _format_two_column(self, left_text: str, right_text: str) -> str:
+        """Combine column texts with their sections marked.
+
+        Args:
+            left_text: Mine lekser column text
+            right_text: Beskjeder column text
+
+        Returns:
+            Text with sections marked
+        """
+        return f"=== MINE LEKSER ===\n{left_text}\n\n=== BESKJEDER ===\n{right_text}"
+
+    def _render_pdf_pages(self, pdf_path: str, dpi: int) -> Iterator[Any]:
+        """Render PDF pages to grayscale images.
+
+        Uses PyMuPDF in-process when it is installed, yielding one page at a
+        time; a digitally generated page with a text layer is read directly
+        (split into the two columns) instead of being rendered for OCR.
+        Otherwise falls back to pdf2image (poppler's pdftoppm).
 
         Args:
             pdf_path: Path to PDF file
+            dpi: Render resolution
+
+        Yields:
+            Grayscale PIL Image per page, or the page's marked two-column
+            text when it has a usable text layer
+        """
+        if PYMUPDF_AVAILABLE:
+            with fitz.open(pdf_path) as doc:
+                for page in doc:
+                    rect = page.rect
+                    mid_x = rect.x0 + rect.width / 2
+                    left_text = page.get_text('text', clip=fitz.Rect(rect.x0, rect.y0, mid_x, rect.y1)).strip()
+                    right_text = page.get_text('text', clip=fitz.Rect(mid_x, rect.y0, rect.x1, rect.y1)).strip()
+                    if len(left_text) + len(right_text) >= _MIN_TEXT_LAYER_CHARS:
+                        yield self._format_two_column(left_text, right_text)
+                        continue
+
+                    pixmap = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+                    yield Image.frombytes('L', (pixmap.width, pixmap.height), pixmap.samples)
+            return
+
+        if not PDF2IMAGE_AVAILABLE:
+            raise ImportError("PDF support requires PyMuPDF or pdf2image")
+
+        yield from convert_from_path(pdf_path, dpi=dpi, grayscale=True)
+
+    def _extract_text_from_pdf(self, pdf_path: str, dpi: Optional[int] = None) -> str:
+        """Extract text from PDF, using OCR for pages without a text layer.
+
+        Args:
+            pdf_path: Path to PDF file
+            dpi: Render resolution (default: school_plans.ocr_dpi)
 
         Returns:
             Extracted text from all pages
         """
         try:
-            self.logger.info(f"Converting PDF to images: {pdf_path}")
-
-            # Convert PDF to images
-            images = convert_from_path(pdf_path, dpi=300)
-
-            all_text = []
-            for i, image in enumerate(images):
-                self.logger.debug(f"Processing page {i+1}/{len(images)}")
+            self.logger.info(f"Reading PDF pages: {pdf_path}")
 
-                # Use two-column extraction for each page
-                text = self._extract_text_two_column(image)
-                all_text.append(text)
+            # Use two-column extraction for each page as it is rendered
+            all_text = self._extract_pages_two_column(
+                self._render_pdf_pages(pdf_path, dpi or self.ocr_dpi)
+            )
+            self.logger.debug(f"Processed {len(all_text)} pages")
 
             # Combine all pages
             combined_text = '\n\n=== PAGE BREAK ===\n\n'.join(all_text)
@@ -384,34 +731,42 @@ class SchoolPlanProcessor:
         if not self.ticktick.is_available():
             raise ValueError("TickTick not available")
 
-        # Find or create "Homework" project
-        project = self.ticktick.find_project_by_name("Homework")
-        if not project:
-            project = self.ticktick.create_project("Homework")
-
-        if not project:
-            raise ValueError("Could not find or create Homework project")
-
-        project_id = project.get('id')
-
         # Format task title
         task_title = self.scanner.format_task_title(item)
 
-        # Check for duplicates (check both title and due date)
-        due_date = item.get('due_date')
-        if self._task_exists_with_due_date(task_title, project_id, due_date):
-            self.logger.info(f"Task already exists, skipping: {task_title} (due {due_date})")
-            return
-
         # Get due date
         due_date = item.get('due_date')
         if due_date and isinstance(due_date, date):
             # Convert date to datetime at 23:00
-            due_datetime = datetime.combine(due_date, datetime.min.time())
-            due_datetime = due_datetime.replace(hour=23, minute=0)
+            due_datetime = datetime(due_date.year, due_date.month, due_date.day, 23, 0)
         else:
             due_datetime = None
 
+        # Items of a plan are added concurrently: resolve the project and
+        # claim the task in the duplicate index one item at a time, so the
+        # project is created once and a repeated item is only added once
+        with self._task_lock:
+            # Find or create "Homework" project
+            if not self._homework_project_id:
+                project = self.ticktick.find_project_by_name("Homework")
+                if not project:
+                    project = self.ticktick.create_project("Homework")
+
+                if not project:
+                    raise ValueError("Could not find or create Homework project")
+
+                self._homework_project_id = project.get('id')
+
+            project_id = self._homework_project_id
+
+            # Check for duplicates (check both title and due date)
+            if self._task_exists_with_due_date(task_title, project_id, due_date):
+                self.logger.info(f"Task already exists, skipping: {task_title} (due {due_date})")
+                return
+
+            task_key = (task_title.lower(), project_id, due_datetime.date() if due_datetime else None)
+            self._task_index.add(task_key)
+
         # Create task with description in content field
         content = None
         if item['type'] == 'homework':
@@ -423,14 +778,20 @@ class SchoolPlanProcessor:
             # Recur daily except Friday and Sunday (Mon, Tue, Wed, Thu, Sat)
             repeat_rule = "FREQ=DAILY;BYDAY=MO,TU,WE,TH,SA"
 
-        self.ticktick.create_task(
-            title=task_title,
-            project_id=project_id,
-            due_date=due_datetime,
-            priority=0,
-            content=content,
-            repeat_rule=repeat_rule
-        )
+        try:
+            self.ticktick.create_task(
+                title=task_title,
+                project_id=project_id,
+                due_date=due_datetime,
+                priority=0,
+                content=content,
+                repeat_rule=repeat_rule
+            )
+        except Exception:
+            # Not created after all; release the claim
+            with self._task_lock:
+                self._task_index.discard(task_key)
+            raise
 
         self.logger.info(f"Added to TickTick: {task_title}")
 
@@ -450,21 +811,23 @@ class SchoolPlanProcessor:
         Returns:
             True if task exists with same title and due date
         """
-        all_tasks = self.ticktick.get_all_tasks()
-
-        for task in all_tasks:
-            if task.get('title', '').lower() == title.lower():
-                if task.get('projectId') == project_id:
-                    # Check due date
-                    task_due = task.get('dueDate')
-                    if due_date and task_due:
-                        task_date = self.ticktick._parse_ticktick_date(task_due).date()
-                        if task_date == due_date:
-                            return True
-                    elif not due_date and not task_due:
-                        return True
-
-        return False
+        if self._task_index is None:
+            self._task_index = self._build_task_index()
+
+        return (title.lower(), project_id, due_date or None) in self._task_index
+
+    def _build_task_index(self) -> Set[Tuple[str, Optional[str], Optional[date]]]:
+        """Index all TickTick tasks for duplicate checks.
+
+        Returns:
+            Set of (lowercased title, project ID, due date or None)
+        """
+        index = set()
+        for task in self.ticktick.get_all_tasks():
+            task_due = task.get('dueDate')
+            due_date = self.ticktick._parse_ticktick_date(task_due).date() if task_due else None
+            index.add((task.get('title', '').lower(), task.get('projectId'), due_date))
+        return index
 
     def _format_event_title(self, event: Dict[str, Any]) -> str:
         """Format event title from event data.
@@ -478,27 +841,27 @@ class SchoolPlanProcessor:
         child = event.get('child', '')
         description = event.get('description', '')
 
-        # Extract event name - skip bullet points and special characters
-        words = description.split()
+        # Extract event name in one pass, remembering the first word longer
+        # than 2 chars as the fallback
         event_name = None
+        first_word = None
 
-        for word in words:
+        for word in description.split():
             # Skip bullet points and short special characters
-            if len(word) <= 2 or word in ['¢', '•', '*', '-', '·']:
+            if len(word) <= 2:
                 continue
+            if first_word is None:
+                first_word = word
             # Skip common Norwegian words that aren't event names
-            if word.lower() in ['blir', 'er', 'på', 'i', 'kl.', 'klokken']:
+            if word.lower() in _EVENT_NAME_SKIP_WORDS:
                 continue
             # Found the event name
             event_name = word.rstrip('en')  # Remove -en suffix
             break
 
-        if not event_name:
+        if not event_name and first_word:
             # Fallback - use first word longer than 2 chars
-            for word in words:
-                if len(word) > 2:
-                    event_name = word.rstrip('en')
-                    break
+            event_name = first_word.rstrip('en')
 
         if not event_name:
             event_name = "Event"
@@ -526,8 +889,7 @@ class SchoolPlanProcessor:
         event_title = self._format_event_title(event)
 
         # Create datetime
-        start_datetime = datetime.combine(event_date, datetime.min.time())
-        start_datetime = start_datetime.replace(hour=hour, minute=minute)
+        start_datetime = datetime(event_date.year, event_date.month, event_date.day, hour, minute)
         end_datetime = start_datetime + timedelta(hours=1)  # Default 1hr
 
         # Get "Handeliew events" calendar ID
@@ -556,6 +918,10 @@ class SchoolPlanProcessor:
             }
 
             self.calendar.create_event(event_data=calendar_event, calendar_id=handeliew_calendar_id)
+
+            # Later events in the same plan see this one as existing
+            if self._calendar_index:
+                self._calendar_index[2].add((event_title.lower(), event_date.isoformat()))
             self.logger.info(f"Added event to Handeliew events calendar: {event_title}")
 
     def _parse_norwegian_date(self, date_text: str) -> Optional[date]:
@@ -567,32 +933,13 @@ class SchoolPlanProcessor:
         Returns:
             Parsed date or None
         """
-        import re
-
-        # Norwegian month names
-        months = {
-            'januar': 1, 'jan': 1,
-            'februar': 2, 'feb': 2,
-            'mars': 3, 'mar': 3,
-            'april': 4, 'apr': 4,
-            'mai': 5,
-            'juni': 6, 'jun': 6,
-            'juli': 7, 'jul': 7,
-            'august': 8, 'aug': 8,
-            'september': 9, 'sep': 9,
-            'oktober': 10, 'okt': 10,
-            'november': 11, 'nov': 11,
-            'desember': 12, 'des': 12
-        }
-
         # Extract day and month
-        match = re.search(r'(\d{1,2})[\.\s]+(\w+)', date_text, re.IGNORECASE)
+        match = _NORWEGIAN_DATE_RE.search(date_text)
         if match:
             day = int(match.group(1))
-            month_str = match.group(2).lower()
+            month = _NORWEGIAN_MONTHS.get(match.group(2).lower())
 
-            if month_str in months:
-                month = months[month_str]
+            if month:
                 # Use current year or next year if month has passed
                 today = date.today()
                 year = today.year
@@ -616,6 +963,9 @@ class SchoolPlanProcessor:
         if not self.calendar.is_available():
             return None
 
+        if self._handeliew_calendar_id:
+            return self._handeliew_calendar_id
+
         try:
             # Get all calendars
             calendars = self.calendar.service.calendarList().list().execute()
@@ -623,7 +973,8 @@ class SchoolPlanProcessor:
             # Find "Handeliew events" calendar
             for calendar in calendars.get('items', []):
                 if calendar.get('summary', '').lower() == 'handeliew events':
-                    return calendar.get('id')
+                    self._handeliew_calendar_id = calendar.get('id')
+                    return self._handeliew_calendar_id
 
             self.logger.warning("Could not find 'Handeliew events' calendar")
             return None
@@ -632,6 +983,58 @@ class SchoolPlanProcessor:
             self.logger.error(f"Error finding Handeliew events calendar: {e}")
             return None
 
+    def _load_calendar_index(self, events: List[Dict[str, Any]]) -> None:
+        """Fetch the Handeliew calendar events spanning a plan's event dates.
+
+        One events().list() call (plus pages) replaces a per-event query;
+        _event_exists_in_calendar() falls back to querying when the index
+        could not be loaded.
+
+        Args:
+            events: Events parsed from the plan
+        """
+        self._calendar_index = None
+
+        dates = [
+            event_date for event_date in
+            (self._parse_norwegian_date(event.get('date_text', '')) for event in events)
+            if event_date
+        ]
+        if not dates:
+            return
+
+        calendar_id = self._get_handeliew_calendar_id()
+        if not calendar_id:
+            return
+
+        first_date, last_date = min(dates), max(dates)
+        start = datetime.combine(first_date, datetime.min.time())
+        end = datetime.combine(last_date, datetime.min.time()) + timedelta(days=1)
+
+        try:
+            existing = set()
+            request = {
+                'calendarId': calendar_id,
+                'timeMin': start.isoformat() + 'Z',
+                'timeMax': end.isoformat() + 'Z',
+                'singleEvents': True
+            }
+            while True:
+                response = self.calendar.service.events().list(**request).execute()
+                for item in response.get('items', []):
+                    item_start = item.get('start', {})
+                    start_date = (item_start.get('dateTime') or item_start.get('date') or '')[:10]
+                    existing.add((item.get('summary', '').lower(), start_date))
+
+                if not response.get('nextPageToken'):
+                    break
+                request['pageToken'] = response['nextPageToken']
+
+            self._calendar_index = (first_date, last_date, existing)
+
+        except Exception as e:
+            self.logger.error(f"Error loading existing events: {e}")
+
     def _event_exists_in_calendar(
         self,
         event_title: str,
@@ -651,6 +1054,10 @@ class SchoolPlanProcessor:
         if not self.calendar.is_available():
             return False
 
+        index = self._calendar_index
+        if index and index[0] <= start_datetime.date() <= index[1]:
+            return (event_title.lower(), start_datetime.date().isoformat()) in index[2]
+
         # Get events for that day
         start_of_day = datetime.combine(start_datetime.date(), datetime.min.time())
         end_of_day = start_of_day + timedelta(days=1)
@@ -699,19 +1106,20 @@ class SchoolPlanProcessor:
         message_lines = [f"Added from {child_name}'s Ukeplan Week {week_num}"]
         message_lines.append("")  # Blank line
 
-        # Add homework items (deduplicate)
-        homework_unique = list(set(added_items['homework']))
+        # Add homework items (deduplicate, keeping plan order)
+        homework_unique = list(dict.fromkeys(added_items['homework']))
         if homework_unique:
             message_lines.append("Homework:")
             for hw in homework_unique:
                 message_lines.append(f"• {hw}")
 
-        # Add events
-        if added_items['events']:
+        # Add events (deduplicate, keeping plan order)
+        events_unique = list(dict.fromkeys(added_items['events']))
+        if events_unique:
             if homework_unique:
                 message_lines.append("")  # Blank line
             message_lines.append("Events:")
-            for event in added_items['events']:
+            for event in events_unique:
                 message_lines.append(f"• {event}")
 
         message = "\n".join(message_lines)
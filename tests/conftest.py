@@ -0,0 +1,69 @@
+"""Shared fixtures for the personal assistant tests."""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.config import get_config
+
+
+# Tables and columns of Messages.app's chat.db that the integration reads
+CHAT_DB_SCHEMA = """
+    CREATE TABLE handle (ROWID INTEGER PRIMARY KEY, id TEXT);
+    CREATE TABLE chat (
+        ROWID INTEGER PRIMARY KEY,
+        guid TEXT,
+        chat_identifier TEXT,
+        display_name TEXT,
+        service_name TEXT
+    );
+    CREATE TABLE message (
+        ROWID INTEGER PRIMARY KEY,
+        guid TEXT,
+        text TEXT,
+        date INTEGER,
+        is_from_me INTEGER DEFAULT 0,
+        is_read INTEGER DEFAULT 1,
+        handle_id INTEGER,
+        date_edited INTEGER DEFAULT 0,
+        date_retracted INTEGER DEFAULT 0
+    );
+    CREATE TABLE chat_message_join (chat_id INTEGER, message_id INTEGER);
+"""
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _isolated_paths(tmp_path_factory):
+    """Point log and cache files at a temporary directory."""
+    base = tmp_path_factory.mktemp('assistant')
+    config = get_config()
+    config.set('logging.file', str(base / 'assistant.log'))
+    config.set('cache.file', str(base / 'cache.db'))
+    config.set('imessage.cache_file', str(base / 'imessage_cache.db'))
+
+
+@pytest.fixture
+def chat_db(tmp_path):
+    """Create an empty chat.db and point the config at it.
+
+    Yields:
+        Writable connection to the chat database
+    """
+    config = get_config()
+    previous = (config.get('imessage.database_path'), config.get('imessage.cache_file'))
+
+    path = tmp_path / 'chat.db'
+    conn = sqlite3.connect(str(path), isolation_level=None)
+    conn.executescript(CHAT_DB_SCHEMA)
+    config.set('imessage.database_path', str(path))
+    config.set('imessage.cache_file', str(tmp_path / 'imessage_cache.db'))
+
+    yield conn
+
+    conn.close()
+    config.set('imessage.database_path', previous[0])
+    config.set('imessage.cache_file', previous[1])
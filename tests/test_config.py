@@ -0,0 +1,53 @@
+"""Tests for configuration loading and overrides."""
+
+import pytest
+
+from src.utils.config import Config
+
+
+@pytest.fixture
+def config(tmp_path):
+    path = tmp_path / 'settings.yaml'
+    path.write_text(
+        "imessage:\n"
+        "  database_path: /tmp/first.db\n"
+        "  poll_interval_seconds: 30\n"
+        "logging:\n"
+        "  file: logs/first.log\n"
+    )
+    return Config(str(path))
+
+
+def test_get_resolves_dotted_paths_and_sections(config):
+    assert config.get('imessage.poll_interval_seconds') == 30
+    assert config.get('imessage')['database_path'] == '/tmp/first.db'
+    assert config.get('imessage.missing', 'default') == 'default'
+    assert config['logging.file'] == 'logs/first.log'
+
+
+def test_set_updates_dotted_lookups(config):
+    config.set('imessage.poll_interval_seconds', 5)
+    config.set('weather.cache_ttl_seconds', 60)
+
+    assert config.get('imessage.poll_interval_seconds') == 5
+    assert config.imessage_poll_interval == 5
+    assert config.get('weather') == {'cache_ttl_seconds': 60}
+    assert config.get('weather.cache_ttl_seconds') == 60
+
+
+def test_set_replaces_a_section(config):
+    config.set('imessage', {'enabled': True})
+
+    assert config.get('imessage.enabled') is True
+    assert config.get('imessage.poll_interval_seconds') is None
+
+
+def test_set_clears_cached_properties(config):
+    assert str(config.imessage_database_path) == '/tmp/first.db'
+    assert config.log_file == config.base_dir / 'logs/first.log'
+
+    config.set('imessage.database_path', '/tmp/second.db')
+    config.set('logging.file', 'logs/second.log')
+
+    assert str(config.imessage_database_path) == '/tmp/second.db'
+    assert config.log_file == config.base_dir / 'logs/second.log'
@@ -0,0 +1,134 @@
+"""Tests for the iMessage integration's sidecar caches."""
+
+import pytest
+
+from src.integrations.imessage import _CHAT_SUMMARY_FULL, iMessageIntegration
+
+
+def _add_message(conn, rowid, chat_id, text='hello', date=None):
+    conn.execute(
+        "INSERT INTO message (ROWID, guid, text, date) VALUES (?, ?, ?, ?)",
+        (rowid, f'guid-{rowid}', text, date if date is not None else rowid * 1000)
+    )
+    conn.execute("INSERT INTO chat_message_join VALUES (?, ?)", (chat_id, rowid))
+
+
+@pytest.fixture
+def imessage(chat_db):
+    """iMessage integration over a chat.db with three chats and six messages."""
+    chat_db.executemany(
+        "INSERT INTO chat (ROWID, guid, chat_identifier) VALUES (?, ?, ?)",
+        [(1, 'g1', '+4711111111'), (2, 'g2', 'chat123'), (3, 'g3', '+4722222222')]
+    )
+    for rowid in range(1, 7):
+        _add_message(chat_db, rowid, 1 if rowid < 4 else 2)
+
+    integration = iMessageIntegration()
+    yield integration
+    integration.close()
+
+
+def _sync(integration, conn):
+    max_rowid = conn.execute("SELECT MAX(ROWID) FROM message").fetchone()[0] or 0
+    with integration._connection() as read_conn:
+        return integration._sync_chat_summary(read_conn, max_rowid)
+
+
+def _live_summary(conn):
+    return {row[0]: (row[1], row[2]) for row in conn.execute(_CHAT_SUMMARY_FULL)}
+
+
+def test_chat_summary_initial_sync_matches_live_aggregate(imessage, chat_db):
+    assert _sync(imessage, chat_db) == _live_summary(chat_db)
+
+
+def test_chat_summary_adds_new_messages_incrementally(imessage, chat_db):
+    _sync(imessage, chat_db)
+    _add_message(chat_db, 7, 2)
+    _add_message(chat_db, 8, 3)
+
+    summary = _sync(imessage, chat_db)
+
+    assert summary == _live_summary(chat_db)
+    assert summary[2] == (4, 7000)
+    assert summary[3] == (1, 8000)
+
+
+def test_chat_summary_rebuilds_after_deleted_message(imessage, chat_db):
+    _sync(imessage, chat_db)
+    chat_db.execute("DELETE FROM message WHERE ROWID = 3")
+    chat_db.execute("DELETE FROM chat_message_join WHERE message_id = 3")
+
+    summary = _sync(imessage, chat_db)
+
+    assert summary[1] == (2, 2000)
+    assert summary == _live_summary(chat_db)
+
+
+def test_chat_summary_rebuilds_after_delete_and_insert(imessage, chat_db):
+    _sync(imessage, chat_db)
+    chat_db.execute("DELETE FROM message WHERE ROWID = 1")
+    chat_db.execute("DELETE FROM chat_message_join WHERE message_id = 1")
+    _add_message(chat_db, 7, 1)
+
+    assert _sync(imessage, chat_db) == _live_summary(chat_db)
+
+
+def test_chat_summary_prunes_deleted_chats(imessage, chat_db):
+    _sync(imessage, chat_db)
+    chat_db.execute("DELETE FROM chat WHERE ROWID = 3")
+
+    summary = _sync(imessage, chat_db)
+
+    assert 3 not in summary
+    assert summary == _live_summary(chat_db)
+
+
+def _search_ids(integration, keyword):
+    return [message['id'] for message in integration.search_messages(keyword)]
+
+
+def _like_search_ids(integration, keyword):
+    # Force the LIKE scan the index stands in for
+    original = integration._search_index_rowids
+    integration._search_index_rowids = lambda conn, kw: None
+    try:
+        return _search_ids(integration, keyword)
+    finally:
+        integration._search_index_rowids = original
+
+
+@pytest.fixture
+def searchable(imessage, chat_db):
+    texts = {
+        1: 'Dinner at seven?', 2: 'Pick up the PARCEL', 3: 'parcel arrived',
+        4: 'Remember the dinner party', 5: None, 6: 'ok'
+    }
+    for rowid, text in texts.items():
+        chat_db.execute("UPDATE message SET text = ? WHERE ROWID = ?", (text, rowid))
+    return imessage
+
+
+@pytest.mark.parametrize('keyword', ['dinner', 'Parcel', 'the', 'arrived', 'missing'])
+def test_index_search_matches_like_search(searchable, keyword):
+    assert _search_ids(searchable, keyword) == _like_search_ids(searchable, keyword)
+
+
+def test_index_search_picks_up_new_messages(searchable, chat_db):
+    assert _search_ids(searchable, 'parcel') == [3, 2]
+    _add_message(chat_db, 7, 2, text='Parcel is at the door')
+
+    assert _search_ids(searchable, 'parcel') == [7, 3, 2]
+
+
+def test_index_search_follows_edited_and_unsent_messages(searchable, chat_db):
+    assert _search_ids(searchable, 'dinner') == [4, 1]
+
+    chat_db.execute(
+        "UPDATE message SET text = 'Lunch at noon?', date_edited = 10 WHERE ROWID = 1"
+    )
+    chat_db.execute("UPDATE message SET text = 'dinner instead', date_edited = 11 WHERE ROWID = 6")
+    chat_db.execute("UPDATE message SET text = NULL, date_retracted = 12 WHERE ROWID = 4")
+
+    assert _search_ids(searchable, 'dinner') == [6]
+    assert _search_ids(searchable, 'dinner') == _like_search_ids(searchable, 'dinner')
@@ -0,0 +1,61 @@
+"""Tests for the meal planning integration."""
+
+import pytest
+
+from src.integrations import meal_planning
+from src.integrations.meal_planning import MealPlanningIntegration
+
+
+class FakeNotion:
+    """Serves a meal database schema and counts schema and query calls."""
+
+    def __init__(self, options):
+        self.options = options
+        self.schema_loads = 0
+        self.queries = []
+
+    def get_database(self, database_id):
+        self.schema_loads += 1
+        return {'properties': {
+            'When to Cook': {'select': {'options': [{'name': name} for name in self.options]}},
+            'Recipe Name': {'type': 'title'},
+        }}
+
+    def query_database(self, database_id, filter_dict=None, page_size=100):
+        self.queries.append(filter_dict)
+        return [{'properties': {'Recipe Name': {'title': [{'plain_text': 'Taco'}]}}}]
+
+
+@pytest.fixture
+def meals(monkeypatch):
+    monkeypatch.setenv('NOTION_TOKEN', 'test-token')
+    integration = MealPlanningIntegration()
+    integration.meal_db_id = 'meal-db'
+    integration.notion = FakeNotion(['Monday', 'Friday or Saturday'])
+    return integration
+
+
+def test_meals_filter_on_matching_options(meals):
+    names = [meal['name'] for meal in meals._query_meals_for_day('Saturday')]
+
+    assert names == ['Taco']
+    assert meals.notion.queries == [
+        {'or': [{'property': 'When to Cook', 'select': {'equals': 'Friday or Saturday'}}]}
+    ]
+
+
+def test_day_without_option_does_not_reload_schema_every_call(meals):
+    assert meals._query_meals_for_day('Tuesday') == []
+    assert meals._query_meals_for_day('Tuesday') == []
+
+    assert meals.notion.schema_loads == 1
+    assert meals.notion.queries == []
+
+
+def test_day_without_option_reloads_stale_schema(meals, monkeypatch):
+    meals._query_meals_for_day('Tuesday')
+    meals.notion.options.append('Tuesday')
+    monkeypatch.setattr(meal_planning, '_SCHEMA_RELOAD_INTERVAL', 0)
+
+    assert [meal['name'] for meal in meals._query_meals_for_day('Tuesday')] == ['Taco']
+    assert meals.notion.schema_loads == 2
@@ -0,0 +1,96 @@
+"""Tests for the iMessage monitor's database watch."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.monitors import message_monitor
+from src.monitors.message_monitor import MessageMonitor
+
+
+class FakeKqueue:
+    """Records registered file descriptors and replays queued results."""
+
+    def __init__(self, results):
+        self.registered = []
+        self.results = results
+        self.closed = False
+
+    def control(self, changes, max_events, timeout=None):
+        if changes is not None:
+            self.registered.extend(change.ident for change in changes)
+            return []
+        result = self.results.pop(0) if self.results else []
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_select(monkeypatch):
+    """Give the monitor a kqueue whose waits return queued results."""
+    results = []
+    kqueues = []
+
+    def kqueue():
+        kqueues.append(FakeKqueue(results))
+        return kqueues[-1]
+
+    monkeypatch.setattr(message_monitor, 'KQUEUE_AVAILABLE', True)
+    monkeypatch.setattr(message_monitor, 'select', SimpleNamespace(
+        kqueue=kqueue,
+        kevent=lambda fd, **kwargs: SimpleNamespace(ident=fd, **kwargs),
+        KQ_FILTER_VNODE=-4, KQ_EV_ADD=1, KQ_EV_CLEAR=32,
+        KQ_NOTE_WRITE=2, KQ_NOTE_EXTEND=4, KQ_NOTE_DELETE=1, KQ_NOTE_RENAME=32
+    ))
+    monkeypatch.setattr(message_monitor.time, 'sleep', lambda seconds: None)
+    return SimpleNamespace(results=results, kqueues=kqueues)
+
+
+@pytest.fixture
+def monitor(chat_db, tmp_path):
+    monitor = MessageMonitor(state_file=tmp_path / 'state.json')
+    yield monitor
+    monitor._close_watch()
+
+
+def _wal_path(monitor):
+    db_path = monitor.config.imessage_database_path
+    return db_path.with_name(f"{db_path.name}-wal")
+
+
+def test_watch_failure_falls_back_to_polling(monitor, fake_select):
+    monitor._open_watch()
+    fake_select.results.append(OSError('bad file descriptor'))
+
+    monitor._wait_for_change(0)
+
+    assert monitor._kqueue is None
+    assert fake_select.kqueues[0].closed
+    monitor._wait_for_change(0)
+    assert len(fake_select.kqueues) == 1
+
+
+def test_missing_wal_is_watched_once_it_exists(monitor, fake_select):
+    _wal_path(monitor).unlink(missing_ok=True)
+    monitor._open_watch()
+    assert len(monitor._watch_fds) == 1
+
+    _wal_path(monitor).touch()
+    monitor._wait_for_change(0)
+
+    assert len(monitor._watch_fds) == 2
+    assert len(fake_select.kqueues[-1].registered) == 2
+
+
+def test_complete_watch_is_kept_on_timeout(monitor, fake_select):
+    _wal_path(monitor).touch()
+    monitor._open_watch()
+
+    monitor._wait_for_change(0)
+
+    assert len(fake_select.kqueues) == 1
+    assert len(monitor._watch_fds) == 2
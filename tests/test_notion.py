@@ -0,0 +1,167 @@
+"""Tests for the Notion integration's caches."""
+
+import sqlite3
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.integrations.notion import NotionIntegration
+
+
+class FakeNotionClient:
+    """Stand-in for notion_client.Client that counts API calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.last_edited_time = '2025-11-03T08:15:00.000Z'
+        self.pages = SimpleNamespace(
+            retrieve=self._retrieve_page,
+            create=self._create_page,
+            update=self._update_page
+        )
+        self.blocks = SimpleNamespace(children=SimpleNamespace(list=self._list_blocks))
+        self.databases = SimpleNamespace(query=self._query_database)
+
+    def _retrieve_page(self, page_id):
+        self.calls.append(('page', page_id))
+        return {'id': page_id, 'last_edited_time': self.last_edited_time}
+
+    def _create_page(self, parent, properties, **kwargs):
+        self.calls.append(('create', parent))
+        return {'id': 'new-page', 'properties': properties}
+
+    def _update_page(self, page_id, properties):
+        self.calls.append(('update', page_id))
+        return {'id': page_id, 'properties': properties}
+
+    def _list_blocks(self, page_id):
+        self.calls.append(('blocks', page_id))
+        return {'results': [{'id': f'block-{len(self.calls)}'}]}
+
+    def _query_database(self, database_id, **params):
+        self.calls.append(('query', database_id))
+        return {'results': [{'id': f'entry-{len(self.calls)}'}], 'has_more': False}
+
+    def count(self, kind):
+        return sum(1 for call in self.calls if call[0] == kind)
+
+
+@pytest.fixture
+def notion(monkeypatch):
+    """Notion integration backed by a fake client and an empty disk cache."""
+    monkeypatch.setenv('NOTION_TOKEN', 'test-token')
+    integration = NotionIntegration()
+    integration.client = FakeNotionClient()
+    for namespace in ('notion_page', 'notion_blocks', 'notion_search'):
+        integration.cache.delete(namespace)
+    return integration
+
+
+def _minutes_ago(minutes):
+    return time.strftime('%Y-%m-%dT%H:%M:00.000Z', time.gmtime(time.time() - minutes * 60))
+
+
+def test_page_content_reuses_blocks_while_page_is_unedited(notion):
+    notion.client.last_edited_time = _minutes_ago(10)
+    first = notion.get_page_content('page-1')
+
+    notion.cache.delete('notion_page')
+    second = notion.get_page_content('page-1')
+
+    assert second == first
+    assert notion.client.count('blocks') == 1
+
+
+def test_page_content_refetches_blocks_after_an_edit(notion):
+    notion.client.last_edited_time = _minutes_ago(10)
+    notion.get_page_content('page-1')
+
+    notion.cache.delete('notion_page')
+    notion.client.last_edited_time = _minutes_ago(5)
+    notion.get_page_content('page-1')
+
+    assert notion.client.count('blocks') == 2
+
+
+def test_page_content_refetches_blocks_fetched_in_the_edit_minute(notion):
+    # last_edited_time is rounded to the minute, so a later edit in the same
+    # minute would not change it
+    notion.client.last_edited_time = _minutes_ago(0)
+    notion.get_page_content('page-1')
+    notion.get_page_content('page-1')
+
+    assert notion.client.count('blocks') == 2
+
+
+def test_page_content_blocks_expire_after_ttl(notion):
+    notion.client.last_edited_time = _minutes_ago(10)
+    notion.get_page_content('page-1')
+
+    notion.blocks_cache_ttl = 0
+    notion.get_page_content('page-1')
+
+    assert notion.client.count('blocks') == 2
+
+
+def test_cache_write_failure_does_not_fail_fetch(notion, monkeypatch):
+    def locked(*args):
+        raise sqlite3.OperationalError('database is locked')
+
+    monkeypatch.setattr(notion.cache, 'set', locked)
+
+    assert notion.get_page('page-1', use_cache=False)['id'] == 'page-1'
+    assert notion.get_page_content('page-1') == [{'id': 'block-3'}]
+
+
+def test_get_pages_returns_pages_by_id(notion):
+    pages = notion.get_pages(['page-1', 'page-2', 'page-3'])
+
+    assert {page_id: page['id'] for page_id, page in pages.items()} == {
+        'page-1': 'page-1', 'page-2': 'page-2', 'page-3': 'page-3'
+    }
+    assert notion.get_pages([]) == {}
+
+
+def test_query_database_reuses_results_within_ttl(notion):
+    first = notion.query_database('db-1')
+    first.append({'id': 'caller-owned'})
+
+    assert notion.query_database('db-1') == [{'id': 'entry-1'}]
+    assert notion.client.count('query') == 1
+
+
+def test_query_database_keys_on_filter(notion):
+    notion.query_database('db-1', filter_dict={'property': 'Day', 'select': {'equals': 'Mon'}})
+    notion.query_database('db-1', filter_dict={'select': {'equals': 'Mon'}, 'property': 'Day'})
+    notion.query_database('db-1', filter_dict={'property': 'Day', 'select': {'equals': 'Tue'}})
+
+    assert notion.client.count('query') == 2
+
+
+def test_query_database_refetches_after_ttl_or_without_cache(notion):
+    notion.query_database('db-1')
+    notion.query_database('db-1', cache_ttl=0)
+    notion.query_database('db-1', cache=False)
+
+    assert notion.client.count('query') == 3
+
+
+def test_create_page_invalidates_only_its_database(notion):
+    notion.query_database('db-1')
+    notion.query_database('db-2')
+    notion.create_page('db-1', {}, parent_type='database_id')
+    notion.query_database('db-1')
+    notion.query_database('db-2')
+
+    assert notion.client.count('query') == 3
+
+
+def test_update_page_invalidates_every_query(notion):
+    notion.query_database('db-1')
+    notion.query_database('db-2')
+    notion.update_page('page-1', {})
+    notion.query_database('db-1')
+    notion.query_database('db-2')
+
+    assert notion.client.count('query') == 4
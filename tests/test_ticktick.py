@@ -0,0 +1,184 @@
+"""Tests for the TickTick integrations."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.integrations import ticktick, ticktick_oauth
+from src.integrations.ticktick import TickTickIntegration
+from src.integrations.ticktick_oauth import TickTickOAuth
+
+
+def _task(id_, title, due_date=None, priority=0, is_completed=False, completed_time=None):
+    return SimpleNamespace(
+        id=id_, title=title, due_date=due_date, priority=priority,
+        is_completed=is_completed, completed_time=completed_time
+    )
+
+
+@pytest.fixture
+def password_ticktick(monkeypatch):
+    """Password-auth integration with no credentials and a stub client."""
+    monkeypatch.delenv('TICKTICK_USERNAME', raising=False)
+    monkeypatch.delenv('TICKTICK_PASSWORD', raising=False)
+    integration = TickTickIntegration()
+    assert integration.client is None
+
+    now = datetime.now()
+    tasks = [
+        _task('1', 'Due today', due_date=now, priority=5),
+        _task('2', 'Overdue', due_date=now - timedelta(days=2)),
+        _task('3', 'Next week', due_date=now + timedelta(days=7)),
+        _task('4', 'Done', due_date=now - timedelta(days=1), is_completed=True, completed_time=now),
+    ]
+    integration.fetches = 0
+
+    def get_from_project():
+        integration.fetches += 1
+        return tasks
+
+    integration.client = SimpleNamespace(task=SimpleNamespace(get_from_project=get_from_project))
+    return integration
+
+
+def test_password_auth_briefing_tasks(password_ticktick):
+    today_tasks, overdue_tasks, stats = password_ticktick.get_briefing_tasks()
+
+    assert [task['title'] for task in today_tasks] == ['Due today']
+    assert [task['title'] for task in overdue_tasks] == ['Overdue']
+    assert stats == {
+        'total': 4, 'completed_today': 1, 'overdue': 1, 'due_today': 1, 'high_priority': 1
+    }
+
+
+def test_password_auth_queries_share_one_fetch(password_ticktick):
+    password_ticktick.get_today_tasks()
+    password_ticktick.get_overdue_tasks()
+    password_ticktick.get_upcoming_tasks()
+    password_ticktick.get_task_statistics()
+
+    assert password_ticktick.fetches == 1
+
+
+def test_password_auth_refetches_after_ttl(password_ticktick, monkeypatch):
+    password_ticktick.get_today_tasks()
+    monkeypatch.setattr(ticktick, '_TASKS_CACHE_TTL', 0)
+    password_ticktick.get_today_tasks()
+
+    assert password_ticktick.fetches == 2
+
+
+def test_password_auth_refetches_after_invalidate(password_ticktick):
+    password_ticktick.get_upcoming_tasks()
+    password_ticktick.invalidate_cache()
+    password_ticktick.get_upcoming_tasks()
+
+    assert password_ticktick.fetches == 2
+
+
+class FakeTickTickAPI:
+    """Answers TickTickOAuth._api_request calls from in-memory projects."""
+
+    def __init__(self):
+        self.calls = []
+        self.projects = {
+            'p1': [{'id': 't1', 'title': 'Math homework', 'projectId': 'p1'}],
+            'p2': [{'id': 't2', 'title': 'Buy milk', 'projectId': 'p2'}],
+        }
+
+    def __call__(self, method, endpoint, **kwargs):
+        self.calls.append((method, endpoint))
+        if method == 'GET' and endpoint == '/project':
+            return [{'id': project_id} for project_id in self.projects]
+        if method == 'GET':
+            project_id = endpoint.split('/')[2]
+            return {'tasks': self.projects.get(project_id, [])}
+        if endpoint == '/task':
+            task = dict(kwargs['json'], id='new')
+            self.projects.setdefault(task.get('projectId'), []).append(task)
+            return task
+        return None
+
+    def count(self, endpoint_prefix):
+        return sum(1 for _, endpoint in self.calls if endpoint.startswith(endpoint_prefix))
+
+
+@pytest.fixture
+def oauth_ticktick(monkeypatch):
+    """OAuth integration answering from a fake API, with no persisted projects."""
+    monkeypatch.delenv('TICKTICK_CLIENT_ID', raising=False)
+    monkeypatch.delenv('TICKTICK_CLIENT_SECRET', raising=False)
+    monkeypatch.setattr(ticktick_oauth, 'HTTP2_AVAILABLE', False)
+
+    integration = TickTickOAuth()
+    integration.cache.delete('ticktick')
+    integration.access_token = 'token'
+    integration.api = FakeTickTickAPI()
+    integration._api_request = integration.api
+    yield integration
+    integration.cache.delete('ticktick')
+    integration.close()
+
+
+def test_oauth_queries_share_one_fetch(oauth_ticktick):
+    oauth_ticktick.get_briefing_tasks()
+    oauth_ticktick.get_all_tasks()
+    assert oauth_ticktick.task_exists('math homework')
+    assert not oauth_ticktick.task_exists('Math homework', project_id='p2')
+
+    assert oauth_ticktick.api.count('/project/') == 2
+    assert oauth_ticktick.api.count('/project') == 3
+
+
+def test_oauth_refetches_tasks_after_ttl(oauth_ticktick, monkeypatch):
+    oauth_ticktick.get_all_tasks()
+    monkeypatch.setattr(ticktick_oauth, '_CACHE_TTL', 0)
+    oauth_ticktick.get_all_tasks()
+
+    assert oauth_ticktick.api.count('/project/') == 4
+
+
+def test_oauth_sees_created_task(oauth_ticktick):
+    assert not oauth_ticktick.task_exists('Read chapter 3')
+    oauth_ticktick.create_task('Read chapter 3', project_id='p1')
+
+    assert oauth_ticktick.task_exists('Read chapter 3', project_id='p1')
+
+
+def test_oauth_cold_start_reuses_persisted_projects(oauth_ticktick):
+    oauth_ticktick.get_all_projects()
+    oauth_ticktick.invalidate_cache()
+    oauth_ticktick.get_all_projects()
+
+    assert oauth_ticktick.api.count('/project') == 1
+
+
+def test_oauth_persisted_projects_expire(oauth_ticktick):
+    oauth_ticktick.get_all_projects()
+    oauth_ticktick.invalidate_cache()
+    oauth_ticktick.projects_cache_ttl = 0
+    oauth_ticktick.get_all_projects()
+
+    assert oauth_ticktick.api.count('/project') == 2
+
+
+def test_oauth_task_in_unknown_project_drops_persisted_projects(oauth_ticktick):
+    oauth_ticktick.get_all_tasks()
+    oauth_ticktick.create_task('Pack bag', project_id='p3')
+
+    assert oauth_ticktick.cache.get('ticktick', 'projects') is None
+    assert oauth_ticktick.task_exists('Pack bag', project_id='p3')
+
+
+def test_oauth_fetch_from_running_event_loop_uses_thread_pool(oauth_ticktick, monkeypatch):
+    # The HTTP/2 path would call asyncio.run(), which fails inside a loop
+    monkeypatch.setattr(ticktick_oauth, 'HTTP2_AVAILABLE', True)
+
+    async def fetch():
+        return oauth_ticktick.get_all_tasks()
+
+    tasks = asyncio.run(fetch())
+
+    assert {task['id'] for task in tasks} == {'t1', 't2'}